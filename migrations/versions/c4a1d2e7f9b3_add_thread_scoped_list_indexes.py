@@ -0,0 +1,33 @@
+"""Add thread-scoped list indexes to messages, runs and actions
+
+Revision ID: c4a1d2e7f9b3
+Revises: ba35b4620058
+Create Date: 2026-10-18 10:12:44.318205
+
+"""
+
+from typing import Sequence, Union
+
+from migrations.utils.safe_ddl import (create_index_if_missing,
+                                       drop_index_if_exists)
+
+# revision identifiers, used by Alembic.
+revision: str = "c4a1d2e7f9b3"
+down_revision: Union[str, None] = "ba35b4620058"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Thread history, list endpoints (keyset cursors) and purge daemons
+    create_index_if_missing("idx_messages_thread_created", "messages", ["thread_id", "created_at"])
+    create_index_if_missing("idx_runs_thread_created", "runs", ["thread_id", "created_at"])
+
+    # Pending-action lookups filter by run and status together
+    create_index_if_missing("idx_actions_run_status", "actions", ["run_id", "status"])
+
+
+def downgrade() -> None:
+    drop_index_if_exists("idx_actions_run_status", "actions")
+    drop_index_if_exists("idx_runs_thread_created", "runs")
+    drop_index_if_exists("idx_messages_thread_created", "messages")
@@ -0,0 +1,36 @@
+"""Add blob_refs to messages for offloaded content
+
+Revision ID: d7e3f5a9b1c2
+Revises: c4a1d2e7f9b3
+Create Date: 2026-10-18 11:02:17.604391
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from migrations.utils.safe_ddl import (add_column_if_missing,
+                                       drop_column_if_exists)
+
+# revision identifiers, used by Alembic.
+revision: str = "d7e3f5a9b1c2"
+down_revision: Union[str, None] = "c4a1d2e7f9b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    add_column_if_missing(
+        "messages",
+        sa.Column(
+            "blob_refs",
+            sa.JSON(),
+            nullable=True,
+            comment="Per-field refs (path, sha256, size) for content offloaded to file storage.",
+        ),
+    )
+
+
+def downgrade() -> None:
+    drop_column_if_exists("messages", "blob_refs")
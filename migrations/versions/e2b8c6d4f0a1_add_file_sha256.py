@@ -0,0 +1,36 @@
+"""Add sha256 to files
+
+Revision ID: e2b8c6d4f0a1
+Revises: d7e3f5a9b1c2
+Create Date: 2026-10-18 14:37:52.118204
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from migrations.utils.safe_ddl import (add_column_if_missing,
+                                       drop_column_if_exists)
+
+# revision identifiers, used by Alembic.
+revision: str = "e2b8c6d4f0a1"
+down_revision: Union[str, None] = "d7e3f5a9b1c2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    add_column_if_missing(
+        "files",
+        sa.Column(
+            "sha256",
+            sa.String(64),
+            nullable=True,
+            comment="Hex SHA-256 of the content, computed while streaming the upload",
+        ),
+    )
+
+
+def downgrade() -> None:
+    drop_column_if_exists("files", "sha256")
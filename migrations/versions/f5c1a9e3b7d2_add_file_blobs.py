@@ -0,0 +1,52 @@
+"""Add file_blobs for content-addressed file storage
+
+Revision ID: f5c1a9e3b7d2
+Revises: e2b8c6d4f0a1
+Create Date: 2026-10-18 16:05:41.930177
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from migrations.utils.safe_ddl import has_table
+
+# revision identifiers, used by Alembic.
+revision: str = "f5c1a9e3b7d2"
+down_revision: Union[str, None] = "e2b8c6d4f0a1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if not has_table("file_blobs"):
+        op.create_table(
+            "file_blobs",
+            sa.Column(
+                "sha256", sa.String(64), nullable=False, comment="Hex SHA-256 of the content"
+            ),
+            sa.Column("storage_system", sa.String(64), nullable=False),
+            sa.Column(
+                "storage_path",
+                sa.String(512),
+                nullable=False,
+                comment="Content-addressed path (relative to share root)",
+            ),
+            sa.Column("bytes", sa.BigInteger(), nullable=False),
+            sa.Column(
+                "ref_count",
+                sa.Integer(),
+                nullable=False,
+                comment="FileStorage rows referencing this object; 0 = awaiting physical delete",
+            ),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint("sha256"),
+            sa.UniqueConstraint("storage_path"),
+        )
+
+
+def downgrade() -> None:
+    if has_table("file_blobs"):
+        op.drop_table("file_blobs")
@@ -1,9 +1,14 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from projectdavid_common import UtilsInterface
 from sqlalchemy import text
 
-from src.api.entities_api.db.database import engine, wait_for_databases
+from src.api.entities_api.db.database import (engine, start_async_engine,
+                                              stop_async_engine,
+                                              wait_for_databases)
+from src.api.entities_api.middleware import RequestScopeMiddleware
 from src.api.entities_api.models.models import Base
 from src.api.entities_api.observability.tracing import setup_tracing
 from src.api.entities_api.routers import api_router
@@ -13,6 +18,16 @@ logging_utility = UtilsInterface.LoggingUtility()
 wait_for_databases()
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The async DB engine lives on the server's loop for the process lifetime.
+    await start_async_engine()
+    try:
+        yield
+    finally:
+        await stop_async_engine()
+
+
 def create_app(init_db: bool = True) -> FastAPI:
     logging_utility.info("Creating FastAPI app")
 
@@ -23,6 +38,7 @@ def create_app(init_db: bool = True) -> FastAPI:
         docs_url="/mydocs",
         redoc_url="/altredoc",
         openapi_url="/openapi.json",
+        lifespan=lifespan,
     )
 
     # 🧠 OTel MUST be initialised before router binding
@@ -37,6 +53,9 @@ def create_app(init_db: bool = True) -> FastAPI:
         allow_headers=["*"],
     )
 
+    # SQL query accounting and X-Read-Consistency, in one ASGI layer.
+    app.add_middleware(RequestScopeMiddleware)
+
     app.include_router(api_router, prefix="/v1")
 
     @app.get("/")
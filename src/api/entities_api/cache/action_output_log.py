@@ -0,0 +1,155 @@
+# src/api/entities_api/cache/action_output_log.py
+import os
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from projectdavid_common.utilities.logging_service import LoggingUtility
+
+from src.api.entities_api.cache.stream_shunt import StreamShuntWriter
+
+LOG = LoggingUtility()
+
+# Live output is only needed while the action runs; compaction deletes it.
+ACTION_OUTPUT_TTL = int(os.getenv("ACTION_OUTPUT_TTL_SECONDS", "86400"))
+# Oldest chunks are trimmed beyond this; the compacted result is unaffected
+# when the caller passes the full output to compaction.
+ACTION_OUTPUT_MAXLEN = int(os.getenv("ACTION_OUTPUT_MAXLEN", "50000"))
+_PAGE = 1000
+
+
+class ActionOutputLog:
+    """
+    Append-only output log for streaming tool actions (code interpreter,
+    shell).
+
+        action_output:{action_id}        → STREAM of {"c": text}
+        action_output:{action_id}:state  → HASH   stream progress (buffer, lines, ts)
+
+    Each chunk is one XADD — nothing is read back or rewritten while the
+    tool runs. When the action finishes, ActionService compacts the log
+    into Action.result in a single write and deletes the stream.
+
+    Async methods require a redis.asyncio client; *_sync variants serve the
+    synchronous ActionService paths.
+    """
+
+    def __init__(self, redis):
+        self.redis = redis
+        self._sync_redis = None
+
+    @staticmethod
+    def key(action_id: str) -> str:
+        return f"action_output:{action_id}"
+
+    @classmethod
+    def state_key(cls, action_id: str) -> str:
+        return f"{cls.key(action_id)}:state"
+
+    # ------------------------------------------------------------------
+    # Async (orchestration)
+    # ------------------------------------------------------------------
+
+    def writer(self, action_id: str) -> StreamShuntWriter:
+        """Batched, pipelined appender. close() it before compacting."""
+        return StreamShuntWriter(
+            self.redis,
+            self.key(action_id),
+            maxlen=ACTION_OUTPUT_MAXLEN,
+            ttl_seconds=ACTION_OUTPUT_TTL,
+        )
+
+    async def assemble(self, action_id: str) -> Tuple[Optional[str], int]:
+        """Joined output and chunk count; (None, 0) when no log exists."""
+        chunks: List[str] = []
+        start = "-"
+        while True:
+            page = await self.redis.xrange(self.key(action_id), start, "+", count=_PAGE)
+            chunks.extend(fields.get("c", "") for _, fields in page)
+            if len(page) < _PAGE:
+                break
+            start = f"({page[-1][0]}"
+        return ("".join(chunks) if chunks else None), len(chunks)
+
+    async def length(self, action_id: str) -> int:
+        return await self.redis.xlen(self.key(action_id))
+
+    async def discard(self, action_id: str) -> None:
+        try:
+            await self.redis.delete(self.key(action_id), self.state_key(action_id))
+        except Exception as exc:
+            LOG.warning("[ActionOutputLog] Discard of %s failed: %s", action_id, exc)
+
+    # ------------------------------------------------------------------
+    # Sync (ActionService)
+    # ------------------------------------------------------------------
+
+    def append_sync(self, action_id: str, text: str) -> None:
+        client = self._sync_client()
+        with client.pipeline(transaction=False) as pipe:
+            pipe.xadd(
+                self.key(action_id),
+                {"c": text},
+                maxlen=ACTION_OUTPUT_MAXLEN,
+                approximate=True,
+            )
+            pipe.expire(self.key(action_id), ACTION_OUTPUT_TTL)
+            pipe.execute()
+
+    def set_state_sync(self, action_id: str, *, buffer: str, received_lines: int) -> None:
+        client = self._sync_client()
+        with client.pipeline(transaction=False) as pipe:
+            pipe.hset(
+                self.state_key(action_id),
+                mapping={
+                    "buffer": buffer,
+                    "received_lines": received_lines,
+                    "last_update": datetime.utcnow().isoformat(),
+                },
+            )
+            pipe.expire(self.state_key(action_id), ACTION_OUTPUT_TTL)
+            pipe.execute()
+
+    def assemble_sync(self, action_id: str) -> Tuple[Optional[str], int]:
+        client = self._sync_client()
+        chunks: List[str] = []
+        start = "-"
+        while True:
+            page = client.xrange(self.key(action_id), start, "+", count=_PAGE)
+            chunks.extend(fields.get("c", "") for _, fields in page)
+            if len(page) < _PAGE:
+                break
+            start = f"({page[-1][0]}"
+        return ("".join(chunks) if chunks else None), len(chunks)
+
+    def length_sync(self, action_id: str) -> int:
+        return self._sync_client().xlen(self.key(action_id))
+
+    def discard_sync(self, action_id: str) -> None:
+        try:
+            self._sync_client().delete(self.key(action_id), self.state_key(action_id))
+        except Exception as exc:
+            LOG.warning("[ActionOutputLog] Discard of %s failed: %s", action_id, exc)
+
+    def _sync_client(self):
+        if self._sync_redis is None:
+            from redis import Redis as SyncRedis
+
+            redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+            self._sync_redis = SyncRedis.from_url(redis_url, decode_responses=True)
+        return self._sync_redis
+
+
+# ------------------------------------------------------------------
+# Standalone factory
+# ------------------------------------------------------------------
+_log: Optional[ActionOutputLog] = None
+
+
+def get_action_output_log() -> ActionOutputLog:
+    """Process-wide log on the shared async Redis pool."""
+    global _log
+    if _log is None:
+        from src.api.entities_api.dependencies import get_redis_sync
+
+        _log = ActionOutputLog(redis=get_redis_sync())
+    return _log
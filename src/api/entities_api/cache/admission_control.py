@@ -0,0 +1,256 @@
+# src/api/entities_api/cache/admission_control.py
+import asyncio
+import os
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from projectdavid_common.utilities.logging_service import LoggingUtility
+
+LOG = LoggingUtility()
+
+# Opt-in: while off, admit() returns no ticket and nothing is limited.
+ADMISSION_CONTROL_ENABLED = os.getenv("ADMISSION_CONTROL_ENABLED", "false").lower() == "true"
+# Concurrent-run ceilings. 0 disables the scope.
+ADMISSION_USER_MAX_CONCURRENT = int(os.getenv("ADMISSION_USER_MAX_CONCURRENT", "8"))
+ADMISSION_ASSISTANT_MAX_CONCURRENT = int(os.getenv("ADMISSION_ASSISTANT_MAX_CONCURRENT", "16"))
+ADMISSION_PROVIDER_MAX_CONCURRENT = int(os.getenv("ADMISSION_PROVIDER_MAX_CONCURRENT", "64"))
+# Per-user token bucket: sustained runs per minute, plus burst capacity.
+ADMISSION_USER_RATE_PER_MINUTE = float(os.getenv("ADMISSION_USER_RATE_PER_MINUTE", "60"))
+ADMISSION_USER_BURST = int(os.getenv("ADMISSION_USER_BURST", "20"))
+# How long a request may wait for a slot before it is rejected with 429.
+ADMISSION_MAX_WAIT_SECONDS = float(os.getenv("ADMISSION_MAX_WAIT_SECONDS", "5"))
+# Slots of a crashed holder expire after this long. Runs are expected to
+# release explicitly long before then.
+ADMISSION_LEASE_SECONDS = int(os.getenv("ADMISSION_LEASE_SECONDS", "1800"))
+
+SCOPE_USER_RATE = "user_rate"
+SCOPE_USER = "user"
+SCOPE_ASSISTANT = "assistant"
+SCOPE_PROVIDER = "provider"
+
+# Atomic admission check. KEYS[1] is the token bucket, KEYS[2..] the
+# concurrency ZSETs (member = run id, score = lease expiry).
+# ARGV: now, rate_per_sec, burst, lease_expiry, member, limit_2, limit_3, ...
+# Returns {1, 0, 0} when admitted, or {0, retry_after_ms, failed_key_index}.
+_ADMIT_LUA = """
+local now = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local burst = tonumber(ARGV[3])
+local expiry = tonumber(ARGV[4])
+local member = ARGV[5]
+
+for i = 2, #KEYS do
+    local limit = tonumber(ARGV[i + 4])
+    redis.call('ZREMRANGEBYSCORE', KEYS[i], '-inf', now)
+    if redis.call('ZSCORE', KEYS[i], member) == false
+        and redis.call('ZCARD', KEYS[i]) >= limit then
+        local oldest = redis.call('ZRANGE', KEYS[i], 0, 0, 'WITHSCORES')
+        local wait_ms = 1000
+        if oldest[2] then
+            wait_ms = math.min(wait_ms, math.max(1, (tonumber(oldest[2]) - now) * 1000))
+        end
+        return {0, math.floor(wait_ms), i}
+    end
+end
+
+local tokens = burst
+if rate > 0 then
+    local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+    if state[1] then
+        tokens = math.min(burst, tonumber(state[1]) + (now - tonumber(state[2])) * rate)
+    end
+    if tokens < 1 then
+        return {0, math.ceil((1 - tokens) / rate * 1000), 1}
+    end
+    tokens = tokens - 1
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+    redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+end
+
+for i = 2, #KEYS do
+    redis.call('ZADD', KEYS[i], expiry, member)
+    redis.call('EXPIRE', KEYS[i], math.ceil(expiry - now) + 1)
+end
+return {1, 0, 0}
+"""
+
+
+class AdmissionRejected(Exception):
+    """Raised when a run cannot be admitted within the allowed wait."""
+
+    def __init__(self, scope: str, retry_after: float):
+        super().__init__(f"Too many runs ({scope}); retry after {retry_after:.1f}s")
+        self.scope = scope
+        self.retry_after = retry_after
+
+
+@dataclass
+class AdmissionTicket:
+    """The slots held by one admitted run; hand back to release()."""
+
+    run_id: str
+    slot_keys: List[str] = field(default_factory=list)
+
+
+def provider_of(model: str) -> str:
+    """Provider scope key for a model id, e.g. 'together-ai/...' → 'together-ai'."""
+    return (model or "").lower().strip().split("/", 1)[0] or "unknown"
+
+
+class AdmissionController:
+    """
+    Redis-backed admission control for /v1/completions.
+
+    Redis layout:
+
+        admission:rate:user:{user_id}          → HASH token bucket {tokens, ts}
+        admission:slots:user:{user_id}         → ZSET run_id scored by lease expiry
+        admission:slots:assistant:{asst_id}    → ZSET
+        admission:slots:provider:{provider}    → ZSET
+
+    admit() checks every concurrency scope and the user's token bucket in one
+    Lua call, so a rejected request never consumes a token or a slot. A
+    request that does not fit is retried until ADMISSION_MAX_WAIT_SECONDS
+    and then raises AdmissionRejected carrying a Retry-After hint.
+
+    Slots are leases: a process that dies without calling release() loses
+    its slots after ADMISSION_LEASE_SECONDS. Redis failures fail open — the
+    run is admitted and the failure is counted. Requires a redis.asyncio
+    client.
+    """
+
+    def __init__(self, redis):
+        self.redis = redis
+        self._script = None
+        self._lock = threading.Lock()
+        self._counters: Counter = Counter()
+        self._wait_seconds_total = 0.0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def ticket(
+        self, run_id: str, *, user_id: str, assistant_id: str, model: str
+    ) -> AdmissionTicket:
+        slots = [
+            (f"admission:slots:user:{user_id}", ADMISSION_USER_MAX_CONCURRENT),
+            (f"admission:slots:assistant:{assistant_id}", ADMISSION_ASSISTANT_MAX_CONCURRENT),
+            (f"admission:slots:provider:{provider_of(model)}", ADMISSION_PROVIDER_MAX_CONCURRENT),
+        ]
+        return AdmissionTicket(run_id=run_id, slot_keys=[k for k, limit in slots if limit > 0])
+
+    async def admit(
+        self,
+        run_id: str,
+        *,
+        user_id: str,
+        assistant_id: str,
+        model: str,
+        max_wait: float = ADMISSION_MAX_WAIT_SECONDS,
+    ) -> Optional[AdmissionTicket]:
+        """Reserve slots for a run, waiting up to `max_wait` seconds."""
+        if not ADMISSION_CONTROL_ENABLED:
+            return None
+
+        ticket = self.ticket(run_id, user_id=user_id, assistant_id=assistant_id, model=model)
+        limits = [self._limit_for(key) for key in ticket.slot_keys]
+        keys = [f"admission:rate:user:{user_id}", *ticket.slot_keys]
+        scopes = [SCOPE_USER_RATE, *[self._scope_of(key) for key in ticket.slot_keys]]
+
+        started = time.monotonic()
+        while True:
+            try:
+                admitted, retry_ms, failed = await self._eval(keys, run_id, limits)
+            except Exception as exc:
+                LOG.warning("[Admission] Redis unavailable, admitting %s: %s", run_id, exc)
+                self._count("fail_open")
+                return None
+
+            waited = time.monotonic() - started
+            if admitted:
+                self._count("admitted", waited=waited)
+                return ticket
+
+            retry_after = max(int(retry_ms), 1) / 1000.0
+            remaining = max_wait - waited
+            if remaining <= 0 or retry_after > remaining:
+                scope = scopes[int(failed) - 1]
+                self._count(f"rejected_{scope}", waited=waited)
+                LOG.info("[Admission] Rejected run %s on %s scope", run_id, scope)
+                raise AdmissionRejected(scope, retry_after)
+            await asyncio.sleep(retry_after)
+
+    async def release(self, ticket: Optional[AdmissionTicket]) -> None:
+        if ticket is None or not ticket.slot_keys:
+            return
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key in ticket.slot_keys:
+                    pipe.zrem(key, ticket.run_id)
+                await pipe.execute()
+        except Exception as exc:
+            LOG.warning(
+                "[Admission] Release of %s failed (lease will expire): %s", ticket.run_id, exc
+            )
+
+    def metrics(self) -> Dict[str, float]:
+        with self._lock:
+            data: Dict[str, float] = dict(self._counters)
+            data["wait_seconds_total"] = round(self._wait_seconds_total, 3)
+        return data
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    async def _eval(self, keys: List[str], run_id: str, limits: List[int]):
+        if self._script is None:
+            self._script = self.redis.register_script(_ADMIT_LUA)
+        now = time.time()
+        return await self._script(
+            keys=keys,
+            args=[
+                now,
+                ADMISSION_USER_RATE_PER_MINUTE / 60.0,
+                ADMISSION_USER_BURST,
+                now + ADMISSION_LEASE_SECONDS,
+                run_id,
+                *limits,
+            ],
+        )
+
+    @staticmethod
+    def _scope_of(key: str) -> str:
+        return key.split(":", 3)[2]
+
+    def _limit_for(self, key: str) -> int:
+        return {
+            SCOPE_USER: ADMISSION_USER_MAX_CONCURRENT,
+            SCOPE_ASSISTANT: ADMISSION_ASSISTANT_MAX_CONCURRENT,
+            SCOPE_PROVIDER: ADMISSION_PROVIDER_MAX_CONCURRENT,
+        }[self._scope_of(key)]
+
+    def _count(self, name: str, waited: float = 0.0) -> None:
+        with self._lock:
+            self._counters[name] += 1
+            self._wait_seconds_total += waited
+
+
+# ------------------------------------------------------------------
+# Standalone factory
+# ------------------------------------------------------------------
+_controller: Optional[AdmissionController] = None
+
+
+def get_admission_controller() -> AdmissionController:
+    """Process-wide controller on the shared async Redis pool."""
+    global _controller
+    if _controller is None:
+        from src.api.entities_api.dependencies import get_redis_sync
+
+        _controller = AdmissionController(redis=get_redis_sync())
+    return _controller
@@ -0,0 +1,135 @@
+# src/api/entities_api/cache/api_key_cache.py
+import hashlib
+import hmac
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from projectdavid_common.utilities.logging_service import LoggingUtility
+
+LOG = LoggingUtility()
+
+API_KEY_CACHE_TTL = int(os.getenv("API_KEY_CACHE_TTL_SECONDS", "60"))
+API_KEY_CACHE_MAX_ENTRIES = int(os.getenv("API_KEY_CACHE_MAX_ENTRIES", "10000"))
+
+
+def _cache_secret() -> bytes:
+    secret = os.getenv("API_KEY_CACHE_SECRET") or os.getenv("DEFAULT_SECRET_KEY")
+    if secret:
+        return secret.encode("utf-8")
+    # Without a shared secret, digests differ between processes and the
+    # Redis tier only ever serves the process that wrote the entry.
+    LOG.warning("[ApiKeyCache] No API_KEY_CACHE_SECRET set; using a per-process secret.")
+    return os.urandom(32)
+
+
+class ApiKeyCache:
+    """
+    Short-lived record of API keys that recently passed bcrypt verification.
+
+        api_key_verified:{prefix} → HMAC-SHA256(secret, presented_key + hashed_key)
+
+    Prefixes are unique, so one entry per key. The digest binds the plain key
+    to the stored bcrypt hash: a cache hit means "this exact key verified
+    against this exact hash less than API_KEY_CACHE_TTL seconds ago", and a
+    rotated hash can never match an old entry. The plain key is never stored.
+
+    Lookups go in-process first, then Redis. The caller still loads the
+    ApiKey row (is_active / expires_at are always read fresh), so a cache
+    hit only replaces the bcrypt check. ApiKeyService.revoke_key() invalidates
+    explicitly.
+    """
+
+    def __init__(self, redis, secret: Optional[bytes] = None):
+        self.redis = redis
+        self._secret = secret or _cache_secret()
+        self._lock = threading.Lock()
+        self._local: Dict[str, Tuple[str, float]] = {}
+        self._sync_redis = None
+
+    @staticmethod
+    def _key(prefix: str) -> str:
+        return f"api_key_verified:{prefix}"
+
+    def digest(self, plain_key: str, hashed_key: str) -> str:
+        message = f"{plain_key}\x00{hashed_key}".encode("utf-8")
+        return hmac.new(self._secret, message, hashlib.sha256).hexdigest()
+
+    async def is_verified(self, prefix: str, plain_key: str, hashed_key: str) -> bool:
+        expected = self.digest(plain_key, hashed_key)
+
+        with self._lock:
+            entry = self._local.get(prefix)
+        if entry and entry[1] > time.monotonic():
+            return hmac.compare_digest(entry[0], expected)
+
+        try:
+            stored = await self.redis.get(self._key(prefix))
+        except Exception as exc:
+            LOG.warning("[ApiKeyCache] Redis read failed: %s", exc)
+            return False
+        if stored and hmac.compare_digest(stored, expected):
+            self._remember(prefix, expected)
+            return True
+        return False
+
+    async def mark_verified(self, prefix: str, plain_key: str, hashed_key: str) -> None:
+        digest = self.digest(plain_key, hashed_key)
+        self._remember(prefix, digest)
+        try:
+            await self.redis.set(self._key(prefix), digest, ex=API_KEY_CACHE_TTL)
+        except Exception as exc:
+            LOG.warning("[ApiKeyCache] Redis write failed: %s", exc)
+
+    async def invalidate(self, prefix: str) -> None:
+        self.invalidate_local(prefix)
+        try:
+            await self.redis.delete(self._key(prefix))
+        except Exception as exc:
+            LOG.warning("[ApiKeyCache] Redis invalidate of %s failed: %s", prefix, exc)
+
+    def invalidate_sync(self, prefix: str) -> None:
+        """Invalidate from synchronous service code (ApiKeyService). Never raises."""
+        self.invalidate_local(prefix)
+        try:
+            self._sync_client().delete(self._key(prefix))
+        except Exception as exc:
+            LOG.warning("[ApiKeyCache] Redis invalidate of %s failed: %s", prefix, exc)
+
+    def invalidate_local(self, prefix: str) -> None:
+        with self._lock:
+            self._local.pop(prefix, None)
+
+    def _sync_client(self):
+        if self._sync_redis is None:
+            from redis import Redis as SyncRedis
+
+            redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+            self._sync_redis = SyncRedis.from_url(redis_url, decode_responses=True)
+        return self._sync_redis
+
+    def _remember(self, prefix: str, digest: str) -> None:
+        with self._lock:
+            if len(self._local) >= API_KEY_CACHE_MAX_ENTRIES:
+                now = time.monotonic()
+                self._local = {p: e for p, e in self._local.items() if e[1] > now}
+                if len(self._local) >= API_KEY_CACHE_MAX_ENTRIES:
+                    self._local.clear()
+            self._local[prefix] = (digest, time.monotonic() + API_KEY_CACHE_TTL)
+
+
+# ------------------------------------------------------------------
+# Standalone factory
+# ------------------------------------------------------------------
+_cache: Optional[ApiKeyCache] = None
+
+
+def get_api_key_cache() -> ApiKeyCache:
+    """Process-wide cache on the shared async Redis pool."""
+    global _cache
+    if _cache is None:
+        from src.api.entities_api.dependencies import get_redis_sync
+
+        _cache = ApiKeyCache(redis=get_redis_sync())
+    return _cache
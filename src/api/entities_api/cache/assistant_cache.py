@@ -38,9 +38,9 @@ class AssistantCache:
         # and the deferred import keeps circular dependencies at bay.
         if self._native_exec_svc is None:
             from src.api.entities_api.services.native_execution_service import \
-                NativeExecutionService
+                get_native_execution_service
 
-            self._native_exec_svc = NativeExecutionService()
+            self._native_exec_svc = get_native_execution_service()
         return self._native_exec_svc
 
     def _cache_key(self, assistant_id: str) -> str:
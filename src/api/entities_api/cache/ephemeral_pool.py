@@ -0,0 +1,261 @@
+# src/api/entities_api/cache/ephemeral_pool.py
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Set
+
+from projectdavid_common.utilities.logging_service import LoggingUtility
+
+LOG = LoggingUtility()
+
+# Target number of idle, pre-created rows per (role, owner). 0 disables pooling:
+# lease() then creates on demand and release() deletes, exactly as before.
+EPHEMERAL_POOL_SIZE = int(os.getenv("EPHEMERAL_POOL_SIZE", "2"))
+# Idle rows older than this are reaped — also bounds how long a pooled
+# assistant can lag behind a tool-registry change after a deploy.
+EPHEMERAL_POOL_MAX_IDLE = int(os.getenv("EPHEMERAL_POOL_MAX_IDLE_SECONDS", "1800"))
+# Minimum gap between opportunistic reap passes in one process.
+EPHEMERAL_POOL_REAP_INTERVAL = int(os.getenv("EPHEMERAL_POOL_REAP_INTERVAL_SECONDS", "300"))
+
+ROLE_RESEARCH_SUPERVISOR = "research_supervisor"
+ROLE_SENIOR_ENGINEER = "senior_engineer"
+ROLE_RESEARCH_WORKER = "research_worker"
+ROLE_JUNIOR_ENGINEER = "junior_engineer"
+ROLE_THREAD = "thread"
+
+# Role → AssistantManager factory method (all take user_id=...).
+_ROLE_FACTORIES: Dict[str, str] = {
+    ROLE_RESEARCH_SUPERVISOR: "create_ephemeral_research_supervisor",
+    ROLE_SENIOR_ENGINEER: "create_ephemeral_senior_engineer",
+    ROLE_RESEARCH_WORKER: "create_ephemeral_worker_assistant",
+    ROLE_JUNIOR_ENGINEER: "create_ephemeral_junior_engineer",
+    ROLE_THREAD: "create_ephemeral_thread",
+}
+
+# Threads collect the run's messages and can never be handed to another run.
+_RECYCLABLE_ROLES = {
+    ROLE_RESEARCH_SUPERVISOR,
+    ROLE_SENIOR_ENGINEER,
+    ROLE_RESEARCH_WORKER,
+    ROLE_JUNIOR_ENGINEER,
+}
+
+_INDEX_KEY = "ephemeral_pool:index"
+
+# Bounded, atomic return to a pool. KEYS[1] is the pool list, KEYS[2] the
+# index. ARGV: pool size, row id, idle-since, index member.
+# Returns 1 when the row was pooled, 0 when the pool was already full.
+_PUSH_LUA = """
+if redis.call('LLEN', KEYS[1]) >= tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('RPUSH', KEYS[1], ARGV[2])
+redis.call('ZADD', KEYS[2], ARGV[3], ARGV[4])
+return 1
+"""
+
+
+@dataclass
+class PooledResource:
+    """A leased assistant or thread. Only the id is known without a DB read."""
+
+    id: str
+    role: str
+
+
+class EphemeralPool:
+    """
+    Pre-created ephemeral assistants and threads, leased to role-swapped runs.
+
+    Redis layout:
+
+        ephemeral_pool:{role}:{user_id}   → LIST of idle row ids
+        ephemeral_pool:index              → ZSET "role|user_id|id" scored by idle-since
+
+    lease() is a single LPOP on the hot path; the pool is topped back up to
+    EPHEMERAL_POOL_SIZE by a background task. Pools are per owner because
+    AssistantService enforces ownership on every row.
+
+    release() returns a recyclable assistant to its pool (or deletes it when
+    the pool is full); threads are always deleted by their callers' existing
+    clean-up rules and never come back. Rows idle for longer than
+    EPHEMERAL_POOL_MAX_IDLE are reaped. Requires a redis.asyncio client.
+    """
+
+    def __init__(self, redis):
+        self.redis = redis
+        self._refilling: Set[str] = set()
+        # Strong references to running refills: the loop only keeps weak ones.
+        self._tasks: Set[asyncio.Task] = set()
+        self._push_script = None
+        self._last_reap = 0.0
+        self._manager = None
+        self._assistant_cache = None
+
+    @property
+    def manager(self):
+        if self._manager is None:
+            from src.api.entities_api.utils.assistant_manager import AssistantManager
+
+            self._manager = AssistantManager()
+        return self._manager
+
+    @property
+    def assistant_cache(self):
+        if self._assistant_cache is None:
+            from src.api.entities_api.cache.assistant_cache import AssistantCache
+
+            self._assistant_cache = AssistantCache(redis=self.redis)
+        return self._assistant_cache
+
+    @staticmethod
+    def _pool_key(role: str, user_id: str) -> str:
+        return f"ephemeral_pool:{role}:{user_id}"
+
+    @staticmethod
+    def _member(role: str, user_id: str, resource_id: str) -> str:
+        return f"{role}|{user_id}|{resource_id}"
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def lease(self, role: str, user_id: str):
+        """
+        Hand out an idle row for (role, user_id), creating one inline on a
+        pool miss. Always schedules a background refill.
+        """
+        if role not in _ROLE_FACTORIES:
+            raise ValueError(f"Unknown ephemeral role: {role}")
+
+        if EPHEMERAL_POOL_SIZE > 0:
+            try:
+                resource_id = await self.redis.lpop(self._pool_key(role, user_id))
+                if resource_id:
+                    resource_id = self._decode(resource_id)
+                    await self.redis.zrem(_INDEX_KEY, self._member(role, user_id, resource_id))
+                    LOG.info("[EphemeralPool] Leased pooled %s %s", role, resource_id)
+                    self._schedule_refill(role, user_id)
+                    return PooledResource(id=resource_id, role=role)
+            except Exception as exc:
+                LOG.warning("[EphemeralPool] Lease for %s failed, creating inline: %s", role, exc)
+
+            self._schedule_refill(role, user_id)
+
+        return await self._create(role, user_id)
+
+    async def release(self, role: str, user_id: str, resource_id: str) -> None:
+        """Return a recyclable assistant to its pool, or delete it."""
+        if EPHEMERAL_POOL_SIZE > 0 and role in _RECYCLABLE_ROLES:
+            try:
+                if await self._push(role, user_id, resource_id):
+                    LOG.info("[EphemeralPool] Recycled %s %s", role, resource_id)
+                    return
+            except Exception as exc:
+                LOG.warning("[EphemeralPool] Recycle of %s failed, deleting: %s", resource_id, exc)
+
+        await self._destroy(role, user_id, resource_id)
+
+    async def reap_idle(self, max_idle: int = EPHEMERAL_POOL_MAX_IDLE) -> int:
+        """Delete pooled rows idle for longer than `max_idle` seconds."""
+        cutoff = time.time() - max_idle
+        members = await self.redis.zrangebyscore(_INDEX_KEY, "-inf", cutoff)
+        reaped = 0
+        for member in members:
+            member = self._decode(member)
+            role, user_id, resource_id = member.split("|", 2)
+            # LREM decides ownership: if it removed nothing, a lease won the race.
+            removed = await self.redis.lrem(self._pool_key(role, user_id), 1, resource_id)
+            await self.redis.zrem(_INDEX_KEY, member)
+            if removed:
+                await self._destroy(role, user_id, resource_id)
+                reaped += 1
+        if reaped:
+            LOG.info("[EphemeralPool] Reaped %d idle rows", reaped)
+        return reaped
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _decode(value) -> str:
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    async def _create(self, role: str, user_id: str):
+        factory = getattr(self.manager, _ROLE_FACTORIES[role])
+        return await factory(user_id=user_id)
+
+    async def _destroy(self, role: str, user_id: str, resource_id: str) -> None:
+        try:
+            if role == ROLE_THREAD:
+                await self.manager._native_exec.delete_thread(resource_id, user_id=user_id)
+            else:
+                await self.manager.delete_assistant(
+                    assistant_id=resource_id, user_id=user_id, permanent=True
+                )
+        except Exception as exc:
+            LOG.warning("[EphemeralPool] Delete of %s %s failed: %s", role, resource_id, exc)
+
+    async def _push(self, role: str, user_id: str, resource_id: str) -> bool:
+        """Pool a row unless the pool is full. False means the caller deletes it."""
+        if self._push_script is None:
+            self._push_script = self.redis.register_script(_PUSH_LUA)
+        pushed = await self._push_script(
+            keys=[self._pool_key(role, user_id), _INDEX_KEY],
+            args=[
+                EPHEMERAL_POOL_SIZE,
+                resource_id,
+                time.time(),
+                self._member(role, user_id, resource_id),
+            ],
+        )
+        return bool(pushed)
+
+    def _schedule_refill(self, role: str, user_id: str) -> None:
+        slot = self._pool_key(role, user_id)
+        if slot in self._refilling:
+            return
+        self._refilling.add(slot)
+        task = asyncio.get_running_loop().create_task(self._refill(role, user_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refill(self, role: str, user_id: str) -> None:
+        slot = self._pool_key(role, user_id)
+        try:
+            while await self.redis.llen(slot) < EPHEMERAL_POOL_SIZE:
+                resource = await self._create(role, user_id)
+                if role != ROLE_THREAD:
+                    # Warm the config cache too, so the lessee's first
+                    # _ensure_config_loaded is a Redis hit.
+                    await self.assistant_cache.retrieve(resource.id)
+                if not await self._push(role, user_id, resource.id):
+                    # A release filled the pool while this row was created.
+                    await self._destroy(role, user_id, resource.id)
+                    break
+
+            if time.time() - self._last_reap > EPHEMERAL_POOL_REAP_INTERVAL:
+                self._last_reap = time.time()
+                await self.reap_idle()
+        except Exception as exc:
+            LOG.warning("[EphemeralPool] Refill of %s failed: %s", slot, exc)
+        finally:
+            self._refilling.discard(slot)
+
+
+# ------------------------------------------------------------------
+# Standalone factory
+# ------------------------------------------------------------------
+_pool: Optional[EphemeralPool] = None
+
+
+def get_ephemeral_pool() -> EphemeralPool:
+    """Process-wide pool on the shared async Redis pool."""
+    global _pool
+    if _pool is None:
+        from src.api.entities_api.dependencies import get_redis_sync
+
+        _pool = EphemeralPool(redis=get_redis_sync())
+    return _pool
@@ -0,0 +1,309 @@
+# src/api/entities_api/cache/file_cache.py
+"""
+Size-capped on-disk LRU of stored file content on the API host.
+
+Image attachments are hydrated from Samba on every turn and popular files
+are downloaded again on every request; this cache keeps recently used
+content on local disk so repeat reads skip SMB.
+
+  * Entries are keyed by content SHA-256 (the file id for files stored
+    before hashing). Both name immutable content, so an entry can never be
+    stale — deletes discard entries only to drop the bytes promptly.
+  * Writes go to a temp file beside the entry and are renamed into place,
+    so a reader never sees a partial entry.
+  * Reads mmap the entry. Eviction only unlinks, and a mapping stays valid
+    after unlink, so a reader racing eviction still gets complete content.
+  * Recency is the entry's mtime (touched on every hit), so the worker
+    processes sharing the directory share one LRU order. When this
+    process's running total passes FILE_CACHE_MAX_BYTES the directory is
+    rescanned under an exclusive flock and trimmed, oldest first, to
+    FILE_CACHE_LOW_WATER of the cap.
+"""
+
+import fcntl
+import hashlib
+import mmap
+import os
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
+
+from projectdavid_common.utilities.logging_service import LoggingUtility
+
+LOG = LoggingUtility()
+
+FILE_CACHE_DIR = os.getenv(
+    "FILE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "entities_file_cache")
+)
+# 0 disables the cache.
+FILE_CACHE_MAX_BYTES = int(os.getenv("FILE_CACHE_MAX_BYTES", str(2 * 1024**3)))
+FILE_CACHE_MAX_ENTRY_BYTES = int(os.getenv("FILE_CACHE_MAX_ENTRY_BYTES", str(64 * 1024**2)))
+FILE_CACHE_LOW_WATER = float(os.getenv("FILE_CACHE_LOW_WATER", "0.8"))
+
+_PART_SUFFIX = ".part"
+# Temp files older than this were left by a crashed writer.
+_STALE_PART_SECONDS = 3600
+_EVICT_LOCK = ".evict.lock"
+
+
+class _PendingEntry:
+    """Temp file for one entry. Write errors (e.g. disk full) are swallowed
+    so that filling the cache never breaks the read it rides on."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.tmp_path = f"{path}.{os.getpid()}.{uuid.uuid4().hex}{_PART_SUFFIX}"
+        self.written = 0
+        self.failed = False
+        self._fh = open(self.tmp_path, "wb")
+
+    def write(self, data) -> None:
+        if self.failed:
+            return
+        try:
+            self._fh.write(data)
+            self.written += len(data)
+        except OSError as exc:
+            LOG.warning("[FileCache] Write to %s failed: %s", self.tmp_path, exc)
+            self.failed = True
+
+    def close(self) -> None:
+        try:
+            self._fh.close()
+        except OSError:
+            self.failed = True
+
+    def remove(self) -> None:
+        try:
+            os.unlink(self.tmp_path)
+        except OSError:
+            pass
+
+
+class LocalFileCache:
+
+    def __init__(
+        self,
+        root: str = FILE_CACHE_DIR,
+        max_bytes: int = FILE_CACHE_MAX_BYTES,
+        max_entry_bytes: int = FILE_CACHE_MAX_ENTRY_BYTES,
+    ):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = min(max_entry_bytes, max_bytes)
+        self.enabled = max_bytes > 0
+        self._lock = threading.Lock()
+        # Bytes cached, as last measured plus this process's writes since.
+        # None until the first scan.
+        self._bytes: Optional[int] = None
+
+        if self.enabled:
+            try:
+                os.makedirs(root, exist_ok=True)
+            except OSError as exc:
+                LOG.warning("[FileCache] Disabled — cannot create %s: %s", root, exc)
+                self.enabled = False
+
+    @staticmethod
+    def key_for(file_id: str, sha256: Optional[str]) -> str:
+        """Cache key for a stored file: its content hash when known."""
+        return sha256 or file_id
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[bytes]:
+        """The cached content, or None on a miss."""
+        mm = self._map(key)
+        if mm is None:
+            return None
+        with mm:
+            return mm[:]
+
+    def iter_range(
+        self, key: str, start: int, end: int, chunk_size: int
+    ) -> Optional[Iterator[bytes]]:
+        """
+        Bytes start..end (inclusive) in chunks, or None on a miss. The entry
+        is mapped before returning, so a later eviction cannot cut the
+        stream short.
+        """
+        mm = self._map(key)
+        if mm is None:
+            return None
+        if end >= len(mm):
+            mm.close()
+            return None
+        return self._iter_map(mm, start, end, chunk_size)
+
+    @staticmethod
+    def _iter_map(mm: mmap.mmap, start: int, end: int, chunk_size: int) -> Iterator[bytes]:
+        try:
+            offset = start
+            while offset <= end:
+                stop = min(offset + chunk_size, end + 1)
+                yield mm[offset:stop]
+                offset = stop
+        finally:
+            mm.close()
+
+    def _map(self, key: str) -> Optional[mmap.mmap]:
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as fh:
+                mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Missing, just evicted, or empty (empty files are never cached).
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return mm
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def writer(self, key: str, size: int) -> Iterator[Optional[_PendingEntry]]:
+        """
+        Yield an entry to write exactly `size` bytes into, or None when the
+        content should not be cached. The entry is published only if the
+        block exits cleanly with every byte written.
+        """
+        if not self.enabled or not 0 < size <= self.max_entry_bytes:
+            yield None
+            return
+
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            entry = _PendingEntry(path)
+        except OSError as exc:
+            LOG.warning("[FileCache] Cannot cache %s: %s", key, exc)
+            yield None
+            return
+
+        try:
+            yield entry
+        except BaseException:
+            entry.close()
+            entry.remove()
+            raise
+
+        entry.close()
+        if entry.failed or entry.written != size:
+            entry.remove()
+            return
+        try:
+            os.replace(entry.tmp_path, path)
+        except OSError as exc:
+            LOG.warning("[FileCache] Cannot publish %s: %s", key, exc)
+            entry.remove()
+            return
+        self._account(size)
+
+    def put(self, key: str, data: bytes) -> None:
+        with self.writer(key, len(data)) as entry:
+            if entry is not None:
+                entry.write(data)
+
+    def discard(self, key: str) -> None:
+        if not self.enabled:
+            return
+        path = self._path(key)
+        try:
+            size = os.path.getsize(path)
+            os.unlink(path)
+        except OSError:
+            return
+        with self._lock:
+            if self._bytes is not None:
+                self._bytes -= size
+
+    # ------------------------------------------------------------------
+    # Size accounting / eviction
+    # ------------------------------------------------------------------
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.root, digest[:2], digest)
+
+    def _account(self, size: int) -> None:
+        with self._lock:
+            if self._bytes is not None:
+                self._bytes += size
+                if self._bytes <= self.max_bytes:
+                    return
+        self._evict()
+
+    def _evict(self) -> None:
+        with open(os.path.join(self.root, _EVICT_LOCK), "a") as lock_fh:
+            try:
+                fcntl.flock(lock_fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return  # another worker is already trimming
+
+            entries, total = self._scan()
+            if total > self.max_bytes:
+                target = self.max_bytes * FILE_CACHE_LOW_WATER
+                removed = 0
+                for _, size, path in sorted(entries):
+                    if total <= target:
+                        break
+                    try:
+                        os.unlink(path)
+                    except FileNotFoundError:
+                        pass
+                    except OSError:
+                        continue
+                    total -= size
+                    removed += 1
+                LOG.info("[FileCache] Evicted %d entries; %d bytes cached", removed, total)
+
+            with self._lock:
+                self._bytes = total
+
+    def _scan(self) -> Tuple[List[Tuple[float, int, str]], int]:
+        """(mtime, size, path) of every entry, and their total size."""
+        entries: List[Tuple[float, int, str]] = []
+        total = 0
+        stale_before = time.time() - _STALE_PART_SECONDS
+        for shard in os.scandir(self.root):
+            if not shard.is_dir():
+                continue
+            for item in os.scandir(shard.path):
+                try:
+                    st = item.stat()
+                except OSError:
+                    continue
+                if item.name.endswith(_PART_SUFFIX):
+                    if st.st_mtime < stale_before:
+                        try:
+                            os.unlink(item.path)
+                        except OSError:
+                            pass
+                    continue
+                entries.append((st.st_mtime, st.st_size, item.path))
+                total += st.st_size
+        return entries, total
+
+
+# ------------------------------------------------------------------
+# Standalone factory
+# ------------------------------------------------------------------
+_cache: Optional[LocalFileCache] = None
+
+
+def get_local_file_cache() -> LocalFileCache:
+    global _cache
+    if _cache is None:
+        _cache = LocalFileCache()
+    return _cache
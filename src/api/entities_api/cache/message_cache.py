@@ -58,9 +58,9 @@ class MessageCache:
     def _native_exec(self):
         if not hasattr(self, "_native_exec_instance") or self._native_exec_instance is None:
             from src.api.entities_api.services.native_execution_service import \
-                NativeExecutionService
+                get_native_execution_service
 
-            self._native_exec_instance = NativeExecutionService()
+            self._native_exec_instance = get_native_execution_service()
         return self._native_exec_instance
 
     # ------------------------------------------------------------------
@@ -158,6 +158,9 @@ class MessageCache:
 
         Returns lean dicts — attachment file_ids preserved, no base64.
         Callers must hydrate images before LLM dispatch.
+
+        The cold load reads offloaded message blobs from storage inline, so
+        this must not be called on the event loop — use get_history().
         """
         if not isinstance(self.redis, SyncRedis):
             return []
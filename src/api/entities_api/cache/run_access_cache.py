@@ -0,0 +1,69 @@
+# src/api/entities_api/cache/run_access_cache.py
+import json
+import os
+import time
+from typing import Any, Dict, Optional
+
+from projectdavid_common.utilities.logging_service import LoggingUtility
+
+LOG = LoggingUtility()
+
+# Used when a run has no expires_at; also the upper bound on any entry.
+RUN_ACCESS_CACHE_TTL = int(os.getenv("RUN_ACCESS_CACHE_TTL_SECONDS", "3600"))
+
+
+class RunAccessCache:
+    """
+    Positive results of the /v1/completions ownership guard, per run.
+
+        run_access:{run_id} → JSON {"user_id", "thread_id", "assistant_id"}
+
+    An entry records that the run's owner had access to the run's assistant
+    when the guard last ran. It lives until the run expires (capped at
+    RUN_ACCESS_CACHE_TTL), so follow-up completions on the same run — e.g.
+    after a tool output is submitted — skip the database entirely. Denials
+    are never cached.
+
+    Entries are not invalidated: access is fixed for the entry's TTL. A run
+    whose assistant is deleted or unshared, or which is itself deleted or
+    cancelled, keeps passing the guard until then — lower
+    RUN_ACCESS_CACHE_TTL_SECONDS to shorten that window. Requires a
+    redis.asyncio client.
+    """
+
+    def __init__(self, redis):
+        self.redis = redis
+
+    @staticmethod
+    def _key(run_id: str) -> str:
+        return f"run_access:{run_id}"
+
+    async def get(self, run_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            raw = await self.redis.get(self._key(run_id))
+            return json.loads(raw) if raw else None
+        except Exception as exc:
+            LOG.warning("[RunAccessCache] Read for %s failed: %s", run_id, exc)
+            return None
+
+    async def set(
+        self,
+        run_id: str,
+        *,
+        user_id: str,
+        thread_id: str,
+        assistant_id: str,
+        expires_at: Optional[int] = None,
+    ) -> None:
+        ttl = RUN_ACCESS_CACHE_TTL
+        if expires_at:
+            ttl = min(ttl, int(expires_at) - int(time.time()))
+        if ttl <= 0:
+            return
+        payload = json.dumps(
+            {"user_id": user_id, "thread_id": thread_id, "assistant_id": assistant_id}
+        )
+        try:
+            await self.redis.set(self._key(run_id), payload, ex=ttl)
+        except Exception as exc:
+            LOG.warning("[RunAccessCache] Write for %s failed: %s", run_id, exc)
@@ -0,0 +1,160 @@
+# src/api/entities_api/cache/run_event_bus.py
+import asyncio
+import json
+import os
+import time
+from typing import Any, AsyncGenerator, Dict, Optional, Union
+
+from projectdavid_common.utilities.logging_service import LoggingUtility
+from redis import Redis as SyncRedis
+
+try:
+    from redis.asyncio import Redis as AsyncRedis
+except ImportError:
+
+    class AsyncRedis:
+        pass
+
+
+LOG = LoggingUtility()
+
+# How long a subscriber blocks on the channel before yielding control back
+# to the caller (disconnect checks, keep-alives). This is NOT a poll interval:
+# a published event wakes the subscriber immediately.
+RUN_EVENTS_IDLE_TIMEOUT = float(os.getenv("RUN_EVENTS_IDLE_TIMEOUT_SECONDS", "15"))
+
+# Event names published on a run's channel.
+RUN_STATUS_EVENT = "run.status"
+ACTION_CREATED_EVENT = "action.created"
+ACTION_STATUS_EVENT = "action.status"
+
+
+class RunEventBus:
+    """
+    Redis Pub/Sub fan-out for run lifecycle events.
+
+    Producers (RunService / ActionService) publish a small JSON envelope
+    whenever a run changes status or an action is created/updated.
+    Consumers (the /runs/{run_id}/events SSE endpoint) subscribe to the
+    run's channel and wake only when something actually happens — an idle
+    watcher holds one Redis subscription and zero DB connections.
+
+    Envelope shape:
+        {"event": "run.status", "run_id": "run_x", "status": "action_required", "ts": 1700000000}
+        {"event": "action.created", "run_id": "run_x", "action_id": "act_x", "tool_name": "..."}
+
+    Pub/Sub is fire-and-forget: events published while nobody is subscribed
+    are dropped. Subscribers must therefore subscribe FIRST and then read a
+    DB snapshot, so no transition can fall between the two.
+    """
+
+    def __init__(self, redis: Union[SyncRedis, "AsyncRedis"]):
+        self.redis = redis
+
+    @staticmethod
+    def _channel(run_id: str) -> str:
+        return f"run:{run_id}:events"
+
+    @staticmethod
+    def _envelope(event: str, run_id: str, **fields: Any) -> str:
+        payload = {"event": event, "run_id": run_id, "ts": int(time.time())}
+        payload.update({k: v for k, v in fields.items() if v is not None})
+        return json.dumps(payload, default=str)
+
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+
+    def publish_sync(self, event: str, run_id: str, **fields: Any) -> None:
+        """
+        Publish from synchronous service code (runs inside SessionLocal blocks
+        or asyncio.to_thread). Never raises — a Redis outage must not fail the
+        DB write that triggered the event.
+        """
+        if not run_id:
+            return
+        try:
+            self.redis.publish(self._channel(run_id), self._envelope(event, run_id, **fields))
+        except Exception as exc:
+            LOG.warning("[RunEventBus] publish %s for run %s failed: %s", event, run_id, exc)
+
+    async def publish(self, event: str, run_id: str, **fields: Any) -> None:
+        if not run_id:
+            return
+        data = self._envelope(event, run_id, **fields)
+        try:
+            if isinstance(self.redis, AsyncRedis):
+                await self.redis.publish(self._channel(run_id), data)
+            else:
+                await asyncio.to_thread(self.redis.publish, self._channel(run_id), data)
+        except Exception as exc:
+            LOG.warning("[RunEventBus] publish %s for run %s failed: %s", event, run_id, exc)
+
+    # ------------------------------------------------------------------
+    # Subscribing
+    # ------------------------------------------------------------------
+
+    async def subscribe(
+        self,
+        run_id: str,
+        *,
+        idle_timeout: float = RUN_EVENTS_IDLE_TIMEOUT,
+    ) -> AsyncGenerator[Optional[Dict[str, Any]], None]:
+        """
+        Yield decoded event envelopes for a run as they are published.
+
+        The FIRST item is always None, emitted as soon as the subscription is
+        live — that is the moment to read the DB snapshot. After that, None is
+        yielded every `idle_timeout` seconds without traffic so callers can run
+        disconnect checks without a separate timer task.
+
+        Requires an asyncio Redis client — the sync client would block the loop.
+        """
+        if not isinstance(self.redis, AsyncRedis):
+            raise TypeError("RunEventBus.subscribe requires a redis.asyncio.Redis client")
+
+        pubsub = self.redis.pubsub()
+        await pubsub.subscribe(self._channel(run_id))
+
+        try:
+            yield None
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=idle_timeout
+                )
+                if message is None:
+                    yield None
+                    continue
+                raw = message.get("data")
+                if isinstance(raw, bytes):
+                    raw = raw.decode("utf-8")
+                try:
+                    yield json.loads(raw)
+                except (TypeError, json.JSONDecodeError):
+                    LOG.warning("[RunEventBus] Dropping malformed event on run %s: %r", run_id, raw)
+        finally:
+            try:
+                await pubsub.unsubscribe(self._channel(run_id))
+                await pubsub.aclose()
+            except Exception as exc:
+                LOG.debug("[RunEventBus] pubsub teardown for run %s: %s", run_id, exc)
+
+
+# ------------------------------------------------------------------
+# Standalone factory
+# ------------------------------------------------------------------
+_sync_bus: Optional[RunEventBus] = None
+
+
+def get_sync_run_event_bus() -> RunEventBus:
+    """
+    Process-wide synchronous publisher for CRUD services.
+
+    Unlike the short-lived factories in utils.cache_utils this one is reused:
+    it is hit on every run status transition, so the connection pool is kept.
+    """
+    global _sync_bus
+    if _sync_bus is None:
+        redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        _sync_bus = RunEventBus(redis=SyncRedis.from_url(redis_url, decode_responses=True))
+    return _sync_bus
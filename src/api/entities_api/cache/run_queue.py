@@ -0,0 +1,209 @@
+# src/api/entities_api/cache/run_queue.py
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import AsyncGenerator, List, Optional, Tuple
+
+from projectdavid_common.utilities.logging_service import LoggingUtility
+
+LOG = LoggingUtility()
+
+# Opt-in: when false, /v1/completions runs inference inside the request as before.
+RUN_QUEUE_ENABLED = os.getenv("RUN_QUEUE_ENABLED", "false").lower() == "true"
+RUN_QUEUE_STREAM = os.getenv("RUN_QUEUE_STREAM", "run_queue:jobs")
+RUN_QUEUE_GROUP = os.getenv("RUN_QUEUE_GROUP", "orchestrators")
+# A job delivered to a worker that has not acked it within this window is
+# considered orphaned (worker crashed) and may be claimed by another worker.
+RUN_QUEUE_CLAIM_IDLE_MS = int(os.getenv("RUN_QUEUE_CLAIM_IDLE_SECONDS", "300")) * 1000
+# Output streams outlive the run so late / reconnecting clients can replay.
+RUN_OUTPUT_TTL = int(os.getenv("RUN_OUTPUT_TTL_SECONDS", "3600"))
+RUN_OUTPUT_MAXLEN = int(os.getenv("RUN_OUTPUT_MAXLEN", "10000"))
+# How long attach() blocks on XREAD before yielding a keep-alive tick.
+RUN_OUTPUT_BLOCK_MS = int(os.getenv("RUN_OUTPUT_BLOCK_MS", "15000"))
+
+# Final entry written to every output stream; attach() stops after it.
+RUN_OUTPUT_DONE = "[DONE]"
+
+
+def serialize_run_chunk(chunk, run_id: str) -> str:
+    """Normalise one process_conversation chunk to the JSON sent as SSE data."""
+    if isinstance(chunk, str):
+        return chunk
+    if isinstance(chunk, dict):
+        if "run_id" not in chunk:
+            chunk["run_id"] = run_id
+        return json.dumps(chunk)
+    return json.dumps({"type": "content", "content": str(chunk), "run_id": run_id})
+
+
+@dataclass
+class RunJob:
+    """Everything a worker needs to execute one /v1/completions request."""
+
+    run_id: str
+    thread_id: str
+    assistant_id: str
+    model: str
+    message_id: Optional[str] = None
+    api_key: Optional[str] = None
+    # Owner of the run; the worker releases its admission slots on exit.
+    user_id: Optional[str] = None
+    enqueued_at: float = 0.0
+
+    def to_fields(self) -> dict:
+        return {"job": json.dumps(asdict(self))}
+
+    @classmethod
+    def from_fields(cls, fields: dict) -> "RunJob":
+        raw = fields.get("job") or fields.get(b"job")
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8")
+        return cls(**json.loads(raw))
+
+
+class RunQueue:
+    """
+    Durable hand-off of runs from the API tier to orchestrator workers.
+
+    Redis layout:
+
+        run_queue:jobs          → STREAM of RunJob entries, consumer group "orchestrators"
+        run_output:{run_id}     → STREAM of SSE payloads ("data" field), ends with [DONE]
+
+    Jobs sit in the stream until a worker acks them, so a worker crash
+    leaves the job in the group's pending list where claim_orphans() picks
+    it up. Acked jobs are XDEL'd straight away: the entry carries the
+    caller's inference provider key and must not linger.
+
+    Output is written by the worker and read by any number of clients via
+    attach(), which replays from an entry id — a client that disconnects can
+    re-attach with the last id it saw and lose nothing. Requires a
+    redis.asyncio client.
+    """
+
+    def __init__(self, redis):
+        self.redis = redis
+        self._group_ready = False
+
+    @staticmethod
+    def output_key(run_id: str) -> str:
+        return f"run_output:{run_id}"
+
+    @staticmethod
+    def _decode(value) -> str:
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    # ------------------------------------------------------------------
+    # Producer side (API tier)
+    # ------------------------------------------------------------------
+
+    async def enqueue(self, job: RunJob) -> str:
+        job.enqueued_at = job.enqueued_at or time.time()
+        entry_id = await self.redis.xadd(RUN_QUEUE_STREAM, job.to_fields())
+        LOG.info("[RunQueue] Enqueued run %s as %s", job.run_id, self._decode(entry_id))
+        return self._decode(entry_id)
+
+    async def has_output(self, run_id: str) -> bool:
+        return bool(await self.redis.exists(self.output_key(run_id)))
+
+    async def attach(
+        self, run_id: str, last_id: str = "0"
+    ) -> AsyncGenerator[Optional[Tuple[str, str]], None]:
+        """
+        Yield (entry_id, data) from the run's output stream starting after
+        `last_id`, until the [DONE] entry. Yields None when XREAD times out
+        with nothing new so callers can check for disconnects.
+        """
+        key = self.output_key(run_id)
+        while True:
+            response = await self.redis.xread({key: last_id}, count=100, block=RUN_OUTPUT_BLOCK_MS)
+            if not response:
+                yield None
+                continue
+            for _stream, entries in response:
+                for entry_id, fields in entries:
+                    last_id = self._decode(entry_id)
+                    data = self._decode(fields.get("data") or fields.get(b"data") or "")
+                    yield last_id, data
+                    if data == RUN_OUTPUT_DONE:
+                        return
+
+    # ------------------------------------------------------------------
+    # Consumer side (orchestrator workers)
+    # ------------------------------------------------------------------
+
+    async def ensure_group(self) -> None:
+        if self._group_ready:
+            return
+        try:
+            await self.redis.xgroup_create(RUN_QUEUE_STREAM, RUN_QUEUE_GROUP, id="0", mkstream=True)
+        except Exception as exc:
+            if "BUSYGROUP" not in str(exc):
+                raise
+        self._group_ready = True
+
+    async def read(
+        self, consumer: str, count: int, block_ms: int = 5000
+    ) -> List[Tuple[str, RunJob]]:
+        await self.ensure_group()
+        response = await self.redis.xreadgroup(
+            RUN_QUEUE_GROUP, consumer, {RUN_QUEUE_STREAM: ">"}, count=count, block=block_ms
+        )
+        return await self._parse(response[0][1] if response else [])
+
+    async def claim_orphans(self, consumer: str, count: int) -> List[Tuple[str, RunJob]]:
+        """Take over jobs delivered to a worker that died before acking them."""
+        await self.ensure_group()
+        response = await self.redis.xautoclaim(
+            RUN_QUEUE_STREAM,
+            RUN_QUEUE_GROUP,
+            consumer,
+            min_idle_time=RUN_QUEUE_CLAIM_IDLE_MS,
+            start_id="0-0",
+            count=count,
+        )
+        return await self._parse(response[1] if response else [])
+
+    async def touch(self, consumer: str, entry_id: str) -> None:
+        """Reset the job's idle time so long runs are not claimed as orphans."""
+        await self.redis.xclaim(
+            RUN_QUEUE_STREAM, RUN_QUEUE_GROUP, consumer, 0, [entry_id], justid=True
+        )
+
+    async def ack(self, entry_id: str) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.xack(RUN_QUEUE_STREAM, RUN_QUEUE_GROUP, entry_id)
+            pipe.xdel(RUN_QUEUE_STREAM, entry_id)
+            await pipe.execute()
+
+    async def _parse(self, entries) -> List[Tuple[str, RunJob]]:
+        jobs = []
+        for entry_id, fields in entries:
+            entry_id = self._decode(entry_id)
+            if not fields:
+                # Entry was XDEL'd while pending — nothing to run.
+                await self.ack(entry_id)
+                continue
+            try:
+                jobs.append((entry_id, RunJob.from_fields(fields)))
+            except Exception as exc:
+                LOG.error("[RunQueue] Dropping malformed job %s: %s", entry_id, exc)
+                await self.ack(entry_id)
+        return jobs
+
+
+# ------------------------------------------------------------------
+# Standalone factory
+# ------------------------------------------------------------------
+_queue: Optional[RunQueue] = None
+
+
+def get_run_queue() -> RunQueue:
+    """Process-wide queue on the shared async Redis pool."""
+    global _queue
+    if _queue is None:
+        from src.api.entities_api.dependencies import get_redis_sync
+
+        _queue = RunQueue(redis=get_redis_sync())
+    return _queue
@@ -0,0 +1,204 @@
+# src/api/entities_api/cache/run_state_buffer.py
+import asyncio
+import json
+import os
+from typing import Any, Dict, Optional
+
+from fastapi import HTTPException
+from projectdavid_common.utilities.logging_service import LoggingUtility
+from projectdavid_common.validation import StatusEnum
+
+LOG = LoggingUtility()
+
+# Seconds between background flushes of runs with buffered (dirty) state.
+RUN_STATE_FLUSH_INTERVAL = float(os.getenv("RUN_STATE_FLUSH_INTERVAL_SECONDS", "5"))
+# Buffered state outlives the run by a comfortable margin; runs expire after 1h.
+RUN_STATE_TTL = int(os.getenv("RUN_STATE_TTL_SECONDS", "7200"))
+
+# Only these fields may sit in the buffer. They are written every turn but
+# nobody reads them back mid-run, so deferring them is invisible to callers.
+# Everything else (meta_data, last_error, completed_at, failed_at, ...) is
+# read back by delegation / the SDK and is written through immediately —
+# together with whatever is already buffered for the run.
+#
+# Status is never buffered: every transition the orchestrator writes
+# (action_required, completed, failed, ...) is observed by the SDK, the
+# events SSE endpoint or the purge daemons, so it always forces a flush.
+BUFFERED_RUN_FIELDS = {"current_turn", "started_at", "usage"}
+
+_DIRTY_SET_KEY = "run_state:dirty"
+
+
+class RunStateBuffer:
+    """
+    Write-behind buffer for run lifecycle fields.
+
+    Redis holds the lifecycle fields of an in-flight run that MySQL has not
+    seen yet:
+
+        run:{run_id}:state:pending  → staged fields not yet written to MySQL
+        run_state:dirty             → run_ids with a non-empty pending hash
+
+    Readers always go to MySQL: everything they observe is written through
+    (see BUFFERED_RUN_FIELDS), so there is no Redis read path.
+
+    stage() only touches Redis. flush() atomically drains the pending hash
+    (MULTI/EXEC HGETALL + DEL, so two API processes can never apply the same
+    batch twice) and writes it to MySQL in a single RunService transaction.
+
+    Flushes happen:
+      - immediately when a status or a write-through field arrives (see
+        BUFFERED_RUN_FIELDS),
+      - at orchestrator turn boundaries via flush(),
+      - every RUN_STATE_FLUSH_INTERVAL seconds from a background task, so a
+        long-running turn still surfaces current_turn to dashboards.
+
+    Values are JSON-encoded in the hashes. Requires a redis.asyncio client.
+    """
+
+    def __init__(self, redis):
+        self.redis = redis
+        self._flusher: Optional[asyncio.Task] = None
+        self._run_svc = None
+
+    @property
+    def run_svc(self):
+        if self._run_svc is None:
+            from src.api.entities_api.services.runs_service import RunService
+
+            self._run_svc = RunService()
+        return self._run_svc
+
+    @staticmethod
+    def _pending_key(run_id: str) -> str:
+        return f"run:{run_id}:state:pending"
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def stage(self, run_id: str, *, status: Optional[str] = None, **fields: Any) -> bool:
+        """
+        Record new lifecycle values for a run.
+
+        Returns True when the batch was flushed through to MySQL, False when
+        it was only buffered.
+        """
+        updates: Dict[str, Any] = dict(fields)
+        if status is not None:
+            updates["status"] = StatusEnum(status).value  # reject bad values before buffering
+        if not updates:
+            return False
+
+        encoded = {k: json.dumps(v) for k, v in updates.items()}
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(self._pending_key(run_id), mapping=encoded)
+            pipe.expire(self._pending_key(run_id), RUN_STATE_TTL)
+            pipe.sadd(_DIRTY_SET_KEY, run_id)
+            await pipe.execute()
+
+        must_flush = status is not None or any(k not in BUFFERED_RUN_FIELDS for k in fields)
+        if must_flush:
+            await self.flush(run_id)
+            return True
+
+        self._ensure_flusher()
+        return False
+
+    async def flush(self, run_id: str) -> bool:
+        """
+        Drain and persist everything buffered for a run. Safe to call when
+        nothing is pending (no DB round-trip in that case).
+        """
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hgetall(self._pending_key(run_id))
+            pipe.delete(self._pending_key(run_id))
+            pipe.srem(_DIRTY_SET_KEY, run_id)
+            pending, _, _ = await pipe.execute()
+
+        if not pending:
+            return False
+
+        batch = {self._decode(k): json.loads(self._decode(v)) for k, v in pending.items()}
+        status = batch.pop("status", None)
+
+        try:
+            await self.run_svc.apply_run_state_async(run_id, status=status, **batch)
+        except HTTPException:
+            raise  # run gone / bad value — retrying cannot help
+        except Exception:
+            # Transient DB failure: put the fields back so the next flush
+            # retries them. The status is not requeued — the caller that
+            # forced this flush sees the exception and owns the retry.
+            await self._requeue(
+                run_id, {k: v for k, v in pending.items() if self._decode(k) != "status"}
+            )
+            raise
+        return True
+
+    async def flush_dirty(self) -> int:
+        """Flush every run with buffered state. Returns the number flushed."""
+        run_ids = await self.redis.smembers(_DIRTY_SET_KEY)
+        flushed = 0
+        for run_id in run_ids:
+            run_id = self._decode(run_id)
+            try:
+                if await self.flush(run_id):
+                    flushed += 1
+            except Exception as exc:
+                LOG.warning("[RunStateBuffer] Periodic flush of run %s failed: %s", run_id, exc)
+        return flushed
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _decode(value: Any) -> str:
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    async def _requeue(self, run_id: str, pending: Dict[Any, Any]) -> None:
+        # HSETNX: never clobber newer values staged while the write was in flight.
+        if not pending:
+            return
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                for k, v in pending.items():
+                    pipe.hsetnx(self._pending_key(run_id), k, v)
+                pipe.expire(self._pending_key(run_id), RUN_STATE_TTL)
+                pipe.sadd(_DIRTY_SET_KEY, run_id)
+                await pipe.execute()
+        except Exception as exc:
+            LOG.error("[RunStateBuffer] Could not requeue state for run %s: %s", run_id, exc)
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is not None and not self._flusher.done():
+            return
+        self._flusher = asyncio.get_running_loop().create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        # Exits once there is nothing left to flush; the next stage() restarts it.
+        while True:
+            await asyncio.sleep(RUN_STATE_FLUSH_INTERVAL)
+            try:
+                await self.flush_dirty()
+                if not await self.redis.scard(_DIRTY_SET_KEY):
+                    return
+            except Exception as exc:
+                LOG.warning("[RunStateBuffer] Flush loop error: %s", exc)
+
+
+# ------------------------------------------------------------------
+# Standalone factory
+# ------------------------------------------------------------------
+_buffer: Optional[RunStateBuffer] = None
+
+
+def get_run_state_buffer() -> RunStateBuffer:
+    """Process-wide buffer on the shared async Redis pool."""
+    global _buffer
+    if _buffer is None:
+        from src.api.entities_api.dependencies import get_redis_sync
+
+        _buffer = RunStateBuffer(redis=get_redis_sync())
+    return _buffer
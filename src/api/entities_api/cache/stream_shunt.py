@@ -0,0 +1,136 @@
+# src/api/entities_api/cache/stream_shunt.py
+import asyncio
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from projectdavid_common.utilities.logging_service import LoggingUtility
+
+LOG = LoggingUtility()
+
+# How long the writer waits to gather chunks before one pipelined flush.
+SHUNT_FLUSH_INTERVAL = float(os.getenv("STREAM_SHUNT_FLUSH_MS", "10")) / 1000.0
+# Upper bound on XADDs per pipeline round-trip.
+SHUNT_MAX_BATCH = int(os.getenv("STREAM_SHUNT_MAX_BATCH", "256"))
+# The writer task exits after this long without chunks; push() restarts it.
+SHUNT_IDLE_EXIT = float(os.getenv("STREAM_SHUNT_IDLE_EXIT_SECONDS", "2"))
+
+
+def redis_safe_chunk(chunk: Any) -> Dict[str, Any]:
+    """
+    Flatten a stream chunk for XADD, which only accepts str/bytes/int/float
+    values: nested dicts/lists become JSON, None becomes "", bools strings.
+    """
+    if isinstance(chunk, str):
+        try:
+            chunk = json.loads(chunk)
+        except json.JSONDecodeError:
+            chunk = {"content": chunk}
+    if not isinstance(chunk, dict):
+        chunk = {"content": str(chunk)}
+
+    safe = {}
+    for k, v in chunk.items():
+        if isinstance(v, (dict, list)):
+            safe[k] = json.dumps(v)
+        elif v is None:
+            safe[k] = ""
+        elif isinstance(v, bool):
+            safe[k] = str(v)
+        else:
+            safe[k] = v
+    return safe
+
+
+class StreamShuntWriter:
+    """
+    Per-run writer mirroring stream chunks into a Redis Stream.
+
+    push() is synchronous and only appends to an in-memory buffer. A single
+    background task drains the buffer every SHUNT_FLUSH_INTERVAL and sends
+    the batch as one pipelined round-trip of XADDs. The stream's TTL is set
+    once, in the same pipeline as the first batch (EXPIRE is a no-op before
+    the first XADD creates the key).
+
+    Requires a redis.asyncio client. Failures are logged, never raised —
+    mirroring is best-effort and must not break the client-facing stream.
+    """
+
+    def __init__(
+        self,
+        redis,
+        stream_key: str,
+        *,
+        maxlen: int = 1000,
+        ttl_seconds: int = 3600,
+    ):
+        self.redis = redis
+        self.stream_key = stream_key
+        self.maxlen = maxlen
+        self.ttl_seconds = ttl_seconds
+        self._buffer: List[Dict[str, Any]] = []
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._ttl_set = False
+        # Serialises flushes so batches reach Redis in push order.
+        self._flush_lock = asyncio.Lock()
+
+    def push(self, chunk: Any) -> None:
+        self._buffer.append(redis_safe_chunk(chunk))
+        self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def flush(self) -> None:
+        """Write everything buffered so far (end of stream / teardown)."""
+        while self._buffer:
+            await self._flush_once()
+
+    async def close(self) -> None:
+        await self.flush()
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=SHUNT_IDLE_EXIT)
+            except asyncio.TimeoutError:
+                if not self._buffer:
+                    return
+            self._wakeup.clear()
+            await asyncio.sleep(SHUNT_FLUSH_INTERVAL)
+            await self.flush()
+
+    async def _flush_once(self) -> None:
+        async with self._flush_lock:
+            batch = self._buffer[:SHUNT_MAX_BATCH]
+            del self._buffer[:SHUNT_MAX_BATCH]
+            if batch:
+                await self._write(batch)
+
+    async def _write(self, batch: List[Dict[str, Any]]) -> None:
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for fields in batch:
+                    pipe.xadd(self.stream_key, fields, maxlen=self.maxlen, approximate=True)
+                if not self._ttl_set:
+                    pipe.expire(self.stream_key, self.ttl_seconds)
+                await pipe.execute()
+            self._ttl_set = True
+        except Exception as exc:
+            LOG.warning(
+                "[Redis Shunt] batch of %d for %s failed (%s): %s",
+                len(batch),
+                self.stream_key,
+                type(exc).__name__,
+                exc,
+            )
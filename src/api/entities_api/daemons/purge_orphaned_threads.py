@@ -83,6 +83,8 @@ load_dotenv()
 
 # ── Reuse the centralised engine / session factory ────────────────────────────
 from entities_api.db.database import SessionLocal, wait_for_databases
+from entities_api.services.message_blob_store import (MessageBlobStore,
+                                                     get_message_blob_store)
 
 # ── Logging ───────────────────────────────────────────────────────────────────
 
@@ -121,7 +123,20 @@ def _batch_delete(session, batch_ids: list[str], label: str) -> tuple[int, int]:
 
     msg_count = 0
 
+    blob_paths: list[str] = []
+
     if label == "orphaned":
+        # Offloaded message content lives on the file share; collect the
+        # refs now and remove the blobs once the rows are committed.
+        blob_rows = session.execute(
+            text(
+                "SELECT blob_refs FROM messages "
+                f"WHERE thread_id IN ({in_clause}) AND blob_refs IS NOT NULL"
+            ),
+            id_params,
+        )
+        blob_paths = MessageBlobStore.paths_of(row.blob_refs for row in blob_rows)
+
         # Message.thread_id has no FK cascade — must delete manually.
         msg_result = session.execute(
             text(f"DELETE FROM messages WHERE thread_id IN ({in_clause})"),
@@ -136,6 +151,9 @@ def _batch_delete(session, batch_ids: list[str], label: str) -> tuple[int, int]:
     # thread_participants cascades automatically on thread deletion.
 
     session.commit()
+
+    if blob_paths:
+        get_message_blob_store().delete_paths(blob_paths)
     return thr_result.rowcount, msg_count
 
 
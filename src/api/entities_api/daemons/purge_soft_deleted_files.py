@@ -12,9 +12,11 @@ is what actually performs the final irreversible destruction once the window
 has closed.
 
 Deletion order (safest first):
-  a. Remove the physical file from the Samba share
+  a. Release the file's reference to its stored object — the physical file
+     is removed from the Samba share only when no other File shares it
   b. Delete FileStorage row  (or let CASCADE handle it)
   c. Delete File row
+  Stored objects left unreferenced by a failed delete are retried each cycle.
 
 Usage
   DRY_RUN=true python purge_soft_deleted_files.py --once
@@ -44,6 +46,8 @@ from sqlalchemy import text
 load_dotenv()
 
 from entities_api.db.database import SessionLocal, wait_for_databases
+from entities_api.services.file_blobs import (collect_storage, release_storage,
+                                              sweep_unreferenced)
 
 # ─── Logging ──────────────────────────────────────────────────────────────────
 
@@ -85,6 +89,10 @@ def delete_physical_file(path: Path) -> bool:
         return False
 
 
+def _delete_stored(storage_path: str) -> bool:
+    return delete_physical_file(samba_path(storage_path))
+
+
 # ─── Core logic ───────────────────────────────────────────────────────────────
 
 
@@ -143,31 +151,58 @@ def purge_soft_deleted(session) -> tuple[int, int]:
         )
         attempted += 1
 
-        # 1. Physical bytes first — safe even if DB step later fails
-        phys_ok = delete_physical_file(samba_path(storage_path))
+        if DRY_RUN:
+            log.info(
+                "[DRY_RUN] Would release %s and remove DB records for file_id=%s",
+                storage_path,
+                file_id,
+            )
+            deleted += 1
+            continue
 
-        # 2. DB hard-delete (FileStorage CASCADE-deletes with File)
-        if not DRY_RUN:
-            try:
-                session.execute(
-                    text("DELETE FROM file_storage WHERE file_id = :fid"),
-                    {"fid": file_id},
-                )
-                session.execute(
-                    text("DELETE FROM files WHERE id = :fid"),
-                    {"fid": file_id},
-                )
-                session.commit()
-                log.info("DB records removed | file_id=%s", file_id)
-                if phys_ok:
-                    deleted += 1
-            except Exception as exc:
-                session.rollback()
-                log.error("DB deletion failed | file_id=%s | %s", file_id, exc)
-        else:
-            log.info("[DRY_RUN] Would remove DB records for file_id=%s", file_id)
+        try:
+            # 1. Drop this file's reference to the stored object. Content
+            #    shared with other files survives.
+            unreferenced = release_storage(session, storage_path)
+
+            # 2. DB deletion
+            session.execute(
+                text("DELETE FROM file_storage WHERE file_id = :fid"),
+                {"fid": file_id},
+            )
+            session.execute(
+                text("DELETE FROM files WHERE id = :fid"),
+                {"fid": file_id},
+            )
+            session.commit()
+            log.info("DB records removed | file_id=%s", file_id)
+        except Exception as exc:
+            session.rollback()
+            log.error("DB deletion failed | file_id=%s | %s", file_id, exc)
+            continue
+
+        # 3. The last reference is gone and committed: remove the bytes. A
+        #    failure leaves a zero-ref row for the sweep below.
+        try:
+            phys_ok = not unreferenced or collect_storage(session, storage_path, _delete_stored)
+            session.commit()
+        except Exception as exc:
+            session.rollback()
+            phys_ok = False
+            log.error("Physical deletion failed | file_id=%s | %s", file_id, exc)
+        if phys_ok:
             deleted += 1
 
+    if not DRY_RUN:
+        try:
+            swept = sweep_unreferenced(session, _delete_stored)
+            session.commit()
+            if swept:
+                log.info("Removed %d unreferenced stored object(s).", swept)
+        except Exception as exc:
+            session.rollback()
+            log.error("Unreferenced object sweep failed: %s", exc)
+
     return attempted, deleted
 
 
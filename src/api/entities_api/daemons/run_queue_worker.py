@@ -0,0 +1,262 @@
+# src/api/entities_api/daemons/run_queue_worker.py
+#!/usr/bin/env python3
+"""
+run_queue_worker.py
+───────────────────
+Orchestrator worker — executes runs enqueued by /v1/completions when the API
+runs with RUN_QUEUE_ENABLED=true.
+
+Flow
+  1. Read jobs from the run_queue:jobs stream (consumer group "orchestrators").
+  2. Execute each job with the same provider selection the API used to do
+     inline, writing every chunk to run_output:{run_id}.
+  3. Terminate the output with [DONE] and ack (XACK + XDEL) the job.
+
+Clients attach to the output stream via the completions response or
+GET /v1/runs/{run_id}/output, so a dropped HTTP connection no longer kills
+the run. Scale by adding processes (numprocs) or hosts; each process runs up
+to RUN_QUEUE_CONCURRENCY jobs at once.
+
+Crash recovery
+  A job left unacked for RUN_QUEUE_CLAIM_IDLE_SECONDS is claimed by another
+  worker. If its run never started (status 'queued') it is executed; a run
+  that was already in flight cannot be resumed safely, so it is marked
+  failed and its output stream is closed with an error.
+
+Environment variables  (same .env the API uses)
+────────────────────────────────────────────────
+  REDIS_URL                    — shared with the API
+  RUN_QUEUE_CONCURRENCY        — concurrent runs per process     (default: 8)
+  RUN_QUEUE_CLAIM_IDLE_SECONDS — orphan threshold                (default: 300)
+  RUN_OUTPUT_TTL_SECONDS       — output stream retention         (default: 3600)
+
+Usage
+─────
+  python -m src.api.entities_api.daemons.run_queue_worker
+
+Supervisord stanza
+──────────────────
+  [program:run_queue_worker]
+  command=python -m src.api.entities_api.daemons.run_queue_worker
+  process_name=%(program_name)s_%(process_num)02d
+  numprocs=2
+  directory=/app
+  autostart=true
+  autorestart=true
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import signal
+import socket
+import time
+from typing import Set
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from projectdavid_common.utilities.logging_service import LoggingUtility
+from projectdavid_common.validation import StatusEnum
+
+from src.api.entities_api.cache.admission_control import \
+    get_admission_controller
+from src.api.entities_api.cache.run_queue import (RUN_OUTPUT_DONE,
+                                                  RUN_OUTPUT_MAXLEN,
+                                                  RUN_OUTPUT_TTL,
+                                                  RUN_QUEUE_CLAIM_IDLE_MS,
+                                                  RunJob, RunQueue,
+                                                  get_run_queue,
+                                                  serialize_run_chunk)
+from src.api.entities_api.cache.stream_shunt import StreamShuntWriter
+from src.api.entities_api.db.database import (start_async_engine,
+                                              stop_async_engine)
+from src.api.entities_api.db.replicas import primary_pinned
+from src.api.entities_api.dependencies import get_redis_sync
+from src.api.entities_api.observability.sql_instrumentation import query_scope
+from src.api.entities_api.services.native_execution_service import \
+    get_native_execution_service
+
+LOG = LoggingUtility()
+
+CONCURRENCY = int(os.getenv("RUN_QUEUE_CONCURRENCY", "8"))
+# Heartbeat well inside the claim window so a long run is never stolen.
+HEARTBEAT_SECONDS = max(RUN_QUEUE_CLAIM_IDLE_MS / 3000.0, 1.0)
+# How often an idle worker sweeps the pending list for orphaned jobs.
+CLAIM_INTERVAL_SECONDS = int(os.getenv("RUN_QUEUE_CLAIM_INTERVAL_SECONDS", "30"))
+
+
+class RunQueueWorker:
+
+    def __init__(self, queue: RunQueue, concurrency: int = CONCURRENCY):
+        self.queue = queue
+        self.concurrency = concurrency
+        self.consumer = f"{socket.gethostname()}:{os.getpid()}"
+        self._active: Set[asyncio.Task] = set()
+        self._stopping = asyncio.Event()
+        self._last_claim = 0.0
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    async def run_forever(self) -> None:
+        LOG.info(
+            "[RunQueueWorker] %s started | concurrency=%d",
+            self.consumer,
+            self.concurrency,
+        )
+        while not self._stopping.is_set():
+            free = self.concurrency - len(self._active)
+            if free <= 0:
+                await asyncio.wait(self._active, return_when=asyncio.FIRST_COMPLETED)
+                continue
+            try:
+                for entry_id, job in await self._claim_due(free):
+                    self._start(entry_id, job, orphaned=True)
+                free = self.concurrency - len(self._active)
+                if free > 0:
+                    for entry_id, job in await self.queue.read(self.consumer, free):
+                        self._start(entry_id, job, orphaned=False)
+            except Exception as exc:
+                LOG.error("[RunQueueWorker] Queue read failed: %s", exc, exc_info=True)
+                await asyncio.sleep(1)
+
+        if self._active:
+            LOG.info("[RunQueueWorker] Draining %d active run(s)…", len(self._active))
+            await asyncio.gather(*self._active, return_exceptions=True)
+
+    async def _claim_due(self, count: int):
+        if time.monotonic() - self._last_claim < CLAIM_INTERVAL_SECONDS:
+            return []
+        self._last_claim = time.monotonic()
+        return await self.queue.claim_orphans(self.consumer, count)
+
+    def _start(self, entry_id: str, job: RunJob, *, orphaned: bool) -> None:
+        task = asyncio.get_running_loop().create_task(self._handle(entry_id, job, orphaned))
+        self._active.add(task)
+        task.add_done_callback(self._active.discard)
+
+    async def _handle(self, entry_id: str, job: RunJob, orphaned: bool) -> None:
+        heartbeat = asyncio.get_running_loop().create_task(self._heartbeat(entry_id))
+        output = StreamShuntWriter(
+            self.queue.redis,
+            self.queue.output_key(job.run_id),
+            maxlen=RUN_OUTPUT_MAXLEN,
+            ttl_seconds=RUN_OUTPUT_TTL,
+        )
+        try:
+            # Runs read their own writes: keep every read on the primary.
+            with query_scope("run"), primary_pinned():
+                if orphaned and not await self._resumable(job):
+                    await self._fail_orphan(job, output)
+                else:
+                    await self._execute(job, output)
+        except Exception as exc:
+            LOG.error("[RunQueueWorker] Run %s failed: %s", job.run_id, exc, exc_info=True)
+            output.push(
+                {"data": json.dumps({"type": "error", "run_id": job.run_id, "message": str(exc)})}
+            )
+        finally:
+            heartbeat.cancel()
+            output.push({"data": RUN_OUTPUT_DONE})
+            await output.close()
+            await self.queue.ack(entry_id)
+            await self._release_admission(job)
+
+    async def _execute(self, job: RunJob, output: StreamShuntWriter) -> None:
+        from src.api.entities_api.orchestration.engine.inference_arbiter import \
+            InferenceArbiter
+        from src.api.entities_api.orchestration.engine.inference_provider_selector import \
+            InferenceProviderSelector
+
+        start_time = time.time()
+        chunk_count = 0
+        LOG.info(
+            "[RunQueueWorker] Executing run %s (queued %.2fs)",
+            job.run_id,
+            start_time - job.enqueued_at,
+        )
+
+        selector = InferenceProviderSelector(InferenceArbiter(redis=get_redis_sync()))
+        handler, _api_model_name = selector.select_provider(model_id=job.model)
+
+        async for chunk in handler.process_conversation(
+            thread_id=job.thread_id,
+            message_id=job.message_id,
+            run_id=job.run_id,
+            assistant_id=job.assistant_id,
+            model=job.model,
+            stream_reasoning=False,
+            api_key=job.api_key,
+        ):
+            chunk_count += 1
+            output.push({"data": serialize_run_chunk(chunk, job.run_id)})
+
+        LOG.info(
+            "[RunQueueWorker] Run %s finished: %d chunks in %.2fs",
+            job.run_id,
+            chunk_count,
+            time.time() - start_time,
+        )
+
+    async def _resumable(self, job: RunJob) -> bool:
+        run = await get_native_execution_service().retrieve_run(job.run_id)
+        status = getattr(getattr(run, "status", None), "value", getattr(run, "status", None))
+        return status == StatusEnum.queued.value
+
+    async def _fail_orphan(self, job: RunJob, output: StreamShuntWriter) -> None:
+        LOG.warning("[RunQueueWorker] Run %s was orphaned mid-flight; failing it", job.run_id)
+        native = get_native_execution_service()
+        await native.update_run_status(job.run_id, StatusEnum.failed.value)
+        await native.flush_run_state(job.run_id)
+        output.push(
+            {
+                "data": json.dumps(
+                    {
+                        "type": "error",
+                        "run_id": job.run_id,
+                        "message": "Orchestrator worker was lost during this run.",
+                    }
+                )
+            }
+        )
+
+    async def _release_admission(self, job: RunJob) -> None:
+        if not job.user_id:
+            return
+        admission = get_admission_controller()
+        await admission.release(
+            admission.ticket(
+                job.run_id,
+                user_id=job.user_id,
+                assistant_id=job.assistant_id,
+                model=job.model,
+            )
+        )
+
+    async def _heartbeat(self, entry_id: str) -> None:
+        while True:
+            await asyncio.sleep(HEARTBEAT_SECONDS)
+            try:
+                await self.queue.touch(self.consumer, entry_id)
+            except Exception as exc:
+                LOG.warning("[RunQueueWorker] Heartbeat for %s failed: %s", entry_id, exc)
+
+
+async def main() -> None:
+    worker = RunQueueWorker(get_run_queue())
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, worker.stop)
+    await start_async_engine()
+    try:
+        await worker.run_forever()
+    finally:
+        await stop_async_engine()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,14 +1,22 @@
 # src/api/entities_api/db/database.py
+import asyncio
 import os
 import time
 from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar
 
 from projectdavid_common import UtilsInterface
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
 
+from src.api.entities_api.db.replicas import ReplicaRouter, parse_replica_urls
+from src.api.entities_api.observability.sql_instrumentation import (
+    EngineSQLConfig, instrument_engine)
+
 logging_utility = UtilsInterface.LoggingUtility()
 
+T = TypeVar("T")
+
 # --- ALL ENGINE AND SESSION LOGIC IS NOW CENTRALIZED HERE ---
 
 DATABASE_URL = os.getenv("DATABASE_URL")
@@ -29,9 +37,16 @@ def resolve_special_db_runtime_url(special_raw: str | None) -> str | None:
 SPECIAL_DB_RUNTIME_URL = resolve_special_db_runtime_url(SPECIAL_DB_URL)
 
 # 1. The ONE configured main engine for the entire application
+# Statement logging is per engine: slow-query threshold, sample rate and the
+# opt-in full echo come from DB_* / SPECIAL_DB_* / ASYNC_DB_* env vars
+# (see observability/sql_instrumentation.py).
+DB_SQL_CONFIG = EngineSQLConfig.from_env("DB_")
+SPECIAL_DB_SQL_CONFIG = EngineSQLConfig.from_env("SPECIAL_DB_")
+ASYNC_DB_SQL_CONFIG = EngineSQLConfig.from_env("ASYNC_DB_")
+
 engine = create_engine(
     DATABASE_URL,
-    echo=True,
+    echo=DB_SQL_CONFIG.echo,
     pool_size=20,
     max_overflow=40,
     pool_timeout=30,
@@ -42,7 +57,7 @@ engine = create_engine(
 special_engine = (
     create_engine(
         SPECIAL_DB_RUNTIME_URL,
-        echo=True,
+        echo=SPECIAL_DB_SQL_CONFIG.echo,
         pool_size=10,
         max_overflow=20,
         pool_timeout=30,
@@ -52,10 +67,181 @@ special_engine = (
     else None
 )
 
+instrument_engine(engine, "main", DB_SQL_CONFIG)
+if special_engine is not None:
+    instrument_engine(special_engine, "special", SPECIAL_DB_SQL_CONFIG)
+
 # 2. The ONE session factory, bound to the correct engine
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+# 2a. Read replicas (optional).
+#
+# ReadSessionLocal() is for read-only service methods (list endpoints,
+# polling, history loads). It binds to a healthy, sufficiently fresh replica
+# from DATABASE_REPLICA_URLS, or to the primary when none is configured, the
+# caller is inside primary_pinned() (runs), or every replica lags — see
+# db/replicas.py. Writes always go through SessionLocal.
+DATABASE_REPLICA_URLS = parse_replica_urls(os.getenv("DATABASE_REPLICA_URLS"))
+REPLICA_DB_SQL_CONFIG = EngineSQLConfig.from_env("REPLICA_DB_")
+REPLICA_DB_POOL_SIZE = int(os.getenv("REPLICA_DB_POOL_SIZE", "20"))
+REPLICA_DB_MAX_OVERFLOW = int(os.getenv("REPLICA_DB_MAX_OVERFLOW", "40"))
+
+replica_engines = {}
+for _index, _url in enumerate(DATABASE_REPLICA_URLS):
+    _name = f"replica{_index}"
+    replica_engines[_name] = create_engine(
+        _url,
+        echo=REPLICA_DB_SQL_CONFIG.echo,
+        pool_size=REPLICA_DB_POOL_SIZE,
+        max_overflow=REPLICA_DB_MAX_OVERFLOW,
+        pool_timeout=30,
+        pool_recycle=280,
+        pool_pre_ping=True,
+    )
+    instrument_engine(replica_engines[_name], _name, REPLICA_DB_SQL_CONFIG)
+
+replica_router = ReplicaRouter(replica_engines)
+
+_ReadSession = sessionmaker(autocommit=False, autoflush=False)
+
+
+@event.listens_for(_ReadSession, "before_flush")
+def _reject_read_session_writes(session, flush_context, instances):
+    raise RuntimeError("ReadSessionLocal sessions are read-only; use SessionLocal to write.")
+
+
+def ReadSessionLocal():
+    """A read-only session on a replica when one is eligible, else the primary."""
+    return _ReadSession(bind=replica_router.pick() or engine)
+
+
+def read_or_primary(fn: Callable[[Any], T]) -> T:
+    """
+    fn(session) on a ReadSessionLocal session. A row written just before
+    (create → retrieve) may not have reached the replica yet, so a
+    not-found from a replica read — any exception with status_code 404 —
+    is retried once on the primary.
+    """
+    with ReadSessionLocal() as db:
+        on_replica = db.bind is not engine
+        try:
+            return fn(db)
+        except Exception as exc:
+            if not on_replica or getattr(exc, "status_code", None) != 404:
+                raise
+    with _ReadSession(bind=engine) as db:
+        return fn(db)
+
+
+# 2b. Async engine for the native execution hot path.
+#
+# Same database, separate pool: orchestration traffic is sized on its own
+# (ASYNC_DB_POOL_SIZE / ASYNC_DB_MAX_OVERFLOW) and never competes with the
+# sync routes for SessionLocal connections. The driver is swapped to aiomysql
+# (built on PyMySQL, like the sync URL) unless ASYNC_DATABASE_URL is given.
+# asyncio connections are loop-bound: the engine belongs to the one long-lived
+# loop that called start_async_engine() (API startup, run_queue_worker). The
+# throwaway loops of sync stream bridges and asyncio.run() helpers use
+# SessionLocal, so no pool is ever stranded on a closed loop.
+ASYNC_DB_ENABLED = os.getenv("ASYNC_DB_ENABLED", "true").lower() == "true"
+ASYNC_DB_POOL_SIZE = int(os.getenv("ASYNC_DB_POOL_SIZE", "10"))
+ASYNC_DB_MAX_OVERFLOW = int(os.getenv("ASYNC_DB_MAX_OVERFLOW", "10"))
+
+
+def to_async_url(url: Optional[str]) -> Optional[str]:
+    if not url:
+        return None
+    for sync_prefix in ("mysql+pymysql://", "mysql+mysqldb://", "mysql://"):
+        if url.startswith(sync_prefix):
+            return "mysql+aiomysql://" + url[len(sync_prefix) :]
+    return url
+
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or to_async_url(DATABASE_URL)
+
+_async_engine = None
+_async_session_factory = None
+_async_loop = None
+
+
+async def start_async_engine() -> None:
+    """
+    Build the async engine for the running loop. Call once from a loop that
+    lives as long as the process; a no-op when the engine is disabled or
+    its driver is not installed (run_db then uses SessionLocal).
+    """
+    global _async_engine, _async_session_factory, _async_loop
+    if _async_engine is not None or not (ASYNC_DB_ENABLED and ASYNC_DATABASE_URL):
+        return
+    try:
+        from sqlalchemy.ext.asyncio import (async_sessionmaker,
+                                            create_async_engine)
+
+        _async_engine = create_async_engine(
+            ASYNC_DATABASE_URL,
+            echo=ASYNC_DB_SQL_CONFIG.echo,
+            pool_size=ASYNC_DB_POOL_SIZE,
+            max_overflow=ASYNC_DB_MAX_OVERFLOW,
+            pool_timeout=30,
+            pool_recycle=280,
+            pool_pre_ping=True,
+        )
+    except ImportError as e:
+        logging_utility.warning(f"Async DB engine unavailable ({e}); using the sync pool.")
+        return
+    instrument_engine(_async_engine.sync_engine, "async", ASYNC_DB_SQL_CONFIG)
+    _async_session_factory = async_sessionmaker(
+        _async_engine, autoflush=False, expire_on_commit=False
+    )
+    _async_loop = asyncio.get_running_loop()
+
+
+async def stop_async_engine() -> None:
+    """Close the async pool on shutdown, from the loop that started it."""
+    global _async_engine, _async_session_factory, _async_loop
+    engine_to_dispose = _async_engine
+    _async_engine = _async_session_factory = _async_loop = None
+    if engine_to_dispose is not None:
+        await engine_to_dispose.dispose()
+
+
+def get_async_sessionmaker():
+    """
+    The AsyncSession factory when called on the loop that owns the async
+    engine, else None (callers then use SessionLocal).
+    """
+    if _async_session_factory is None:
+        return None
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    return _async_session_factory if loop is _async_loop else None
+
+
+async def run_db(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run `fn(session, *args, **kwargs)` — plain sync ORM code — without a
+    thread hop.
+
+    On the async engine the function runs via AsyncSession.run_sync on the
+    event loop (I/O is awaited under the hood), so service bodies are shared
+    verbatim between sync routes and the async hot path. Falls back to a
+    SessionLocal session in a worker thread.
+    """
+    factory = get_async_sessionmaker()
+    if factory is not None:
+        async with factory() as session:
+            return await session.run_sync(fn, *args, **kwargs)
+
+    def _sync():
+        with SessionLocal() as session:
+            return fn(session, *args, **kwargs)
+
+    return await asyncio.to_thread(_sync)
+
+
 # 3. The ONE authoritative dependency for getting a DB session
 def get_db():
     """
@@ -69,6 +255,15 @@ def get_db():
         db.close()
 
 
+def get_read_db():
+    """get_db() for read-only routes; see ReadSessionLocal()."""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 # Optional: You can also move the wait logic here to keep all DB startup
 # code together, which makes app.py even cleaner.
 
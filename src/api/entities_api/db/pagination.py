@@ -0,0 +1,83 @@
+# src/api/entities_api/db/pagination.py
+"""
+Keyset (cursor) pagination over (created_at, id).
+
+List endpoints take `after` / `before` object ids. The cursor row's
+created_at is resolved inside the caller's already-filtered query, so a
+cursor from another thread or user is simply "not found", and each page is
+an index range scan of (scope, created_at) — O(page), not O(offset).
+
+    after=X   → the page that follows X in the requested order
+    before=X  → the page that precedes X in the requested order
+"""
+
+from typing import Any, List, Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import and_, or_
+
+
+def _beyond(model, created_at: int, row_id: str, ascending: bool):
+    """Rows strictly past (created_at, row_id) in the given direction."""
+    if ascending:
+        return or_(
+            model.created_at > created_at,
+            and_(model.created_at == created_at, model.id > row_id),
+        )
+    return or_(
+        model.created_at < created_at,
+        and_(model.created_at == created_at, model.id < row_id),
+    )
+
+
+def _anchor(query, model, cursor_id: str) -> int:
+    created_at = query.with_entities(model.created_at).filter(model.id == cursor_id).scalar()
+    if created_at is None:
+        raise HTTPException(status_code=400, detail=f"Invalid pagination cursor: {cursor_id}")
+    return created_at
+
+
+def filter_after(query, model, cursor_id: str, ascending: bool = True):
+    """Restrict `query` to rows past `cursor_id` (resolved within `query`)."""
+    return query.filter(_beyond(model, _anchor(query, model, cursor_id), cursor_id, ascending))
+
+
+def keyset_page(
+    query,
+    model,
+    *,
+    limit: int,
+    order: str = "asc",
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+) -> Tuple[List[Any], bool]:
+    """
+    Apply cursors, ordering and limit to `query` (already scoped by the
+    caller). Returns (rows in requested order, has_more), where has_more
+    refers to the direction being paged.
+    """
+    ascending = order != "desc"
+
+    scoped = query
+    if after:
+        query = filter_after(scoped, model, after, ascending)
+    if before:
+        query = query.filter(_beyond(model, _anchor(scoped, model, before), before, not ascending))
+
+    # Paging backwards: read nearest-first, then restore the requested order.
+    backwards = bool(before) and not after
+    forward = ascending != backwards
+    query = query.order_by(
+        *(
+            (model.created_at.asc(), model.id.asc())
+            if forward
+            else (model.created_at.desc(), model.id.desc())
+        )
+    )
+
+    rows = query.limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if backwards:
+        rows.reverse()
+    return rows, has_more
@@ -0,0 +1,188 @@
+# src/api/entities_api/db/replicas.py
+"""
+Read-replica routing for the sync session factories.
+
+DATABASE_REPLICA_URLS (comma-separated) lists read replicas of the main
+database. ReadSessionLocal() (db/database.py) asks the router for an
+engine; it gets a replica only when all of the following hold, otherwise
+the primary:
+
+  * at least one replica is configured and healthy;
+  * the caller is not inside primary_pinned() — runs pin themselves so
+    the orchestrator always reads its own writes;
+  * the replica's last measured lag is within DB_REPLICA_MAX_LAG_SECONDS.
+
+Lag is read from SHOW REPLICA STATUS (SHOW SLAVE STATUS on older servers)
+at most every DB_REPLICA_LAG_CHECK_SECONDS per replica, by whichever caller
+finds the measurement stale; everyone else uses the last value. A replica
+whose check fails, or that reports no running replication thread, is
+skipped until the next successful check. Endpoints that are not classic
+replicas (a managed reader endpoint returns no status row) count as
+lag 0.
+
+  DB_REPLICA_MAX_LAG_SECONDS    — staleness tolerated for routed reads (default 5)
+  DB_REPLICA_LAG_CHECK_SECONDS  — lag measurement interval             (default 5)
+  DB_REPLICA_LAG_CHECK          — "false" trusts replicas unconditionally
+"""
+
+import contextvars
+import itertools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+from projectdavid_common import UtilsInterface
+from sqlalchemy import text
+
+logging_utility = UtilsInterface.LoggingUtility()
+
+DB_REPLICA_MAX_LAG_SECONDS = float(os.getenv("DB_REPLICA_MAX_LAG_SECONDS", "5"))
+DB_REPLICA_LAG_CHECK_SECONDS = float(os.getenv("DB_REPLICA_LAG_CHECK_SECONDS", "5"))
+DB_REPLICA_LAG_CHECK = os.getenv("DB_REPLICA_LAG_CHECK", "true").lower() == "true"
+
+_LAG_COLUMNS = ("Seconds_Behind_Source", "Seconds_Behind_Master")
+
+_pinned: contextvars.ContextVar[bool] = contextvars.ContextVar("db_primary_pinned", default=False)
+
+
+@contextmanager
+def primary_pinned():
+    """
+    Route every read inside this block to the primary (read-your-writes).
+
+    The flag is a contextvar, so it follows asyncio tasks and
+    asyncio.to_thread() calls started inside the block.
+    """
+    token = _pinned.set(True)
+    try:
+        yield
+    finally:
+        try:
+            _pinned.reset(token)
+        except ValueError:
+            # An async generator closed from another context (client
+            # disconnect); that context never saw the pin.
+            pass
+
+
+def is_primary_pinned() -> bool:
+    return _pinned.get()
+
+
+def parse_replica_urls(raw: Optional[str]) -> List[str]:
+    return [url.strip() for url in (raw or "").split(",") if url.strip()]
+
+
+class _Replica:
+    def __init__(self, name: str, engine):
+        self.name = name
+        self.engine = engine
+        self.lag: Optional[float] = None
+        self.healthy = not DB_REPLICA_LAG_CHECK
+        self.checked_at = 0.0
+        self.error: Optional[str] = None
+        self.lock = threading.Lock()
+
+
+class ReplicaRouter:
+    """Chooses a replica engine for a read session, or None for the primary."""
+
+    def __init__(self, replicas: Dict[str, Any]):
+        self._replicas = [_Replica(name, engine) for name, engine in replicas.items()]
+        self._cycle = itertools.count()
+        self.routed = 0
+        self.fallbacks = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._replicas)
+
+    def pick(self):
+        """A healthy replica engine (round-robin), or None to use the primary."""
+        if not self._replicas or is_primary_pinned():
+            return None
+
+        start = next(self._cycle)
+        for offset in range(len(self._replicas)):
+            replica = self._replicas[(start + offset) % len(self._replicas)]
+            self._refresh(replica)
+            if replica.healthy:
+                self.routed += 1
+                return replica.engine
+
+        self.fallbacks += 1
+        return None
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "max_lag_seconds": DB_REPLICA_MAX_LAG_SECONDS,
+            "routed": self.routed,
+            "fallbacks": self.fallbacks,
+            "replicas": [
+                {
+                    "name": r.name,
+                    "healthy": r.healthy,
+                    "lag_seconds": r.lag,
+                    "checked_at": r.checked_at or None,
+                    "error": r.error,
+                }
+                for r in self._replicas
+            ],
+        }
+
+    # ------------------------------------------------------------------
+    # Lag measurement
+    # ------------------------------------------------------------------
+
+    def _refresh(self, replica: _Replica) -> None:
+        if not DB_REPLICA_LAG_CHECK:
+            return
+        if time.monotonic() - replica.checked_at < DB_REPLICA_LAG_CHECK_SECONDS:
+            return
+        # One caller measures; the rest use the previous result.
+        if not replica.lock.acquire(blocking=False):
+            return
+        try:
+            try:
+                lag = self._measure_lag(replica.engine)
+                replica.error = None
+            except Exception as exc:
+                lag = None
+                if replica.error is None:
+                    logging_utility.warning(
+                        f"Replica '{replica.name}' lag check failed; reading from primary: {exc}"
+                    )
+                replica.error = str(exc)
+
+            was_healthy = replica.healthy
+            replica.lag = lag
+            replica.healthy = lag is not None and lag <= DB_REPLICA_MAX_LAG_SECONDS
+            replica.checked_at = time.monotonic()
+            if was_healthy and not replica.healthy and lag is not None:
+                logging_utility.warning(
+                    f"Replica '{replica.name}' is {lag:.0f}s behind; reading from primary."
+                )
+        finally:
+            replica.lock.release()
+
+    @staticmethod
+    def _measure_lag(engine) -> Optional[float]:
+        """
+        Seconds behind the primary; 0.0 when the server reports no
+        replication status; None when replication is not running.
+        """
+        with engine.connect() as conn:
+            try:
+                row = conn.execute(text("SHOW REPLICA STATUS")).mappings().first()
+            except Exception:
+                conn.rollback()
+                row = conn.execute(text("SHOW SLAVE STATUS")).mappings().first()
+        if row is None:
+            return 0.0
+        for column in _LAG_COLUMNS:
+            if column in row:
+                value = row[column]
+                return float(value) if value is not None else None
+        return None
@@ -1,3 +1,4 @@
+import asyncio
 import os
 from datetime import datetime
 from typing import Optional
@@ -18,6 +19,7 @@ from entities_api.cache.web_cache import WebSessionCache
 from entities_api.services.scratchpad_service import ScratchpadService
 from entities_api.services.web_reader import UniversalWebReader
 # --- DB & MODEL IMPORTS ---
+from src.api.entities_api.cache.api_key_cache import get_api_key_cache
 from src.api.entities_api.db.database import get_db
 from src.api.entities_api.models.models import ApiKey, User
 
@@ -74,7 +76,19 @@ async def get_api_key(
 
     key = db.query(ApiKey).filter(ApiKey.prefix == prefix, ApiKey.is_active.is_(True)).first()
 
-    if not key or not key.verify_key(api_key_header):
+    # bcrypt is the source of truth, but only on a cache miss: a key verified
+    # against this exact hash in the last API_KEY_CACHE_TTL seconds is trusted
+    # without re-hashing. The row (is_active, expires_at) is always read fresh.
+    verified = False
+    if key:
+        key_cache = get_api_key_cache()
+        verified = await key_cache.is_verified(prefix, api_key_header, key.hashed_key)
+        if not verified:
+            verified = await asyncio.to_thread(key.verify_key, api_key_header)
+            if verified:
+                await key_cache.mark_verified(prefix, api_key_header, key.hashed_key)
+
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or inactive API Key.",
@@ -0,0 +1,34 @@
+# src/api/entities_api/middleware.py
+from contextlib import nullcontext
+
+from starlette.datastructures import Headers
+
+from src.api.entities_api.db.replicas import primary_pinned
+from src.api.entities_api.observability.sql_instrumentation import query_scope
+
+
+class RequestScopeMiddleware:
+    """
+    Per-request context for HTTP requests, as one pure ASGI layer.
+
+      - query_scope("http"): SQL statement count / time on the request span.
+      - X-Read-Consistency: strong pins every read to the primary, for
+        clients that need read-your-writes (e.g. polling straight after a
+        write). Other reads may go to a replica.
+
+    Unlike @app.middleware("http") there is no BaseHTTPMiddleware task hop,
+    and both scopes stay open while a streaming body is sent.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        consistency = Headers(scope=scope).get("x-read-consistency", "")
+        pin = primary_pinned() if consistency.lower() == "strong" else nullcontext()
+        with query_scope("http"), pin:
+            await self.app(scope, receive, send)
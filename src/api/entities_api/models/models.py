@@ -295,6 +295,15 @@ class Message(Base):
     #   b) purge_orphaned_threads daemon (periodic background cleanup)
     thread_id = Column(String(64), nullable=False)
     sender_id = Column(String(64), nullable=True)
+    blob_refs = Column(
+        JSON,
+        nullable=True,
+        comment="Per-field refs (path, sha256, size) for content offloaded to file storage.",
+    )
+
+    # Thread history loads, message listing and the purge daemons all filter
+    # by thread and order by created_at.
+    __table_args__ = (Index("idx_messages_thread_created", "thread_id", "created_at"),)
 
 
 class Run(Base):
@@ -377,6 +386,8 @@ class Run(Base):
 
     actions = relationship("Action", back_populates="run")
 
+    __table_args__ = (Index("idx_runs_thread_created", "thread_id", "created_at"),)
+
 
 class Assistant(Base):
     __tablename__ = "assistants"
@@ -540,6 +551,8 @@ class Action(Base):
     # --- Relationships ---
     run = relationship("Run", back_populates="actions")
 
+    __table_args__ = (Index("idx_actions_run_status", "run_id", "status"),)
+
     @staticmethod
     def get_full_action_query(session):
         return session.query(Action).options(joinedload(Action.run))
@@ -572,6 +585,11 @@ class File(Base):
     filename = Column(String(256), nullable=False)
     purpose = Column(String(64), nullable=False)
     mime_type = Column(String(255))
+    sha256 = Column(
+        String(64),
+        nullable=True,
+        comment="Hex SHA-256 of the content, computed while streaming the upload",
+    )
 
     # ── GDPR / Lifecycle ────────────────────────────────────────────
     deleted_at = Column(
@@ -629,6 +647,31 @@ class FileStorage(Base):
     __table_args__ = (Index("idx_file_storage_file_id", "file_id"),)
 
 
+class FileBlob(Base):
+    """
+    One stored object per distinct file content (see services/file_blobs.py).
+    ref_count is the number of FileStorage rows pointing at storage_path.
+    """
+
+    __tablename__ = "file_blobs"
+    sha256 = Column(String(64), primary_key=True, comment="Hex SHA-256 of the content")
+    storage_system = Column(String(64), nullable=False, default="samba")
+    storage_path = Column(
+        String(512),
+        nullable=False,
+        unique=True,
+        comment="Content-addressed path (relative to share root)",
+    )
+    bytes = Column(BigInteger, nullable=False)
+    ref_count = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="FileStorage rows referencing this object; 0 = awaiting physical delete",
+    )
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
 class BatfishSnapshot(Base):
     __tablename__ = "batfish_snapshots"
 
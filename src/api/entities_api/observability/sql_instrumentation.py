@@ -0,0 +1,217 @@
+# src/api/entities_api/observability/sql_instrumentation.py
+"""
+SQL instrumentation on SQLAlchemy engine events — replaces echo=True.
+
+Per engine (configured by env prefix, e.g. DB_, SPECIAL_DB_, ASYNC_DB_):
+
+  {PREFIX}SQL_ECHO            — "true" keeps SQLAlchemy's full echo (debug only)
+  {PREFIX}SLOW_QUERY_MS       — statements slower than this are logged (default 200)
+  {PREFIX}SQL_SAMPLE_RATE     — fraction of the remaining statements logged (default 0)
+
+Every statement is timed into a per-engine histogram (in-process, plus an
+OTel histogram when a meter provider is configured). Logged statements use
+a normalised fingerprint — literals and IN-lists collapsed — never bound
+parameters.
+
+query_scope() opens a per-request / per-run counter; the count and total
+time are attached to the scope's active OTel span as db.query_count and
+db.query_time_ms.
+"""
+
+import contextvars
+import os
+import random
+import re
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from projectdavid_common import UtilsInterface
+from sqlalchemy import event
+
+logging_utility = UtilsInterface.LoggingUtility()
+
+# Histogram bucket upper bounds, milliseconds.
+_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+_FINGERPRINT_MAX = 300
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAM_MARKER = re.compile(r"%\(\w+\)s|%s|:\w+|\?")
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*\?\s*,?)+\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """Normalise a statement so identical shapes group together."""
+    fp = _STRING_LITERAL.sub("?", statement)
+    fp = _PARAM_MARKER.sub("?", fp)
+    fp = _NUMBER_LITERAL.sub("?", fp)
+    fp = _IN_LIST.sub("IN (?+)", fp)
+    fp = _WHITESPACE.sub(" ", fp).strip()
+    return fp[:_FINGERPRINT_MAX]
+
+
+@dataclass
+class EngineSQLConfig:
+    echo: bool = False
+    slow_query_ms: float = 200.0
+    sample_rate: float = 0.0
+
+    @classmethod
+    def from_env(cls, prefix: str) -> "EngineSQLConfig":
+        return cls(
+            echo=os.getenv(f"{prefix}SQL_ECHO", "false").lower() == "true",
+            slow_query_ms=float(os.getenv(f"{prefix}SLOW_QUERY_MS", "200")),
+            sample_rate=float(os.getenv(f"{prefix}SQL_SAMPLE_RATE", "0")),
+        )
+
+
+class QueryHistogram:
+    """Fixed-bucket latency histogram; thread-safe."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.counts: List[int] = [0] * (len(_BUCKETS_MS) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+        self.slow = 0
+
+    def observe(self, elapsed_ms: float, slow: bool) -> None:
+        with self._lock:
+            self.counts[bisect_left(_BUCKETS_MS, elapsed_ms)] += 1
+            self.total += 1
+            self.sum_ms += elapsed_ms
+            self.slow += int(slow)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            buckets = {f"le_{b}ms": c for b, c in zip(_BUCKETS_MS, self.counts)}
+            buckets["le_inf"] = self.counts[-1]
+            return {
+                "count": self.total,
+                "sum_ms": round(self.sum_ms, 3),
+                "slow": self.slow,
+                "buckets": buckets,
+            }
+
+
+@dataclass
+class QueryStats:
+    scope: str
+    count: int = 0
+    time_ms: float = 0.0
+    span: Any = None
+
+
+_current_stats: contextvars.ContextVar[Optional[QueryStats]] = contextvars.ContextVar(
+    "sql_query_stats", default=None
+)
+_histograms: Dict[str, QueryHistogram] = {}
+_instrumented: "weakref.WeakSet" = weakref.WeakSet()
+_instrumented_lock = threading.Lock()
+_otel_histogram = None
+
+
+def _get_otel_histogram():
+    global _otel_histogram
+    if _otel_histogram is None:
+        try:
+            from opentelemetry import metrics
+
+            _otel_histogram = metrics.get_meter("entities_api.sql").create_histogram(
+                "db.client.query.duration", unit="ms", description="SQL statement latency"
+            )
+        except Exception:
+            _otel_histogram = False
+    return _otel_histogram or None
+
+
+def _current_span():
+    try:
+        from opentelemetry import trace
+
+        span = trace.get_current_span()
+        return span if span.is_recording() else None
+    except Exception:
+        return None
+
+
+@contextmanager
+def query_scope(scope: str):
+    """Count the statements issued inside this block (request / run)."""
+    stats = QueryStats(scope=scope)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _record_scope(elapsed_ms: float) -> None:
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    stats.count += 1
+    stats.time_ms += elapsed_ms
+    if stats.span is None:
+        stats.span = _current_span()
+    if stats.span is not None:
+        stats.span.set_attribute("db.query_count", stats.count)
+        stats.span.set_attribute("db.query_time_ms", round(stats.time_ms, 3))
+
+
+def instrument_engine(engine, name: str, config: EngineSQLConfig) -> None:
+    """
+    Attach timing listeners. Pass AsyncEngine.sync_engine for async engines.
+    Idempotent: an engine is only ever instrumented once.
+    """
+    with _instrumented_lock:
+        if engine in _instrumented:
+            return
+        _instrumented.add(engine)
+    histogram = _histograms.setdefault(name, QueryHistogram())
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("_query_start")
+        if not starts:
+            return
+        elapsed_ms = (time.perf_counter() - starts.pop()) * 1000.0
+        slow = elapsed_ms >= config.slow_query_ms
+
+        histogram.observe(elapsed_ms, slow)
+        otel = _get_otel_histogram()
+        if otel is not None:
+            otel.record(elapsed_ms, {"db.engine": name})
+        _record_scope(elapsed_ms)
+
+        if slow:
+            logging_utility.warning(
+                "[SQL:%s] slow %.1fms rows=%s | %s",
+                name,
+                elapsed_ms,
+                getattr(cursor, "rowcount", -1),
+                fingerprint(statement),
+            )
+        elif config.sample_rate and random.random() < config.sample_rate:
+            logging_utility.info("[SQL:%s] %.1fms | %s", name, elapsed_ms, fingerprint(statement))
+
+    @event.listens_for(engine, "handle_error")
+    def _on_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("_query_start"):
+            conn.info["_query_start"].pop()
+
+
+def sql_metrics() -> Dict[str, Any]:
+    """Per-engine latency histograms for this process."""
+    return {name: h.snapshot() for name, h in _histograms.items()}
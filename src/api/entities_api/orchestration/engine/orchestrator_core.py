@@ -30,7 +30,9 @@ from entities_api.cache.assistant_cache import AssistantCache
 from entities_api.dependencies import get_redis_sync
 from entities_api.platform_tools.delegated_model_map.delegation_model_map import \
     get_delegated_model
-from entities_api.utils.assistant_manager import AssistantManager
+from src.api.entities_api.cache.ephemeral_pool import (
+    ROLE_RESEARCH_SUPERVISOR, ROLE_SENIOR_ENGINEER, ROLE_THREAD,
+    get_ephemeral_pool)
 from src.api.entities_api.constants.platform import PLATFORM_TOOLS
 # Mixins
 from src.api.entities_api.orchestration.mixins.code_interpreter_mixin import \
@@ -212,27 +214,26 @@ class OrchestratorCore(
             )
             return
 
-        assistant_manager = AssistantManager()
+        # Leased from the pre-warmed pool; falls back to inline creation on a miss.
+        pool = get_ephemeral_pool()
 
         # ==========================================
         # PATH A: DEEP RESEARCH SWAP
         # ==========================================
         if self.is_deep_research:
             LOG.critical("██████ [DEEP_RESEARCH_MODE_ACTIVE] ██████")
-            ephemeral_lead = await assistant_manager.create_ephemeral_research_supervisor(
-                user_id=user_id
-            )
-            self._worker_thread = await assistant_manager.create_ephemeral_thread(user_id=user_id)
+            self._ephemeral_role = ROLE_RESEARCH_SUPERVISOR
+            ephemeral_lead = await pool.lease(ROLE_RESEARCH_SUPERVISOR, user_id)
+            self._worker_thread = await pool.lease(ROLE_THREAD, user_id)
 
         # ==========================================
         # PATH B: ENGINEER SWAP
         # ==========================================
         elif is_engineer_active:
             LOG.critical("██████ [ENGINEER_MODE_ACTIVE] ██████")
-            ephemeral_lead = await assistant_manager.create_ephemeral_senior_engineer(
-                user_id=user_id
-            )
-            self._worker_thread = await assistant_manager.create_ephemeral_thread(user_id=user_id)
+            self._ephemeral_role = ROLE_SENIOR_ENGINEER
+            ephemeral_lead = await pool.lease(ROLE_SENIOR_ENGINEER, user_id)
+            self._worker_thread = await pool.lease(ROLE_THREAD, user_id)
 
         # ==========================================
         # COMMON IDENTITY SWAP LOGIC
@@ -428,6 +429,10 @@ class OrchestratorCore(
         - failed_at    : written on stream failure, max-turn failsafe, or outer exception
         - last_error   : written on failure paths
         - incomplete_details : written on max-turn failsafe
+
+        started_at / current_turn are buffered in Redis (RunStateBuffer) and
+        land in MySQL with the turn's status transition; terminal stamps write
+        through. A final flush in the teardown guarantees nothing is left behind.
         """
 
         self._scratch_pad_thread = None
@@ -637,12 +642,19 @@ class OrchestratorCore(
         # IDENTITY TEARDOWN — ALWAYS EXECUTES
         # ----------------------------------------------------------------------
         finally:
+            await self._native_exec.flush_run_state(run_id)
+            try:
+                await self.flush_stream_shunts()
+            except Exception as e:
+                LOG.warning(f"STREAM-SHUNT ▸ Final flush failed for run {run_id}: {e}")
+
             if self.ephemeral_supervisor_id:
                 try:
                     await self._ephemeral_clean_up(
                         assistant_id=self.ephemeral_supervisor_id,
                         thread_id=thread_id,
                         delete_thread=False,
+                        role=getattr(self, "_ephemeral_role", None),
                     )
                 except Exception as cleanup_exc:
                     LOG.warning(
@@ -651,6 +663,7 @@ class OrchestratorCore(
 
             self.assistant_id = _original_assistant_id
             self.ephemeral_supervisor_id = None
+            self._ephemeral_role = None
 
             LOG.info(
                 f"ORCHESTRATOR ▸ Identity restored to {_original_assistant_id}. "
@@ -1,4 +1,3 @@
-from functools import lru_cache
 from typing import Optional, TypeVar
 
 from dotenv import load_dotenv
@@ -8,6 +7,8 @@ from projectdavid_common.utilities.logging_service import LoggingUtility
 # Import your AsyncHyperbolicClient definition
 from entities_api.clients.unified_async_client import (
     _ACTIVE_CLIENTS, AsyncUnifiedInferenceClient)
+from src.api.entities_api.services.service_container import \
+    get_service_container
 
 load_dotenv()
 LOG = LoggingUtility()
@@ -21,35 +22,25 @@ T = TypeVar("T")
 class ClientFactoryMixin:
     """
     Factory / cache for external SDK clients.
+
+    Clients are cached in the process-level ServiceContainer keyed by
+    credentials (LRU-bounded), not per worker instance.
     """
 
-    @lru_cache(maxsize=32)
     def _get_project_david_client(
         self, *, api_key: Optional[str], base_url: Optional[str]
     ) -> Entity:
         if not api_key or not base_url:
             raise RuntimeError("api_key + base_url required for Entity client")
-        try:
-            return Entity(api_key=api_key, base_url=base_url)
-        except Exception as exc:
-            LOG.error("Project-David client init failed: %s", exc, exc_info=True)
-            raise
 
-    @lru_cache(maxsize=32)
-    def _get_unified_client(
-        self, *, api_key: Optional[str], base_url: Optional[str]
-    ) -> AsyncUnifiedInferenceClient:
-        """
-        Returns a cached AsyncHyperbolicClient.
-        NOTE: This caches the CONNECTION POOL, which improves performance.
-        """
-        if not api_key or not base_url:
-            raise RuntimeError("api_key + base_url required for Hyperbolic client")
-        try:
-            return AsyncUnifiedInferenceClient(api_key=api_key, base_url=base_url)
-        except Exception as exc:
-            LOG.error("Hyperbolic client init failed: %s", exc, exc_info=True)
-            raise
+        def _build() -> Entity:
+            try:
+                return Entity(api_key=api_key, base_url=base_url)
+            except Exception as exc:
+                LOG.error("Project-David client init failed: %s", exc, exc_info=True)
+                raise
+
+        return get_service_container().bounded((Entity, api_key, base_url), _build)
 
     def _get_cached_unified_client(
         self, api_key: str, base_url: str, enable_logging: bool = False
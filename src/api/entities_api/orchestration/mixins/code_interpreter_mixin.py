@@ -15,7 +15,7 @@ from projectdavid_common.validation import StatusEnum
 
 from src.api.entities_api.services.logging_service import LoggingUtility
 from src.api.entities_api.services.native_execution_service import \
-    NativeExecutionService
+    get_native_execution_service
 
 LOG = LoggingUtility()
 
@@ -75,7 +75,7 @@ class CodeInterpreterMixin:
         # 1. Notify start
         yield self._code_status("Preparing code interpreter...", "in_progress", run_id)
 
-        native_svc = NativeExecutionService()
+        native_svc = get_native_execution_service()
 
         # --- VALIDATION ---
         validator = ToolValidator()
@@ -142,6 +142,8 @@ class CodeInterpreterMixin:
 
         uploaded_files: List[dict] = []
         hot_code_buffer: List[str] = []
+        # Live, append-only copy of the sandbox output (GET /actions/{id}/output).
+        output_log = native_svc.open_action_output(action.id)
         decoder = json.JSONDecoder()
         stream_buffer = ""
         execution_had_error = False
@@ -192,6 +194,7 @@ class CodeInterpreterMixin:
                         if content is not None:
                             clean_content = str(content).replace("\\n", "\n")
                             hot_code_buffer.append(clean_content)
+                            output_log.push({"c": clean_content + "\n"})
 
                             is_error_line = (
                                 ctype == "stderr"
@@ -255,6 +258,8 @@ class CodeInterpreterMixin:
                 "error",
                 run_id,
             )
+        finally:
+            await output_log.close()
 
         # ------------------------------------------------------------------
         # PHANTOM FILE DETECTION (Self-Healing Logic)
@@ -387,6 +392,14 @@ class CodeInterpreterMixin:
         except Exception as e:
             LOG.error(f"CodeInterpreter ▸ Submission failure: {e}")
             yield self._code_status(f"Tool output submission failed: {e}", "error", run_id)
+            return
+
+        # 8. Compact the output log — a failure here must not touch the status
+        if action:
+            try:
+                await native_svc.complete_action_output(action.id, raw_output, status=status_val)
+            except Exception as e:
+                LOG.error(f"CodeInterpreter ▸ Output compaction failed: {e}")
 
     def process_hot_code_buffer(
         self,
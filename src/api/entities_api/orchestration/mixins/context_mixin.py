@@ -530,12 +530,14 @@ class ContextMixin:
                 lean_hist = []
 
             # Store lean in Redis — never store hydrated base64
-            self.message_cache.set_history_sync(thread_id, lean_hist)
+            await self.message_cache.set_history(thread_id, lean_hist)
             msgs = lean_hist
 
         else:
-            # Hot path — Redis returns lean messages with file_id refs
-            msgs = self.message_cache.get_history_sync(thread_id)
+            # Hot path — Redis returns lean messages with file_id refs. A miss
+            # cold-loads on the async engine with blob reads on a worker
+            # thread; the sync variant would block the loop on SMB.
+            msgs = await self.message_cache.get_history(thread_id)
             LOG.debug(f"[CTX-CACHE] Redis hit for {thread_id}")
 
         # 3. Hydrate images just-in-time — resolve file_ids → base64 right
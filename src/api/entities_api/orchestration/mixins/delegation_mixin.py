@@ -3,14 +3,17 @@ from __future__ import annotations
 import asyncio
 import json
 import os
-import threading
 from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator, Callable, Dict, Optional
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, Dict, List, Optional
 
-from projectdavid.events import ScratchpadEvent
 from projectdavid_common.utilities.logging_service import LoggingUtility
 from projectdavid_common.validation import StatusEnum
 
+from src.api.entities_api.cache.ephemeral_pool import (
+    ROLE_JUNIOR_ENGINEER, ROLE_RESEARCH_WORKER, ROLE_THREAD, get_ephemeral_pool)
+from src.api.entities_api.platform_tools.delegated_model_map.delegation_model_map import \
+    get_delegated_model
 from src.api.entities_api.services.native_execution_service import \
     NativeExecutionService
 from src.api.entities_api.utils.assistant_manager import AssistantManager
@@ -21,6 +24,67 @@ _TERMINAL_RUN_STATES = {"completed", "failed", "cancelled", "expired"}
 _WORKER_RUN_TIMEOUT = 1200
 _WORKER_POLL_INTERVAL = 2.0
 
+# Sibling delegate_research_task calls in one supervisor turn run concurrently,
+# at most DELEGATION_MAX_CONCURRENCY workers at a time. The join policy decides
+# when the supervisor stops waiting:
+#   all      → every worker finishes (bounded by _WORKER_RUN_TIMEOUT)
+#   first_k  → the first DELEGATION_JOIN_K workers finish; the rest are cancelled
+#   timeout  → whatever finished within DELEGATION_JOIN_TIMEOUT_SECONDS
+DELEGATION_MAX_CONCURRENCY = int(os.getenv("DELEGATION_MAX_CONCURRENCY", "3"))
+DELEGATION_JOIN_POLICY = os.getenv("DELEGATION_JOIN_POLICY", "all").lower()
+DELEGATION_JOIN_K = int(os.getenv("DELEGATION_JOIN_K", "1"))
+DELEGATION_JOIN_TIMEOUT = float(os.getenv("DELEGATION_JOIN_TIMEOUT_SECONDS", "600"))
+
+# Worker chunk types that describe tool activity rather than output. They are
+# logged and swallowed — the supervisor only sees the worker's final text.
+_WORKER_TOOL_EVENT_TYPES = {
+    "tool_call_manifest",
+    "function_call",
+    "call_arguments",
+    "web_status",
+    "code_status",
+    "shell_status",
+    "research_status",
+    "engineer_status",
+}
+
+
+@dataclass
+class WorkerEvent:
+    """
+    A single chunk from an in-process worker, decoded once.
+
+    Worker process_conversation() yields JSON strings (occasionally dicts or
+    StreamEvent objects); this normalises all three so the delegation loop
+    can dispatch on `type` without re-parsing.
+    """
+
+    type: str
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_chunk(cls, chunk: Any) -> "WorkerEvent":
+        if isinstance(chunk, str):
+            try:
+                data = json.loads(chunk)
+            except json.JSONDecodeError:
+                return cls(type="content", data={"content": chunk})
+        elif isinstance(chunk, dict):
+            data = chunk
+        elif hasattr(chunk, "model_dump"):
+            data = chunk.model_dump()
+        else:
+            data = {"content": str(chunk)}
+
+        if not isinstance(data, dict):
+            return cls(type="content", data={"content": str(data)})
+        return cls(type=str(data.get("type") or "unknown"), data=data)
+
+    @property
+    def content(self) -> Optional[str]:
+        value = self.data.get("content") or self.data.get("text")
+        return value if isinstance(value, str) else None
+
 
 class DelegationMixin:
 
@@ -44,45 +108,69 @@ class DelegationMixin:
     # EMISSION HELPER
     # ------------------------------------------------------------------
 
-    def _research_status(self, activity: str, state: str, run_id: str) -> str:
-        return json.dumps(
-            {
-                "type": "research_status",
-                "activity": activity,
-                "state": state,
-                "tool": "delegate_research_task",
-                "run_id": run_id,
-            }
-        )
+    def _research_status(
+        self, activity: str, state: str, run_id: str, task_id: Optional[str] = None
+    ) -> str:
+        payload = {
+            "type": "research_status",
+            "activity": activity,
+            "state": state,
+            "tool": "delegate_research_task",
+            "run_id": run_id,
+        }
+        if task_id is not None:
+            payload["task_id"] = task_id
+        return json.dumps(payload)
 
     # ------------------------------------------------------------------
-    # HELPER: Bridges blocking generators to async loop
+    # HELPER: Runs a worker in-process on the current event loop
     # ------------------------------------------------------------------
 
-    async def _stream_sync_generator(
-        self, generator_func: Callable, *args, **kwargs
-    ) -> AsyncGenerator[Any, None]:
-        queue = asyncio.Queue()
-        loop = asyncio.get_running_loop()
-
-        def producer():
-            try:
-                for item in generator_func(*args, **kwargs):
-                    loop.call_soon_threadsafe(queue.put_nowait, item)
-                loop.call_soon_threadsafe(queue.put_nowait, None)
-            except Exception as e:
-                LOG.error(f"🧵[THREAD-ERR] {e}")
-                loop.call_soon_threadsafe(queue.put_nowait, e)
-
-        threading.Thread(target=producer, daemon=True).start()
+    @property
+    def _worker_selector(self):
+        # Lazy: the selector imports every provider handler, which in turn
+        # imports this mixin.
+        if getattr(self, "_worker_selector_svc", None) is None:
+            from src.api.entities_api.orchestration.engine.inference_arbiter import \
+                InferenceArbiter
+            from src.api.entities_api.orchestration.engine.inference_provider_selector import \
+                InferenceProviderSelector
+
+            arbiter = InferenceArbiter(redis=self.redis)
+            self._worker_selector_svc = InferenceProviderSelector(arbiter)
+        return self._worker_selector_svc
+
+    async def _stream_worker_events(
+        self,
+        *,
+        model: str,
+        thread_id: str,
+        assistant_id: str,
+        message_id: str,
+        run_id: str,
+        api_key: str,
+    ) -> AsyncGenerator[WorkerEvent, None]:
+        """
+        Drive a worker's process_conversation directly, without the loopback
+        HTTP call through the SDK. The handler resolves a fresh worker
+        instance per call, so no orchestrator state is shared with the caller.
+        """
+        handler, _ = self._worker_selector.select_provider(model_id=model)
 
-        while True:
-            item = await queue.get()
-            if item is None:
-                break
-            if isinstance(item, Exception):
-                raise item
-            yield item
+        agen = handler.process_conversation(
+            thread_id=thread_id,
+            message_id=message_id,
+            run_id=run_id,
+            assistant_id=assistant_id,
+            model=model,
+            stream_reasoning=False,
+            api_key=api_key,
+        )
+        try:
+            async for chunk in agen:
+                yield WorkerEvent.from_chunk(chunk)
+        finally:
+            await agen.aclose()
 
     # ------------------------------------------------------------------
     # HELPER: Poll run status until terminal (Retained for other tasks)
@@ -129,11 +217,20 @@ class DelegationMixin:
     # HELPER: Lifecycle cleanup
     # ------------------------------------------------------------------
     async def _ephemeral_clean_up(
-        self, assistant_id: str, thread_id: Optional[str], delete_thread: bool = False
+        self,
+        assistant_id: str,
+        thread_id: Optional[str],
+        delete_thread: bool = False,
+        role: Optional[str] = None,
+        user_id: Optional[str] = None,
     ):
+        """
+        Tear down ephemeral rows after a run. When `role` is given the
+        assistant was leased from the EphemeralPool and goes back to it.
+        """
         LOG.info(f"🧹[CLEANUP] Assistant: {assistant_id} | Thread: {thread_id}")
 
-        user_id = getattr(self, "_batfish_owner_user_id", None)
+        user_id = user_id or getattr(self, "_batfish_owner_user_id", None)
 
         if delete_thread and thread_id:
             try:
@@ -146,7 +243,12 @@ class DelegationMixin:
             except Exception as e:
                 LOG.warning(f"⚠️[CLEANUP] Thread delete failed: {e}")
 
-        if user_id and assistant_id:
+        if user_id and assistant_id and role:
+            try:
+                await get_ephemeral_pool().release(role, user_id, assistant_id)
+            except Exception as e:
+                LOG.warning(f"⚠️ [CLEANUP] Assistant release failed: {e}")
+        elif user_id and assistant_id:
             try:
                 await self._assistant_manager.delete_assistant(
                     assistant_id=assistant_id, user_id=user_id, permanent=True
@@ -187,32 +289,32 @@ class DelegationMixin:
     # ------------------------------------------------------------------
     # EPHEMERAL FACTORIES
     # ------------------------------------------------------------------
-    async def create_ephemeral_worker_assistant(self):
-        user_id = getattr(self, "_batfish_owner_user_id", None)
+    async def create_ephemeral_worker_assistant(self, user_id: Optional[str] = None):
+        user_id = user_id or getattr(self, "_batfish_owner_user_id", None)
         if not user_id:
             raise RuntimeError(
                 "create_ephemeral_worker_assistant: _batfish_owner_user_id has not been "
                 "resolved yet — ensure it is set before calling this method."
             )
-        return await self._assistant_manager.create_ephemeral_worker_assistant(user_id=user_id)
+        return await get_ephemeral_pool().lease(ROLE_RESEARCH_WORKER, user_id)
 
-    async def create_ephemeral_junior_engineer(self):
-        user_id = getattr(self, "_batfish_owner_user_id", None)
+    async def create_ephemeral_junior_engineer(self, user_id: Optional[str] = None):
+        user_id = user_id or getattr(self, "_batfish_owner_user_id", None)
         if not user_id:
             raise RuntimeError(
                 "create_ephemeral_junior_engineer: _batfish_owner_user_id has not been "
                 "resolved yet — ensure it is set before calling this method."
             )
-        return await self._assistant_manager.create_ephemeral_junior_engineer(user_id=user_id)
+        return await get_ephemeral_pool().lease(ROLE_JUNIOR_ENGINEER, user_id)
 
-    async def create_ephemeral_thread(self):
-        user_id = getattr(self, "_batfish_owner_user_id", None)
+    async def create_ephemeral_thread(self, user_id: Optional[str] = None):
+        user_id = user_id or getattr(self, "_batfish_owner_user_id", None)
         if not user_id:
             raise RuntimeError(
                 "create_ephemeral_thread: _batfish_owner_user_id has not been "
                 "resolved yet — ensure it is set before calling this method."
             )
-        return await self._native_exec.create_thread(user_id=user_id)
+        return await get_ephemeral_pool().lease(ROLE_THREAD, user_id)
 
     async def create_ephemeral_message(self, thread_id, content, assistant_id):
         return await self._native_exec.create_message(
@@ -221,8 +323,14 @@ class DelegationMixin:
             content=content,
         )
 
-    async def create_ephemeral_run(self, assistant_id, thread_id, meta_data: Dict | None = None):
-        user_id = getattr(self, "_batfish_owner_user_id", None)
+    async def create_ephemeral_run(
+        self,
+        assistant_id,
+        thread_id,
+        meta_data: Dict | None = None,
+        user_id: Optional[str] = None,
+    ):
+        user_id = user_id or getattr(self, "_batfish_owner_user_id", None)
         if not user_id:
             raise RuntimeError(
                 "create_ephemeral_run: _batfish_owner_user_id has not been "
@@ -277,10 +385,31 @@ class DelegationMixin:
     # HANDLER 1: Research Delegation
     # ------------------------------------------------------------------
     async def handle_delegate_research_task(
-        self, thread_id, run_id, assistant_id, arguments_dict, tool_call_id, decision
+        self,
+        thread_id,
+        run_id,
+        assistant_id,
+        arguments_dict,
+        tool_call_id,
+        decision,
+        *,
+        task_id: Optional[str] = None,
+        results: Optional[Dict[str, str]] = None,
+        scrub_api_key: bool = True,
     ) -> AsyncGenerator[str, None]:
+        """
+        Run one research worker and hand its final text back as the tool output.
 
-        self._scratch_pad_thread = thread_id
+        When called from handle_delegate_research_batch, every emitted chunk
+        carries `task_id`, the submitted output is recorded in `results`, and
+        the api_key scrub is left to the batch (siblings still need the key).
+        Per-call state (owner, threads) stays in locals: siblings share `self`.
+        """
+        tagged = {"task_id": task_id} if task_id is not None else {}
+
+        scratch_pad_thread = thread_id
+        if task_id is None:
+            self._scratch_pad_thread = scratch_pad_thread
         LOG.info(f"🔄[DELEGATE] STARTING. Run: {run_id}")
 
         if isinstance(arguments_dict, str):
@@ -291,7 +420,7 @@ class DelegationMixin:
         else:
             args = arguments_dict
 
-        yield self._research_status("Initializing delegation worker...", "in_progress", run_id)
+        yield self._research_status("Initializing delegation worker...", "in_progress", run_id, task_id)
 
         action = None
         try:
@@ -308,25 +437,27 @@ class DelegationMixin:
         ephemeral_worker = None
         ephemeral_thread = None
         execution_had_error = False
+        cancelled = False
         ephemeral_run = None
+        run_closed = False
+        action_closed = False
+        origin_user_id = getattr(self, "_batfish_owner_user_id", None)
 
         try:
-            origin_user_id = getattr(self, "_batfish_owner_user_id", None)
-
             if not origin_user_id:
                 run_obj = await self._native_exec.retrieve_run(run_id)
                 origin_user_id = run_obj.user_id
-                self._batfish_owner_user_id = origin_user_id
+                if task_id is None:
+                    self._batfish_owner_user_id = origin_user_id
 
             LOG.info(
                 "RESEARCH_DELEGATE ▸ origin_user_id=%s | scratch_pad_thread=%s",
                 origin_user_id,
-                self._scratch_pad_thread,
+                scratch_pad_thread,
             )
 
-            ephemeral_worker = await self.create_ephemeral_worker_assistant()
-            ephemeral_thread = await self.create_ephemeral_thread()
-            self._research_worker_thread = ephemeral_thread
+            ephemeral_worker = await self.create_ephemeral_worker_assistant(origin_user_id)
+            ephemeral_thread = await self.create_ephemeral_thread(origin_user_id)
 
             LOG.critical(
                 "██████ [WORKER_CREATED] id=%s name=%s deep_research=%s "
@@ -364,11 +495,12 @@ class DelegationMixin:
                 ephemeral_thread.id,
                 meta_data={
                     "batfish_owner_user_id": origin_user_id,
-                    "scratch_pad_thread": self._scratch_pad_thread,
+                    "scratch_pad_thread": scratch_pad_thread,
                 },
+                user_id=origin_user_id,
             )
 
-            yield self._research_status("Worker active. Streaming...", "in_progress", run_id)
+            yield self._research_status("Worker active. Streaming...", "in_progress", run_id, task_id)
 
             # ----------------------------------------
             # Retrieve the users inference api key
@@ -385,155 +517,105 @@ class DelegationMixin:
                     f"meta_data={run_obj.meta_data}"
                 )
 
-            sync_stream = self.project_david_client.synchronous_inference_stream
-            sync_stream.setup(
-                thread_id=ephemeral_thread.id,
-                assistant_id=ephemeral_worker.id,
-                message_id=msg.id,
-                run_id=ephemeral_run.id,
-                api_key=inference_api_key,
-            )
+            if not delegated_model:
+                delegated_model = getattr(self, "_delegation_model", None) or get_delegated_model(
+                    requested_model=""
+                )
 
             LOG.critical(
                 "🎬 WORKER STREAM STARTING - worker=%s thread=%s run=%s model=%s",
                 ephemeral_worker.id,
                 ephemeral_thread.id,
                 ephemeral_run.id,
-                "together-ai/Qwen/Qwen3-Next-80B-A3B-Instruct-FP8",
+                delegated_model,
             )
 
             captured_stream_content = ""
             raw_event_count = 0
-            passed_guard1 = 0
-            passed_guard2 = 0
+            tool_event_count = 0
 
-            async for event in self._stream_sync_generator(
-                sync_stream.stream_events,
+            async for event in self._stream_worker_events(
                 model=delegated_model,
+                thread_id=ephemeral_thread.id,
+                assistant_id=ephemeral_worker.id,
+                message_id=msg.id,
+                run_id=ephemeral_run.id,
+                api_key=inference_api_key,
             ):
                 raw_event_count += 1
-                event_type = type(event).__name__
-
-                LOG.critical(
-                    f"👀 [RAW EVENT DUMP] Event {raw_event_count} | Type: {event_type} | Payload: {getattr(event, 'model_dump', lambda: str(event))()}"
-                )
 
-                # ✅ INTERCEPT: ScratchpadEvent
-                if isinstance(event, ScratchpadEvent):
+                if event.type == "scratchpad_status":
                     LOG.critical(
-                        f"📝 [WORKER SCRATCHPAD EVENT] Action: {event.operation} | State: {event.state} | Entry: {event.entry}"
+                        f"📝 [WORKER SCRATCHPAD EVENT] Action: {event.data.get('operation')} "
+                        f"| State: {event.data.get('state')} | Entry: {event.data.get('entry')}"
+                    )
+                    yield json.dumps(
+                        {**event.data, "run_id": run_id, "origin": "research_worker", **tagged}
                     )
-
-                    payload = {
-                        "type": "scratchpad_status",
-                        "run_id": run_id,
-                        "operation": event.operation,
-                        "state": event.state,
-                        "origin": "research_worker",
-                    }
-                    if event.tool is not None:
-                        payload["tool"] = event.tool
-                    if event.activity is not None:
-                        payload["activity"] = event.activity
-                    if event.assistant_id is not None:
-                        payload["assistant_id"] = event.assistant_id
-                    entry_val = event.entry or event.content or ""
-                    if entry_val:
-                        payload["entry"] = entry_val
-
-                    yield json.dumps(payload)
                     continue
 
-                # 🛑 GUARD 1: Status Events
-                guard1_triggered = (
-                    hasattr(event, "tool")
-                    or hasattr(event, "status")
-                    or getattr(event, "type", "") == "status"
-                )
-                if guard1_triggered:
-                    # ---> CATCH INSTANT FAILURE AND READ DB ERROR <---
-                    if getattr(event, "status", None) == "failed":
-                        try:
-                            failed_run_obj = await self._native_exec.retrieve_run(ephemeral_run.id)
-                            last_err = getattr(
-                                failed_run_obj, "last_error", "No error recorded in DB"
-                            )
-                            if hasattr(last_err, "model_dump"):  # Handle DB objects
-                                last_err = last_err.model_dump()
-                            LOG.critical(
-                                f"🚨 [FATAL RUN ERROR] Engine killed the worker! DB Reason: {last_err}"
-                            )
-                        except Exception as e:
-                            LOG.critical(
-                                f"🚨[FATAL RUN ERROR] Run failed, couldn't fetch reason: {e}"
-                            )
+                if event.type in ("status", "error"):
+                    if event.data.get("status") == "failed" or event.type == "error":
+                        LOG.critical(
+                            f"🚨 [FATAL RUN ERROR] Worker {ephemeral_worker.id} reported: "
+                            f"{event.data.get('content') or event.data.get('message') or event.data}"
+                        )
                     continue
-                passed_guard1 += 1
 
-                # 🛑 GUARD 2: Tool Call Payload
-                guard2_triggered = getattr(event, "tool_calls", None) or getattr(
-                    event, "function_call", None
-                )
-                if guard2_triggered:
-                    tool_calls = getattr(event, "tool_calls", [])
-                    tc_list = tool_calls if isinstance(tool_calls, list) else [tool_calls]
-                    for tc in tc_list:
-                        func = getattr(tc, "function", None)
-                        if func:
-                            name = getattr(func, "name", "unknown")
-                            args = getattr(func, "arguments", "")
-                            LOG.critical(
-                                f"🛠️[WORKER EXECUTES TOOL] Worker {ephemeral_worker.id} called: {name} | Args: {args}"
-                            )
+                if event.type in _WORKER_TOOL_EVENT_TYPES:
+                    tool_event_count += 1
+                    LOG.critical(
+                        f"🛠️[WORKER EXECUTES TOOL] Worker {ephemeral_worker.id} "
+                        f"{event.type}: {event.data.get('tool') or event.data.get('name', '')}"
+                    )
                     continue
-                passed_guard2 += 1
-
-                chunk_content = getattr(event, "content", None) or getattr(event, "text", None)
-                chunk_reasoning = getattr(event, "reasoning", None)
 
-                if chunk_reasoning:
+                if event.type == "reasoning" and event.content:
                     yield json.dumps(
                         {
                             "stream_type": "delegation",
                             "chunk": {
                                 "type": "reasoning",
-                                "content": chunk_reasoning,
+                                "content": event.content,
                                 "run_id": run_id,
                             },
+                            **tagged,
                         }
                     )
+                    continue
 
-                if chunk_content and isinstance(chunk_content, str):
-                    captured_stream_content += chunk_content
+                if event.type == "content" and event.content:
+                    captured_stream_content += event.content
                     yield json.dumps(
                         {
                             "stream_type": "delegation",
                             "chunk": {
                                 "type": "content",
-                                "content": chunk_content,
+                                "content": event.content,
                                 "run_id": run_id,
                             },
+                            **tagged,
                         }
                     )
 
             LOG.critical(
-                "██████ [STREAM_SUMMARY] worker=%s | total_raw_events=%d | "
-                "passed_guard1=%d | passed_guard2=%d | captured_content_length=%d ██████",
+                "██████ [STREAM_SUMMARY] worker=%s | total_events=%d | "
+                "tool_events=%d | captured_content_length=%d ██████",
                 ephemeral_worker.id,
                 raw_event_count,
-                passed_guard1,
-                passed_guard2,
+                tool_event_count,
                 len(captured_stream_content),
             )
 
             yield self._research_status(
-                "Worker stream finished. Finalizing payload...", "in_progress", run_id
+                "Worker stream finished. Finalizing payload...", "in_progress", run_id, task_id
             )
 
             try:
                 await self._native_exec.update_run_status(
                     ephemeral_run.id, StatusEnum.completed.value
                 )
+                run_closed = True
             except Exception as e:
                 LOG.warning(f"⚠️ Could not manually close worker run {ephemeral_run.id}: {e}")
 
@@ -572,6 +654,8 @@ class DelegationMixin:
                 action=action,
                 is_error=execution_had_error,
             )
+            if results is not None and task_id is not None:
+                results[task_id] = final_content
 
             if action:
                 await self._native_exec.update_action_status(
@@ -582,27 +666,189 @@ class DelegationMixin:
                         else StatusEnum.failed.value
                     ),
                 )
+                action_closed = True
+
+        except asyncio.CancelledError:
+            # A sibling cut off by the batch's join policy.
+            cancelled = True
+            raise
 
         except Exception as e:
             execution_had_error = True
             LOG.error(f"❌[DELEGATE] Error: {e}", exc_info=True)
-            yield self._research_status(f"Error: {str(e)}", "error", run_id)
+            yield self._research_status(f"Error: {str(e)}", "error", run_id, task_id)
 
         finally:
+            # Never leave the worker run or the Action open on failure or
+            # cancellation.
+            outcome = StatusEnum.cancelled.value if cancelled else StatusEnum.failed.value
+            if ephemeral_run and not run_closed:
+                try:
+                    await self._native_exec.update_run_status(ephemeral_run.id, outcome)
+                except Exception as e:
+                    LOG.warning(f"⚠️ Could not close worker run {ephemeral_run.id}: {e}")
+            if action and not action_closed:
+                try:
+                    await self._native_exec.update_action_status(action.id, outcome)
+                except Exception as e:
+                    LOG.warning(f"⚠️ Could not close action {action.id}: {e}")
+
             if ephemeral_worker:
                 await self._ephemeral_clean_up(
                     ephemeral_worker.id,
                     ephemeral_thread.id if ephemeral_thread else None,
                     self._delete_ephemeral_thread,
+                    role=ROLE_RESEARCH_WORKER,
+                    user_id=origin_user_id,
                 )
 
-                # -------------------------------------------------
-                # Scrub the users inference api key from the db
-                # -------------------------------------------------
+            # -------------------------------------------------
+            # Scrub the users inference api key from the db
+            # -------------------------------------------------
+            if ephemeral_worker and scrub_api_key:
                 await self._native_exec.update_run_fields(run_id, meta_data={"api_key": "***"})
 
-            yield self._research_status(
-                "Delegation complete.",
-                "completed" if not execution_had_error else "error",
-                run_id,
+            if not cancelled:
+                yield self._research_status(
+                    "Delegation complete.",
+                    "completed" if not execution_had_error else "error",
+                    run_id,
+                    task_id,
+                )
+
+    # ------------------------------------------------------------------
+    # HANDLER 2: Concurrent Research Delegation (sibling calls in one turn)
+    # ------------------------------------------------------------------
+    async def handle_delegate_research_batch(
+        self,
+        thread_id: str,
+        run_id: str,
+        assistant_id: str,
+        calls: List[Dict[str, Any]],
+        decision: Optional[Dict] = None,
+        *,
+        max_concurrency: int = DELEGATION_MAX_CONCURRENCY,
+        join_policy: str = DELEGATION_JOIN_POLICY,
+        join_k: int = DELEGATION_JOIN_K,
+        join_timeout: float = DELEGATION_JOIN_TIMEOUT,
+    ) -> AsyncGenerator[str, None]:
+        """
+        Fan out several delegate_research_task calls as concurrent workers.
+
+        `calls` is a list of {"tool_call_id": ..., "arguments": ...}. Worker
+        chunks are multiplexed onto this generator as they arrive, each tagged
+        with `task_id` (= the tool_call_id). Workers still running when the
+        join policy is satisfied are cancelled and receive an error tool
+        output, so the supervisor's next turn sees a result for every call.
+        """
+        call_ids = [call["tool_call_id"] for call in calls]
+        if not all(call_ids) or len(set(call_ids)) != len(call_ids):
+            raise ValueError("handle_delegate_research_batch needs a unique tool_call_id per call")
+
+        if join_policy not in ("all", "first_k", "timeout"):
+            LOG.warning(f"⚠️[DELEGATE_BATCH] Unknown join policy '{join_policy}', using 'all'.")
+            join_policy = "all"
+
+        target = len(calls)
+        if join_policy == "first_k":
+            target = max(1, min(join_k, len(calls)))
+        deadline_after = join_timeout if join_policy == "timeout" else _WORKER_RUN_TIMEOUT
+
+        LOG.info(
+            "🔀[DELEGATE_BATCH] %d tasks | concurrency=%d | policy=%s | target=%d | deadline=%ss",
+            len(calls),
+            max_concurrency,
+            join_policy,
+            target,
+            deadline_after,
+        )
+
+        # Shared per-run state is settled once, before the siblings start;
+        # each worker then only reads it.
+        self._scratch_pad_thread = thread_id
+        if not getattr(self, "_batfish_owner_user_id", None):
+            self._batfish_owner_user_id = (await self._native_exec.retrieve_run(run_id)).user_id
+
+        queue: asyncio.Queue = asyncio.Queue()
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        results: Dict[str, str] = {}
+        finished = object()
+
+        async def _pump(task_id: str, arguments: Any) -> None:
+            try:
+                async with semaphore:
+                    async for chunk in self.handle_delegate_research_task(
+                        thread_id=thread_id,
+                        run_id=run_id,
+                        assistant_id=assistant_id,
+                        arguments_dict=arguments,
+                        tool_call_id=task_id,
+                        decision=decision,
+                        task_id=task_id,
+                        results=results,
+                        scrub_api_key=False,
+                    ):
+                        queue.put_nowait(chunk)
+            finally:
+                queue.put_nowait((finished, task_id))
+
+        tasks = {
+            call["tool_call_id"]: asyncio.create_task(
+                _pump(call["tool_call_id"], call.get("arguments"))
             )
+            for call in calls
+        }
+        pending = set(tasks)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + deadline_after
+
+        try:
+            while pending and len(tasks) - len(pending) < target:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+
+                if isinstance(item, tuple) and item[0] is finished:
+                    pending.discard(item[1])
+                    continue
+                yield item
+
+        finally:
+            for task_id in pending:
+                tasks[task_id].cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+            # Every call needs a tool message: siblings that were cut off and
+            # siblings that failed before submitting get an error output.
+            for task_id in tasks:
+                if task_id in results:
+                    continue
+                if task_id in pending:
+                    LOG.warning(
+                        f"⚠️[DELEGATE_BATCH] Task {task_id} cut off by '{join_policy}' join."
+                    )
+                    reason = "was stopped before it finished (join policy reached)"
+                else:
+                    LOG.warning(f"⚠️[DELEGATE_BATCH] Task {task_id} ended without a result.")
+                    reason = "failed before returning a result"
+                await self.submit_tool_output(
+                    thread_id=thread_id,
+                    assistant_id=assistant_id,
+                    tool_call_id=task_id,
+                    content=(
+                        f"SYSTEM STATUS: This delegated research task {reason}. Read the "
+                        "shared scratchpad for any facts it appended and continue your "
+                        "synthesis."
+                    ),
+                    action=None,
+                    is_error=True,
+                )
+
+            await self._native_exec.update_run_fields(run_id, meta_data={"api_key": "***"})
+
+        for task_id in pending:
+            yield self._research_status("Delegation cancelled.", "error", run_id, task_id)
@@ -1,13 +1,13 @@
 # src/api/entities_api/orchestration/mixins/native_exec_mixin.py
 from __future__ import annotations
 
-from src.api.entities_api.services.native_execution_service import \
-    NativeExecutionService
+from src.api.entities_api.services.native_execution_service import (
+    NativeExecutionService, get_native_execution_service)
 
 
 class NativeExecMixin:
     """
-    Provides a lazy singleton NativeExecutionService instance.
+    Provides the shared NativeExecutionService instance.
 
     Mix this in to any class that needs NativeExecutionService without
     adding it to the MRO or requiring __init__ cooperation.
@@ -23,13 +23,13 @@ class NativeExecMixin:
         - getattr guard means this works even when the concrete subclass
           does not call super().__init__() through the full MRO
           (e.g. TogetherQwenWorker and similar provider workers).
-        - The instance is created once per mixin instance and reused,
-          so Redis / DB connections are shared across calls within a
-          single request lifecycle.
+        - The instance is the process-wide (per event loop) service from
+          get_native_execution_service(), so workers built per run do not
+          each rebuild the CRUD services, Redis client and web reader.
     """
 
     @property
     def _native_exec(self) -> NativeExecutionService:
         if getattr(self, "_native_exec_svc", None) is None:
-            self._native_exec_svc = NativeExecutionService()
+            self._native_exec_svc = get_native_execution_service()
         return self._native_exec_svc
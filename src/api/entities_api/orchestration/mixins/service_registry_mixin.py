@@ -1,11 +1,18 @@
 """
-Runtime DI container – lazy-instantiates *internal* service classes and
-keeps them in `self._services`.
+Runtime DI – lazy-instantiates *internal* service classes through the
+process-level ServiceContainer.
+
+The truncator is a process singleton keyed by class + constructor
+arguments. SDK clients carry the caller's API key, so they share a bounded
+LRU instead (see ServiceContainer.bounded). Everything else is scoped to
+the worker instance (one per run) and held weakly, so finished workers are
+collected.
 """
 
 import inspect
 import os
 from functools import lru_cache
+from typing import Tuple
 
 from dotenv import load_dotenv
 from projectdavid import Entity
@@ -25,6 +32,8 @@ from entities_api.utils.conversation_truncator import ConversationTruncator
 from src.api.entities_api.orchestration.mixins.client_factory_mixin import \
     ClientFactoryMixin
 from src.api.entities_api.services.logging_service import LoggingUtility
+from src.api.entities_api.services.service_container import \
+    get_service_container
 
 load_dotenv()
 LOG = LoggingUtility()
@@ -34,40 +43,80 @@ class MissingParameterError(ValueError):
     pass
 
 
+_SINGLETON_SERVICES = {ConversationTruncator}
+
+# Constructed with an API key: one instance per credential set, LRU-bounded.
+_CREDENTIAL_SERVICES = {
+    UsersClient,
+    AssistantsClient,
+    ThreadsClient,
+    MessagesClient,
+    RunsClient,
+    ActionsClient,
+    VectorStoreClient,
+    FileClient,
+}
+
+
+@lru_cache(maxsize=64)
+def _init_parameters(service_cls) -> Tuple[Tuple[str, object], ...]:
+    """(name, default) pairs of a service constructor. Classes live for the process."""
+    sig = inspect.signature(service_cls.__init__)
+    return tuple(
+        (name, param.default) for name, param in sig.parameters.items() if name != "self"
+    )
+
+
 class ServiceRegistryMixin(ClientFactoryMixin):
 
     def _get_service(self, service_cls, *, custom_params=None):
-        if not hasattr(self, "_services"):
-            self._services = {}
-        if service_cls not in self._services:
-            try:
-                obj = (
-                    service_cls(*custom_params)
-                    if custom_params
-                    else service_cls(*self._resolve_init_parameters(service_cls))
-                )
-                self._services[service_cls] = obj
-                LOG.debug("Instantiated %s", service_cls.__name__)
-            except Exception as exc:
-                LOG.error("Init failed for %s: %s", service_cls.__name__, exc, exc_info=True)
-                raise
-        return self._services[service_cls]
+        container = get_service_container()
+
+        shared = service_cls in _SINGLETON_SERVICES or service_cls in _CREDENTIAL_SERVICES
+        if not shared:
+            return container.per_run(
+                self, service_cls, lambda: self._build_service(service_cls, custom_params)
+            )
+
+        params = (
+            tuple(custom_params) if custom_params else self._resolve_init_parameters(service_cls)
+        )
+        try:
+            key = (service_cls, params)
+            hash(key)
+        except TypeError:
+            return container.per_run(
+                self, service_cls, lambda: self._build_service(service_cls, params)
+            )
+        if service_cls in _CREDENTIAL_SERVICES:
+            return container.bounded(key, lambda: self._build_service(service_cls, params))
+        return container.singleton(key, lambda: self._build_service(service_cls, params))
+
+    def _build_service(self, service_cls, params=None):
+        try:
+            obj = service_cls(*(params or self._resolve_init_parameters(service_cls)))
+            LOG.debug("Instantiated %s", service_cls.__name__)
+            return obj
+        except Exception as exc:
+            LOG.error("Init failed for %s: %s", service_cls.__name__, exc, exc_info=True)
+            raise
 
     def _invalidate_service_cache(self, service_cls):
-        if hasattr(self, "_services") and service_cls in self._services:
-            del self._services[service_cls]
+        container = get_service_container()
+        container.invalidate(service_cls, owner=self)
+        if service_cls in _SINGLETON_SERVICES or service_cls in _CREDENTIAL_SERVICES:
+            try:
+                container.invalidate((service_cls, self._resolve_init_parameters(service_cls)))
+            except (MissingParameterError, TypeError):
+                pass
 
-    @lru_cache(maxsize=32)
     def _resolve_init_parameters(self, service_cls):
-        sig = inspect.signature(service_cls.__init__)
         resolved = []
-        for name, param in sig.parameters.items():
-            if name == "self":
-                continue
+        for name, default in _init_parameters(service_cls):
             if hasattr(self, name):
                 resolved.append(getattr(self, name))
-            elif param.default is not inspect.Parameter.empty:
-                resolved.append(param.default)
+            elif default is not inspect.Parameter.empty:
+                resolved.append(default)
             else:
                 raise MissingParameterError(f"{service_cls.__name__}: '{name}' not found")
         return tuple(resolved)
@@ -124,10 +173,11 @@ class ServiceRegistryMixin(ClientFactoryMixin):
     def assistant_cache(self) -> AssistantCache:
         return self._get_service(AssistantCache)
 
-    @lru_cache(maxsize=128)
     def cached_user_details(self, user_id):
-        """Thin wrapper around UsersClient to avoid redundant calls."""
-        return self.user_client.get_user(user_id)
+        """Thin wrapper around UsersClient to avoid redundant calls within a run."""
+        return get_service_container().per_run(
+            self, ("user_details", user_id), lambda: self.user_client.get_user(user_id)
+        )
 
     @property
     def code_execution_client(self) -> StreamOutput:
@@ -184,6 +184,8 @@ class ShellExecutionMixin:
         text_chunks: List[str] = []
         harvested_files: List[dict] = []
         execution_had_error: bool = False
+        # Live, append-only copy of the PTY text (GET /actions/{id}/output).
+        output_log = self._native_exec.open_action_output(action.id)
 
         try:
             auth_token = self._generate_shell_auth_token(
@@ -209,6 +211,7 @@ class ShellExecutionMixin:
                 # Forwarded via SSE as stream_type="shell" so the SDK can
                 # identify and suppress it — xterm reads via WebSocket instead.
                 text_chunks.append(chunk)
+                output_log.push({"c": chunk})
 
                 yield json.dumps(
                     {
@@ -241,6 +244,8 @@ class ShellExecutionMixin:
                 "error",
                 run_id,
             )
+        finally:
+            await output_log.close()
 
         # ── Process harvested files ───────────────────────────────────────────
 
@@ -340,16 +345,15 @@ class ShellExecutionMixin:
             yield self._shell_status(f"Tool output submission failed: {e}", "error", run_id)
             return
 
-        # ── Update action status ───────────────────────────────────────────────
+        # ── Compact output log & update action status ──────────────────────────
 
+        status_val = StatusEnum.failed.value if execution_had_error else StatusEnum.completed.value
         try:
-            await self._native_exec.update_action_status(
-                action.id,
-                (
-                    StatusEnum.completed.value
-                    if not execution_had_error
-                    else StatusEnum.failed.value
-                ),
-            )
+            await self._native_exec.update_action_status(action.id, status_val)
         except Exception as e:
             LOG.error("ShellExecution ▸ Action status update failed: %s", e)
+
+        try:
+            await self._native_exec.complete_action_output(action.id, raw_output, status=status_val)
+        except Exception as e:
+            LOG.error("ShellExecution ▸ Output compaction failed: %s", e)
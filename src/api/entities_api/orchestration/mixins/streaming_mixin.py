@@ -2,7 +2,7 @@
 All generic streaming helpers shared by every provider:
 
 • start_cancellation_listener — fire-and-forget thread
-• _shunt_to_redis_stream      — mirror chunks for other workers
+• _shunt_to_redis_stream      — mirror chunks for other workers (batched, pipelined)
 • _process_code_interpreter_chunks — line-wise splitter for ```python``` previews
 • stream_function_call_output — injects reminders & SSE proxy
 """
@@ -17,6 +17,7 @@ from typing import Any, Callable, Generator, Optional
 import redis as redis_py
 from projectdavid_common.validation import StatusEnum
 
+from src.api.entities_api.cache.stream_shunt import StreamShuntWriter
 from src.api.entities_api.constants.assistant import (CODE_INTERPRETER_MESSAGE,
                                                       DEFAULT_REMINDER_MESSAGE)
 from src.api.entities_api.services.logging_service import LoggingUtility
@@ -44,8 +45,9 @@ class StreamingMixin:
 
             while not stop_event.is_set():
                 try:
-                    # ✅ Native DB call — no HTTP SDK
-                    run = asyncio.run(self._native_exec.retrieve_run(run_id))
+                    # ✅ Native DB call — no HTTP SDK. Already on a thread, so the
+                    # sync service is used directly (the async engine is loop-bound).
+                    run = self._native_exec.run_svc.retrieve_run(run_id)
 
                     if run.status == StatusEnum.cancelled.value:
                         LOG.warning("Run %s was cancelled via API.", run_id)
@@ -78,56 +80,35 @@ class StreamingMixin:
     ):
         """
         Mirrors the chunk to Redis Stream.
-        Fix: Serializes nested dicts/lists to JSON strings to prevent DataError.
+
+        Only enqueues: the run's StreamShuntWriter batches chunks and writes
+        them with pipelined XADDs on the shared async Redis pool. `redis` is
+        accepted for call-site compatibility and no longer used.
         """
         try:
-            if not callable(getattr(redis, "xadd", None)):
-                LOG.debug("[Redis Shunt] async or stub Redis – skipping XADD")
-                return
-
-            # Ensure input is a dictionary
-            if isinstance(chunk_dict, str):
-                try:
-                    chunk_dict = json.loads(chunk_dict)
-                except json.JSONDecodeError:
-                    chunk_dict = {"content": chunk_dict}
-
-            # FIX: Redis XADD requires flat values (str, bytes, int, float).
-            # We must serialize nested dicts/lists into JSON strings.
-            redis_safe_chunk = {}
-            for k, v in chunk_dict.items():
-                if isinstance(v, (dict, list)):
-                    redis_safe_chunk[k] = json.dumps(v)
-                elif v is None:
-                    redis_safe_chunk[k] = ""
-                elif isinstance(v, bool):
-                    redis_safe_chunk[k] = str(v)
-                else:
-                    redis_safe_chunk[k] = v
-
-            loop = asyncio.get_running_loop()
-
-            # Run sync redis ops in executor so we don't block event loop
-            await loop.run_in_executor(
-                None,
-                lambda: redis.xadd(stream_key, redis_safe_chunk, maxlen=maxlen, approximate=True),
-            )
-
-            # Handle TTL
-            ttl_flag = f"{stream_key}::ttl_set"
-            exists = await loop.run_in_executor(None, lambda: redis.exists(ttl_flag))
-
-            if not exists:
-                await loop.run_in_executor(None, lambda: redis.expire(stream_key, ttl_seconds))
-                await loop.run_in_executor(None, lambda: redis.set(ttl_flag, "1", ex=ttl_seconds))
-
+            self._stream_shunt(stream_key, maxlen=maxlen, ttl_seconds=ttl_seconds).push(chunk_dict)
         except Exception as exc:
-            LOG.warning(
-                "[Redis Shunt] failed (%s): %s",
-                type(exc).__name__,
-                exc,
-                exc_info=True,
+            LOG.warning("[Redis Shunt] enqueue failed (%s): %s", type(exc).__name__, exc)
+
+    def _stream_shunt(self, stream_key, *, maxlen=1000, ttl_seconds=3600) -> StreamShuntWriter:
+        shunts = getattr(self, "_stream_shunts", None)
+        if shunts is None:
+            shunts = self._stream_shunts = {}
+        writer = shunts.get(stream_key)
+        if writer is None:
+            from src.api.entities_api.dependencies import get_redis_sync
+
+            writer = shunts[stream_key] = StreamShuntWriter(
+                get_redis_sync(), stream_key, maxlen=maxlen, ttl_seconds=ttl_seconds
             )
+        return writer
+
+    async def flush_stream_shunts(self) -> None:
+        """Drain and stop every shunt writer this worker opened."""
+        shunts = getattr(self, "_stream_shunts", None) or {}
+        for writer in list(shunts.values()):
+            await writer.close()
+        shunts.clear()
 
     def _process_code_interpreter_chunks(self, content_chunk, code_buffer):
         """
@@ -193,11 +174,11 @@ class StreamingMixin:
         assistant_reply = ""
         reasoning = ""
 
-        # Get the current event loop to schedule the async redis shunt
+        # The shunt writer needs a running loop; plain sync callers skip mirroring.
         try:
-            loop = asyncio.get_running_loop()
+            shunt = self._stream_shunt(redis_key) if asyncio.get_running_loop() else None
         except RuntimeError:
-            loop = None
+            shunt = None
 
         for raw in gen:
             try:
@@ -215,9 +196,8 @@ class StreamingMixin:
 
             yield raw
 
-            # Fire-and-forget the Redis shunt
-            if loop and loop.is_running():
-                loop.create_task(self._shunt_to_redis_stream(self.redis, redis_key, parsed))
+            if shunt is not None:
+                shunt.push(parsed)
 
         if assistant_reply:
             self.finalize_conversation(reasoning + assistant_reply, thread_id, assistant_id, run_id)
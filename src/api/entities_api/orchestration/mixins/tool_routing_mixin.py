@@ -67,6 +67,20 @@ class ToolRoutingMixin:
                 LOG.warning("TOOL-ROUTER ▸ failed to parse string arguments")
         return payload
 
+    @staticmethod
+    def _assign_call_ids(calls: List[Dict]) -> List[Dict]:
+        """
+        Give id-less or repeated calls a fresh id. Runs before the batch is
+        stored, so the persisted assistant tool_calls and the tool outputs
+        use the same, unique ids.
+        """
+        seen_ids = set()
+        for call in calls:
+            if not call.get("id") or call["id"] in seen_ids:
+                call["id"] = f"call_{uuid.uuid4().hex[:8]}"
+            seen_ids.add(call["id"])
+        return calls
+
     # -----------------------------------------------------
     # The Pedantic L3 Parser
     # -----------------------------------------------------
@@ -88,12 +102,10 @@ class ToolRoutingMixin:
             raw_payload = m.group("payload")
             parsed = self.ensure_valid_json(raw_payload)
             if parsed:
-                if not parsed.get("id"):
-                    parsed["id"] = f"call_{uuid.uuid4().hex[:8]}"
-                normalized = self._normalize_arguments(parsed)
-                results.append(normalized)
+                results.append(self._normalize_arguments(parsed))
 
         if results:
+            self._assign_call_ids(results)
             LOG.info(f"L3-PARSER ▸ Detected batch of {len(results)} tool(s).")
             self.set_tool_response_state(True)
             self.set_function_call_state(results)
@@ -101,11 +113,9 @@ class ToolRoutingMixin:
 
         loose = self.extract_function_calls_within_body_of_text(assistant_reply)
         if loose:
-            normalized_list = []
-            for item in loose:
-                if not item.get("id"):
-                    item["id"] = f"call_{uuid.uuid4().hex[:8]}"
-                normalized_list.append(self._normalize_arguments(item))
+            normalized_list = self._assign_call_ids(
+                [self._normalize_arguments(item) for item in loose]
+            )
 
             self.set_tool_response_state(True)
             self.set_function_call_state(normalized_list)
@@ -144,6 +154,28 @@ class ToolRoutingMixin:
 
         LOG.info("TOOL-ROUTER ▸ Dispatching Turn Batch (%s total)", len(batch))
 
+        # ---------------------------------------------------------
+        # 0. SIBLING DELEGATIONS — fan out concurrently
+        # ---------------------------------------------------------
+        delegations = [fc for fc in batch if fc.get("name") == "delegate_research_task"]
+        if len(delegations) > 1:
+            LOG.info("TOOL-ROUTER ▶ fanning out %s research delegations", len(delegations))
+            self._tools_called.extend(["delegate_research_task"] * len(delegations))
+            # Ids were made unique by the parser (_assign_call_ids), before
+            # the assistant tool_calls message was built from them.
+            async for chunk in self.handle_delegate_research_batch(
+                thread_id=thread_id,
+                run_id=run_id,
+                assistant_id=assistant_id,
+                calls=[
+                    {"tool_call_id": fc["id"], "arguments": fc.get("arguments")}
+                    for fc in delegations
+                ],
+                decision=decision,
+            ):
+                yield chunk
+            batch = [fc for fc in batch if fc.get("name") != "delegate_research_task"]
+
         for fc in batch:
             name = fc.get("name")
             args = fc.get("arguments")
@@ -73,6 +73,34 @@ def get_action(
         )
 
 
+@router.get("/actions/{action_id}/output", response_model=Dict[str, Any])
+def get_action_output(
+    action_id: str,
+    db: Session = Depends(get_db),
+    auth_key: ApiKeyModel = Depends(get_api_key),
+):
+    """
+    Assembled tool output: the live append-only log while the action is
+    streaming, the compacted result once it has finished.
+    """
+    logging_utility.info(
+        f"User '{auth_key.user_id}' - Received request for output of action {action_id}"
+    )
+    action_service = ActionService()
+    try:
+        return action_service.get_action_output(action_id)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logging_utility.error(
+            f"User '{auth_key.user_id}' - Error reading output of action {action_id}: {str(e)}"
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred.",
+        )
+
+
 @router.put("/actions/{action_id}", response_model=ValidationInterface.ActionRead)
 def update_action_status(
     action_id: str,
@@ -5,9 +5,13 @@ from projectdavid_common.schemas.api_key_schemas import (ApiKeyCreateRequest,
 from projectdavid_common.utilities.logging_service import LoggingUtility
 from sqlalchemy.orm import Session
 
+from src.api.entities_api.cache.admission_control import \
+    get_admission_controller
+from src.api.entities_api.db.database import replica_router
 from src.api.entities_api.dependencies import get_api_key, get_db
 from src.api.entities_api.models.models import ApiKey as ApiKeyModel
 from src.api.entities_api.models.models import User as UserModel
+from src.api.entities_api.observability.sql_instrumentation import sql_metrics
 from src.api.entities_api.services.api_key_service import ApiKeyService
 
 admin_router = APIRouter(
@@ -83,3 +87,70 @@ def admin_create_api_key_for_user(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Admin failed to create API key for user {target_user_id}: An internal error occurred.",
         )
+
+
+@admin_router.get(
+    "/admission/metrics",
+    summary="Admin: Completions admission-control counters",
+    description="Per-process counters of admitted, waited and rejected completions runs.",
+)
+def admin_admission_metrics(
+    db: Session = Depends(get_db),
+    auth_key: ApiKeyModel = Depends(get_api_key),
+):
+    """
+    Admin Only: Returns this API process's admission-control counters
+    (`admitted`, `rejected_<scope>`, `fail_open`, `wait_seconds_total`).
+    """
+    requesting_user = db.query(UserModel).filter(UserModel.id == auth_key.user_id).first()
+    if not requesting_user or not requesting_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin privileges required for this operation.",
+        )
+    return get_admission_controller().metrics()
+
+
+@admin_router.get(
+    "/sql/metrics",
+    summary="Admin: SQL latency histograms",
+    description="Per-engine statement latency histograms for this API process.",
+)
+def admin_sql_metrics(
+    db: Session = Depends(get_db),
+    auth_key: ApiKeyModel = Depends(get_api_key),
+):
+    """
+    Admin Only: Returns per-engine (`main`, `special`, `async`) statement
+    counts, total time, slow-query counts and latency buckets.
+    """
+    requesting_user = db.query(UserModel).filter(UserModel.id == auth_key.user_id).first()
+    if not requesting_user or not requesting_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin privileges required for this operation.",
+        )
+    return sql_metrics()
+
+
+@admin_router.get(
+    "/db/replicas",
+    summary="Admin: read-replica routing status",
+    description="Replica health, measured lag and routing counters for this API process.",
+)
+def admin_replica_status(
+    db: Session = Depends(get_db),
+    auth_key: ApiKeyModel = Depends(get_api_key),
+):
+    """
+    Admin Only: Returns each configured replica's last measured lag and
+    health, plus how many read sessions were routed to a replica versus
+    fell back to the primary.
+    """
+    requesting_user = db.query(UserModel).filter(UserModel.id == auth_key.user_id).first()
+    if not requesting_user or not requesting_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin privileges required for this operation.",
+        )
+    return replica_router.status()
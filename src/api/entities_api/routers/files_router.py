@@ -2,11 +2,12 @@ import hashlib
 import hmac
 import os
 from datetime import datetime
+from typing import Optional
 from urllib.parse import urlencode
 
 from dotenv import load_dotenv
-from fastapi import (APIRouter, Depends, File, Form, HTTPException, Query,
-                     UploadFile, status)
+from fastapi import (APIRouter, Depends, File, Form, Header, HTTPException,
+                     Query, Response, UploadFile, status)
 from fastapi.responses import StreamingResponse
 from projectdavid_common.utilities.logging_service import LoggingUtility
 from projectdavid_common.validation import FileDeleteResponse, FileResponse
@@ -16,6 +17,7 @@ from src.api.entities_api.dependencies import get_api_key, get_db
 from src.api.entities_api.models.models import ApiKey as ApiKeyModel
 from src.api.entities_api.models.models import File as FileModel
 from src.api.entities_api.services.file_service import FileService
+from src.api.entities_api.utils.range_requests import etag_matches, parse_range
 
 load_dotenv()
 router = APIRouter()
@@ -38,13 +40,17 @@ def download_file(
     expires: int = Query(...),
     signature: str = Query(...),
     use_real_filename: bool = Query(False),
+    range_header: Optional[str] = Header(None, alias="Range"),
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
+    if_range: Optional[str] = Header(None, alias="If-Range"),
     db: Session = Depends(get_db),
 ):
     log_msg = f"!!!!!! Entered /files/download route for file_id: {file_id} !!!!!!"
     print(log_msg, flush=True)
     logging_utility.error(log_msg)
 
-    if datetime.utcnow().timestamp() > expires:
+    now = datetime.utcnow().timestamp()
+    if now > expires:
         logging_utility.warning(f"Download URL expired for file_id: {file_id}")
         raise HTTPException(status.HTTP_400_BAD_REQUEST, "Signed URL expired")
 
@@ -61,23 +67,50 @@ def download_file(
     if not file_record:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "File not found")
 
-    stream, orig_name, mime = svc.get_file_with_metadata(
+    info = svc.get_download_info(
         file_id, user_id=file_record.user_id  # ← use the actual owner so guard passes
     )
 
-    fname = orig_name if use_real_filename else file_id
+    # Content behind a signed URL never changes, so it may be cached — by
+    # the client and by a fronting nginx (keyed on the full URL, signature
+    # included) — until the URL expires.
+    ttl = max(int(expires - now), 0)
+    headers = {
+        "ETag": info.etag,
+        "Accept-Ranges": "bytes",
+        "Cache-Control": f"public, max-age={ttl}, immutable",
+        "X-Accel-Expires": str(ttl),
+        "X-Content-Type-Options": "nosniff",
+    }
+
+    if if_none_match and etag_matches(if_none_match, info.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    fname = info.filename if use_real_filename else file_id
     disp = (
         "inline"
-        if mime and mime.startswith(("image/", "text/", "application/pdf"))
+        if info.mime_type.startswith(("image/", "text/", "application/pdf"))
         else "attachment"
     )
+    headers["Content-Disposition"] = f'{disp}; filename="{fname}"'
+
+    # If-Range: serve the range only if the client's copy is current.
+    span = None
+    if range_header and (not if_range or if_range.strip() == info.etag):
+        span = parse_range(range_header, info.size)
+
+    if span is None:
+        start, end, status_code = 0, info.size - 1, status.HTTP_200_OK
+    else:
+        (start, end), status_code = span, status.HTTP_206_PARTIAL_CONTENT
+        headers["Content-Range"] = f"bytes {start}-{end}/{info.size}"
+    headers["Content-Length"] = str(end - start + 1)
+
     return StreamingResponse(
-        stream,
-        media_type=mime or "application/octet-stream",
-        headers={
-            "Content-Disposition": f'{disp}; filename="{fname}"',
-            "X-Content-Type-Options": "nosniff",
-        },
+        svc.iter_file_range(info, start, end),
+        status_code=status_code,
+        media_type=info.mime_type,
+        headers=headers,
     )
 
 
@@ -1,23 +1,54 @@
 import json
+import math
 import time
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import StreamingResponse
 from projectdavid_common import ValidationInterface
 from projectdavid_common.utilities.logging_service import LoggingUtility
 from redis import Redis
-
+from starlette.background import BackgroundTask
+
+from src.api.entities_api.cache.admission_control import (
+    AdmissionRejected, get_admission_controller)
+from src.api.entities_api.cache.run_queue import (RUN_OUTPUT_DONE,
+                                                  RUN_QUEUE_ENABLED, RunJob,
+                                                  get_run_queue,
+                                                  serialize_run_chunk)
+from src.api.entities_api.db.replicas import primary_pinned
 from src.api.entities_api.dependencies import get_redis
 from src.api.entities_api.orchestration.engine.inference_arbiter import \
     InferenceArbiter
 from src.api.entities_api.orchestration.engine.inference_provider_selector import \
     InferenceProviderSelector
 from src.api.entities_api.services.native_execution_service import \
-    NativeExecutionService
+    get_native_execution_service
 
 router = APIRouter()
 logging_utility = LoggingUtility()
 
+_SSE_HEADERS = {
+    "X-Accel-Buffering": "no",
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "Content-Type": "text/event-stream",
+}
+
+
+async def attach_run_output(request: Request, run_id: str, last_id: str = "0"):
+    """
+    SSE frames for a queued run, read from its output stream. Each frame
+    carries the stream entry id so a client can re-attach with Last-Event-ID.
+    """
+    async for item in get_run_queue().attach(run_id, last_id=last_id):
+        if await request.is_disconnected():
+            break
+        if item is None:
+            yield ": keep-alive\n\n"
+            continue
+        entry_id, data = item
+        yield f"id: {entry_id}\ndata: {data}\n\n"
+
 
 @router.post(
     "/completions",
@@ -25,6 +56,7 @@ logging_utility = LoggingUtility()
     response_description="A stream of JSON-formatted completions chunks",
 )
 async def completions(
+    request: Request,
     stream_request: ValidationInterface.StreamRequest,
     redis: Redis = Depends(get_redis),
 ):
@@ -56,40 +88,79 @@ async def completions(
     #   2. run.thread_id matches the request (no thread grafting)
     #   3. run.assistant_id matches the request (no assistant grafting)
     #   4. Caller has owner/shared access to the assistant
+    #
+    # All four checks run as one query (NativeExecutionService.verify_run_access);
+    # the positive result is cached in Redis for the run's lifetime, so SDK
+    # follow-up turns on the same run skip the database.
     # ------------------------------------------------------------------
     try:
-        native = NativeExecutionService()
-
-        run = await native.retrieve_run(stream_request.run_id)
-        if not run:
-            raise HTTPException(status_code=404, detail="Run not found.")
-
-        # ── Guard 1: run.thread_id matches the request ───────────────
-        if run.thread_id != stream_request.thread_id:
-            raise HTTPException(
-                status_code=403,
-                detail="Thread ID does not match the run.",
-            )
-
-        # ── Guard 2: run.assistant_id matches the request ────────────
-        if run.assistant_id != stream_request.assistant_id:
-            raise HTTPException(
-                status_code=403,
-                detail="Assistant ID does not match the run.",
-            )
-
-        # ── Guard 3: caller has access to the assistant ──────────────
-        await native.assert_assistant_access(
+        run_user_id = await get_native_execution_service().verify_run_access(
+            stream_request.run_id,
+            thread_id=stream_request.thread_id,
             assistant_id=stream_request.assistant_id,
-            user_id=run.user_id,
         )
-
     except HTTPException:
         raise
     except Exception as e:
         logging_utility.error(f"Ownership check failed: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Ownership verification failed.")
 
+    # ------------------------------------------------------------------
+    # ADMISSION CONTROL
+    #
+    # Per-user token bucket plus concurrent-run ceilings per user,
+    # assistant and provider. A request that cannot get a slot within
+    # ADMISSION_MAX_WAIT_SECONDS is rejected with 429 + Retry-After.
+    # The ticket is released when the run's response ends — including a
+    # client that disconnects before the stream is ever iterated — or by the
+    # queue worker in queued mode.
+    # ------------------------------------------------------------------
+    admission = get_admission_controller()
+    try:
+        ticket = await admission.admit(
+            stream_request.run_id,
+            user_id=run_user_id,
+            assistant_id=stream_request.assistant_id,
+            model=stream_request.model,
+        )
+    except AdmissionRejected as e:
+        raise HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))},
+        )
+
+    # ------------------------------------------------------------------
+    # QUEUED MODE
+    #
+    # The run is handed to the orchestrator workers (daemons/run_queue_worker)
+    # and this response only attaches to its output stream. Disconnecting
+    # no longer cancels the run; GET /v1/runs/{run_id}/output re-attaches.
+    # ------------------------------------------------------------------
+    if RUN_QUEUE_ENABLED:
+        try:
+            await get_run_queue().enqueue(
+                RunJob(
+                    run_id=stream_request.run_id,
+                    thread_id=stream_request.thread_id,
+                    assistant_id=stream_request.assistant_id,
+                    model=stream_request.model,
+                    message_id=stream_request.message_id,
+                    api_key=stream_request.api_key,
+                    user_id=run_user_id,
+                )
+            )
+        except Exception as e:
+            await admission.release(ticket)
+            logging_utility.error(f"Run enqueue failed: {e}", exc_info=True)
+            raise HTTPException(status_code=503, detail="Run queue unavailable.")
+
+        return StreamingResponse(
+            attach_run_output(request, stream_request.run_id),
+            media_type="text/event-stream",
+            headers=_SSE_HEADERS,
+        )
+
     # ------------------------------------------------------------------
     # PROVIDER SETUP
     # ------------------------------------------------------------------
@@ -100,6 +171,7 @@ async def completions(
             model_id=stream_request.model
         )
     except Exception as e:
+        await admission.release(ticket)
         logging_utility.error(f"Provider setup failed: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -115,49 +187,38 @@ async def completions(
         error_occurred = False
 
         try:
-            async for chunk in general_handler_instance.process_conversation(
-                thread_id=stream_request.thread_id,
-                message_id=stream_request.message_id,
-                run_id=run_id,
-                assistant_id=stream_request.assistant_id,
-                model=stream_request.model,
-                stream_reasoning=False,
-                api_key=stream_request.api_key,
-            ):
-                chunk_count += 1
-                final_str = ""
-
-                if isinstance(chunk, str):
-                    final_str = chunk
-                elif isinstance(chunk, dict):
-                    if "run_id" not in chunk:
-                        chunk["run_id"] = run_id
-                    final_str = json.dumps(chunk)
-                else:
-                    final_str = json.dumps(
-                        {"type": "content", "content": str(chunk), "run_id": run_id}
-                    )
-
-                yield f"{prefix}{final_str}{suffix}"
+            # Runs read their own writes: keep every read on the primary.
+            with primary_pinned():
+                async for chunk in general_handler_instance.process_conversation(
+                    thread_id=stream_request.thread_id,
+                    message_id=stream_request.message_id,
+                    run_id=run_id,
+                    assistant_id=stream_request.assistant_id,
+                    model=stream_request.model,
+                    stream_reasoning=False,
+                    api_key=stream_request.api_key,
+                ):
+                    chunk_count += 1
+                    yield f"{prefix}{serialize_run_chunk(chunk, run_id)}{suffix}"
 
             if not error_occurred:
-                yield "data: [DONE]\n\n"
+                yield f"{prefix}{RUN_OUTPUT_DONE}{suffix}"
 
         except Exception as e:
             error_occurred = True
             logging_utility.error(f"Stream loop error: {e}", exc_info=True)
             yield f"data: {json.dumps({'type': 'error', 'run_id': run_id, 'message': str(e)})}\n\n"
         finally:
+            # Frees the slots as soon as the run ends; the response's
+            # background task repeats it (ZREM is idempotent) for streams
+            # that never started.
+            await admission.release(ticket)
             elapsed = time.time() - start_time
             logging_utility.info(f"Stream finished: {chunk_count} chunks in {elapsed:.2f}s")
 
     return StreamingResponse(
         stream_generator(),
         media_type="text/event-stream",
-        headers={
-            "X-Accel-Buffering": "no",
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "Content-Type": "text/event-stream",
-        },
+        headers=_SSE_HEADERS,
+        background=BackgroundTask(admission.release, ticket),
     )
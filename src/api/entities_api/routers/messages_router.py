@@ -1,8 +1,10 @@
 # src/api/entities_api/routers/messages.py
+import asyncio
 import json
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import PlainTextResponse
 from projectdavid_common import ValidationInterface
 from projectdavid_common.utilities.logging_service import LoggingUtility
 from redis.asyncio import Redis
@@ -16,13 +18,20 @@ validator = ValidationInterface()
 logging_utility = LoggingUtility()
 
 
-async def _push_to_redis(redis: Redis, message_obj):
-    """Asynchronously pushes message data to Redis list and trims."""
+async def _push_to_redis(redis: Redis, message_obj, content: Optional[str] = None):
+    """
+    Asynchronously pushes message data to Redis list and trims.
+
+    `content` overrides the stored value — pass the submitted text so the
+    history cache never holds the stub of an offloaded message.
+    """
     try:
         key = f"thread:{message_obj.thread_id}:history"
         data = message_obj.model_dump(exclude_unset=True)
         data["role"] = message_obj.role
-        data["content"] = message_obj.content if message_obj.content is not None else ""
+        if content is None:
+            content = message_obj.content
+        data["content"] = content if content is not None else ""
         payload = json.dumps(data)
         await redis.rpush(key, payload)
         await redis.ltrim(key, -200, -1)
@@ -40,9 +49,11 @@ async def create_message(
     logging_utility.info(f"[{auth_key.user_id}] Creating message in thread {message.thread_id}")
     svc = MessageService()
     try:
-        new_message = svc.create_message(message, user_id=auth_key.user_id)
+        # MessageService is synchronous and may write oversized content to
+        # the Samba share — keep it off the event loop.
+        new_message = await asyncio.to_thread(svc.create_message, message, user_id=auth_key.user_id)
         logging_utility.info(f"Created message ID {new_message.id}")
-        await _push_to_redis(redis, new_message)
+        await _push_to_redis(redis, new_message, content=message.content)
         return new_message
     except HTTPException:
         raise
@@ -65,9 +76,11 @@ async def submit_tool_response(
     )
     svc = MessageService()
     try:
-        new_message = svc.submit_tool_output(message, user_id=auth_key.user_id)
+        new_message = await asyncio.to_thread(
+            svc.submit_tool_output, message, user_id=auth_key.user_id
+        )
         logging_utility.info(f"Created tool message ID {new_message.id}")
-        await _push_to_redis(redis, new_message)
+        await _push_to_redis(redis, new_message, content=message.content)
         return new_message
     except HTTPException:
         raise
@@ -98,6 +111,26 @@ def get_message(
         )
 
 
+@router.get("/messages/{message_id}/content", response_class=PlainTextResponse)
+def get_message_content(
+    message_id: str,
+    auth_key: ApiKeyModel = Depends(get_api_key),
+):
+    """Full text of a message, including content offloaded to blob storage."""
+    logging_utility.info(f"[{auth_key.user_id}] Retrieving content of message {message_id}")
+    svc = MessageService()
+    try:
+        return PlainTextResponse(svc.get_message_content(message_id, user_id=auth_key.user_id))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logging_utility.error("Error retrieving message content: %s", e, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred.",
+        )
+
+
 @router.get(
     "/threads/{thread_id}/messages",
     response_model=ValidationInterface.MessagesList,
@@ -106,13 +139,20 @@ def list_messages(
     thread_id: str,
     limit: int = 20,
     order: str = "asc",
+    after: Optional[str] = None,
+    before: Optional[str] = None,
     auth_key: ApiKeyModel = Depends(get_api_key),
 ):
     logging_utility.info(f"[{auth_key.user_id}] Listing messages for thread {thread_id}")
     svc = MessageService()
     try:
         return svc.list_messages(
-            thread_id=thread_id, user_id=auth_key.user_id, limit=limit, order=order
+            thread_id=thread_id,
+            user_id=auth_key.user_id,
+            limit=limit,
+            order=order,
+            after=after,
+            before=before,
         )
     except HTTPException:
         raise
@@ -159,7 +199,8 @@ async def save_assistant_message(
     # The endpoint still requires a valid API key for authentication.
     svc = MessageService()
     try:
-        new_message = svc.save_assistant_message_chunk(
+        new_message = await asyncio.to_thread(
+            svc.save_assistant_message_chunk,
             thread_id=message.thread_id,
             content=message.content,
             role=message.role,
@@ -169,7 +210,7 @@ async def save_assistant_message(
         )
         if new_message:
             logging_utility.info(f"Saved assistant message ID {new_message.id}")
-            await _push_to_redis(redis, new_message)
+            await _push_to_redis(redis, new_message, content=message.content)
             return new_message
         return None
     except HTTPException:
@@ -3,16 +3,21 @@ import asyncio
 import json
 from typing import Any, Dict, Literal, Optional
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request
+from fastapi import (APIRouter, Body, Depends, Header, HTTPException, Query,
+                     Request)
 from projectdavid_common import UtilsInterface, ValidationInterface
 from projectdavid_common.schemas.enums import StatusEnum
 from pydantic import ValidationError
+from redis.asyncio import Redis
 from sqlalchemy.orm import Session
 from sse_starlette.sse import EventSourceResponse
 from starlette import status
 
-from src.api.entities_api.db.database import SessionLocal
-from src.api.entities_api.dependencies import get_api_key, get_db
+from src.api.entities_api.cache.run_event_bus import (RUN_STATUS_EVENT,
+                                                      RunEventBus)
+from src.api.entities_api.cache.run_queue import get_run_queue
+from src.api.entities_api.db.replicas import primary_pinned
+from src.api.entities_api.dependencies import get_api_key, get_db, get_redis
 from src.api.entities_api.models.models import ApiKey as ApiKeyModel
 from src.api.entities_api.models.models import User as UserModel
 from src.api.entities_api.services.actions_service import ActionService
@@ -22,6 +27,19 @@ ent_validator = ValidationInterface()
 logging_utility = UtilsInterface.LoggingUtility()
 router = APIRouter()
 
+# A run in one of these states will never publish action_required again,
+# so the event stream closes instead of idling forever.
+_TERMINAL_RUN_STATUSES = {
+    StatusEnum.completed.value,
+    StatusEnum.failed.value,
+    StatusEnum.cancelled.value,
+    StatusEnum.expired.value,
+}
+
+
+def _run_ended(run) -> bool:
+    return getattr(run.status, "value", run.status) in _TERMINAL_RUN_STATUSES
+
 
 @router.post("/runs", response_model=ValidationInterface.Run)
 def create_run(
@@ -178,37 +196,102 @@ async def stream_run_events(
     request: Request,
     run_id: str,
     auth_key: ApiKeyModel = Depends(get_api_key),
+    redis: Redis = Depends(get_redis),
 ):
     run_svc = RunService()
     action_svc = ActionService()
+    event_bus = RunEventBus(redis=redis)
 
     # ── Ownership verified once at connection time, before the stream opens. ──
     # Raises 403 immediately if the caller doesn't own this run.
-    # The internal poll loop below omits user_id — no repeated auth overhead.
-    try:
-        run_svc.retrieve_run(run_id, user_id=auth_key.user_id)  # ← FIXED
-    except HTTPException as e:
-        raise e
+    # Runs off the event loop — RunService is synchronous.
+    await asyncio.to_thread(run_svc.retrieve_run, run_id, user_id=auth_key.user_id)
 
     async def event_generator():
-        while True:
+        # Event-driven: the generator sleeps on the run's Pub/Sub channel and
+        # only touches MySQL when a status transition is actually published.
+        # subscribe() yields None once the subscription is live; the DB
+        # snapshot is read at that point so no transition can be missed.
+        events = event_bus.subscribe(run_id)
+        snapshot_taken = False
+        try:
+            async for envelope in events:
+                if await request.is_disconnected():
+                    break
+
+                if envelope is None:
+                    if snapshot_taken:
+                        continue  # idle tick — nothing changed, nothing to do
+                    snapshot_taken = True
+                    try:
+                        # On the primary: a replica may not have the latest
+                        # transition yet, and nothing would be re-published.
+                        with primary_pinned():
+                            run = await asyncio.to_thread(run_svc.retrieve_run, run_id)
+                    except HTTPException:
+                        yield {"event": "error", "data": '{"msg":"run not found"}'}
+                        break
+                    status_value = getattr(run.status, "value", run.status)
+                elif envelope.get("event") == RUN_STATUS_EVENT:
+                    status_value = envelope.get("status")
+                else:
+                    continue
+
+                if status_value == StatusEnum.pending_action.value:
+                    pending = await asyncio.to_thread(action_svc.get_pending_actions, run_id)
+                    if pending:
+                        for act in pending:
+                            data = act.dict() if hasattr(act, "dict") else act
+                            yield {"event": "action_required", "data": json.dumps(data)}
+                        break
+                elif status_value in _TERMINAL_RUN_STATUSES:
+                    break
+        finally:
+            await events.aclose()
+
+    return EventSourceResponse(event_generator())
+
+
+@router.get(
+    "/runs/{run_id}/output",
+    summary="Attach to a queued run's output stream (SSE)",
+    response_class=EventSourceResponse,
+)
+async def stream_run_output(
+    request: Request,
+    run_id: str,
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    auth_key: ApiKeyModel = Depends(get_api_key),
+):
+    """
+    Replays a run's output from the start (or after Last-Event-ID) and then
+    follows it live until [DONE]. Only runs executed by the run queue
+    workers (RUN_QUEUE_ENABLED) have an output stream; a finished run
+    without one (run inline, or its stream expired) is a 404.
+    """
+    run_svc = RunService()
+    queue = get_run_queue()
+
+    run = await asyncio.to_thread(run_svc.retrieve_run, run_id, user_id=auth_key.user_id)
+    if _run_ended(run) and not await queue.has_output(run_id):
+        raise HTTPException(status_code=404, detail="No output stream for this run")
+
+    async def output_generator():
+        async for item in queue.attach(run_id, last_id=last_event_id or "0"):
             if await request.is_disconnected():
                 break
-            # Internal poll — user_id omitted intentionally.
-            run = run_svc.retrieve_run(run_id)
-            if not run:
-                yield {"event": "error", "data": '{"msg":"run not found"}'}
-                break
-            if run.status == StatusEnum.pending_action:
-                pending = action_svc.get_pending_actions(run_id)
-                if pending:
-                    for act in pending:
-                        data = act.dict() if hasattr(act, "dict") else act
-                        yield {"event": "action_required", "data": json.dumps(data)}
+            if item is None:
+                # A full block with nothing new. Once the run has ended no
+                # more output is coming — stop even if [DONE] never arrives
+                # (e.g. its XADD failed). sse_starlette sends its own pings.
+                current = await asyncio.to_thread(run_svc.retrieve_run, run_id)
+                if _run_ended(current):
                     break
-            await asyncio.sleep(0.5)
+                continue
+            entry_id, data = item
+            yield {"id": entry_id, "data": data}
 
-    return EventSourceResponse(event_generator())
+    return EventSourceResponse(output_generator())
 
 
 @router.get("/runs", response_model=ValidationInterface.RunListResponse)
@@ -216,6 +299,8 @@ def list_runs(
     limit: int = Query(20, ge=1, le=100),
     order: Literal["asc", "desc"] = Query("asc"),
     thread_id: Optional[str] = Query(None),
+    after: Optional[str] = Query(None, description="Return runs after this run id."),
+    before: Optional[str] = Query(None, description="Return runs before this run id."),
     auth_key: ApiKeyModel = Depends(get_api_key),
 ):
     user_id = auth_key.user_id
@@ -229,7 +314,12 @@ def list_runs(
     svc = RunService()
     try:
         runs, has_more = svc.list_runs(
-            user_id=user_id, limit=limit, order=order, thread_id=thread_id
+            user_id=user_id,
+            limit=limit,
+            order=order,
+            thread_id=thread_id,
+            after=after,
+            before=before,
         )
         return {
             "object": "list",
@@ -259,6 +349,8 @@ def list_runs_for_thread(
     thread_id: str,
     limit: int = Query(20, ge=1, le=100),
     order: Literal["asc", "desc"] = Query("asc"),
+    after: Optional[str] = Query(None, description="Return runs after this run id."),
+    before: Optional[str] = Query(None, description="Return runs before this run id."),
     auth_key: ApiKeyModel = Depends(get_api_key),
 ):
     user_id = auth_key.user_id
@@ -272,7 +364,12 @@ def list_runs_for_thread(
     svc = RunService()
     try:
         runs, has_more = svc.list_runs(
-            user_id=user_id, limit=limit, order=order, thread_id=thread_id
+            user_id=user_id,
+            limit=limit,
+            order=order,
+            thread_id=thread_id,
+            after=after,
+            before=before,
         )
         return {
             "object": "list",
@@ -1,4 +1,5 @@
 # src/api/entities_api/services/actions_service.py
+import json
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -8,13 +9,20 @@ from projectdavid_common.utilities.logging_service import LoggingUtility
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import joinedload
 
-from src.api.entities_api.db.database import SessionLocal
+from src.api.entities_api.cache.action_output_log import get_action_output_log
+from src.api.entities_api.cache.run_event_bus import (ACTION_CREATED_EVENT,
+                                                      ACTION_STATUS_EVENT,
+                                                      RunEventBus,
+                                                      get_sync_run_event_bus)
+from src.api.entities_api.db.database import SessionLocal, run_db
 from src.api.entities_api.models.models import Action, Run
 from src.api.entities_api.utils.conversion_utils import datetime_to_iso
 
 validator = ValidationInterface()
 logging_utility = LoggingUtility()
 
+TERMINAL_ACTION_STATUSES = {"completed", "failed", "cancelled", "expired"}
+
 
 class ActionService:
     def __init__(self):
@@ -53,52 +61,118 @@ class ActionService:
             return 0.0
 
     def update_action_stream_state(self, action_id: str, state: dict):
-        with SessionLocal() as db:
-            action = db.query(Action).get(action_id)
-            if not action:
-                raise HTTPException(status_code=404, detail="Action not found")
-
-            if action.meta_data is None:
-                action.meta_data = {}
-
-            current_meta = dict(action.meta_data) if action.meta_data else {}
-            current_meta["stream_state"] = {
-                "buffer": state.get("buffer", []),
-                "received_lines": state.get("received_lines", 0),
-                "last_update": datetime.utcnow().isoformat(),
-            }
-            action.meta_data = current_meta
-            db.commit()
+        """Record streaming progress alongside the output log (Redis only)."""
+        get_action_output_log().set_state_sync(
+            action_id,
+            buffer=json.dumps(state.get("buffer", [])),
+            received_lines=int(state.get("received_lines", 0)),
+        )
 
     def update_action_output(self, action_id: str, new_content: str, is_partial: bool = True):
+        """
+        Partials are appended to the action's output log — one XADD, no
+        database round-trip. The final call compacts into Action.result.
+        """
+        if is_partial:
+            get_action_output_log().append_sync(action_id, new_content)
+            return
+        self.complete_action_output(action_id, new_content, mark_completed=True)
+
+    def complete_action_output(
+        self,
+        action_id: str,
+        full_output: Optional[str] = None,
+        *,
+        mark_completed: bool = False,
+        status: Optional[str] = None,
+    ) -> None:
+        """
+        Compact the output log into Action.result in one write, then drop
+        the log. With full_output=None the log itself is assembled.
+        `status` is the action's outcome, recorded in the result; it
+        defaults to the row's current status.
+        """
+        output_log = get_action_output_log()
+        if full_output is None:
+            full_output, chunk_count = output_log.assemble_sync(action_id)
+        else:
+            chunk_count = output_log.length_sync(action_id)
         with SessionLocal() as db:
-            action = db.query(Action).get(action_id)
-            if not action:
-                raise HTTPException(status_code=404, detail="Action not found")
-
-            if not action.result or isinstance(action.result, str):
-                action.result = {
-                    "full_output": "",
-                    "partials": [],
-                    "status": "in_progress",
-                }
-
-            current_result = dict(action.result)
-            if is_partial:
-                current_result["partials"].append(
-                    {
-                        "function_call": new_content,
-                        "timestamp": datetime.utcnow().isoformat(),
-                    }
-                )
-            else:
-                current_result["full_output"] = new_content
-                current_result["status"] = "completed"
-                action.status = "completed"
-                action.processed_at = datetime.utcnow()
+            self._store_output(
+                db, action_id, full_output or "", chunk_count, mark_completed, status
+            )
+        output_log.discard_sync(action_id)
+
+    async def complete_action_output_async(
+        self,
+        action_id: str,
+        full_output: Optional[str] = None,
+        *,
+        mark_completed: bool = False,
+        status: Optional[str] = None,
+    ) -> None:
+        """complete_action_output on the async engine — used by tool mixins."""
+        output_log = get_action_output_log()
+        if full_output is None:
+            full_output, chunk_count = await output_log.assemble(action_id)
+        else:
+            chunk_count = await output_log.length(action_id)
+        await run_db(
+            self._store_output, action_id, full_output or "", chunk_count, mark_completed, status
+        )
+        await output_log.discard(action_id)
+
+    def _store_output(
+        self,
+        db,
+        action_id: str,
+        output: str,
+        chunk_count: int,
+        mark_completed: bool,
+        status: Optional[str] = None,
+    ) -> None:
+        action = db.query(Action).filter(Action.id == action_id).first()
+        if not action:
+            raise HTTPException(status_code=404, detail="Action not found")
+
+        if mark_completed:
+            action.status = "completed"
+            action.processed_at = datetime.utcnow()
+        action.result = {
+            "full_output": output,
+            "chunks": chunk_count,
+            "status": status or action.status,
+        }
+        db.commit()
+
+    def get_action_output(self, action_id: str) -> Dict[str, Any]:
+        """
+        Assembled output of an action: the live log while it streams, the
+        compacted Action.result once it has finished.
+        """
+        with SessionLocal() as db:
+            row = db.query(Action.status, Action.result).filter(Action.id == action_id).first()
+        if not row:
+            raise HTTPException(status_code=404, detail=f"Action {action_id} not found")
+
+        result = row.result if isinstance(row.result, dict) else {}
+        if "full_output" in result:
+            return {
+                "action_id": action_id,
+                "status": row.status,
+                "output": result["full_output"],
+                "chunks": result.get("chunks", 0),
+                "complete": True,
+            }
 
-            action.result = current_result
-            db.commit()
+        output, chunk_count = get_action_output_log().assemble_sync(action_id)
+        return {
+            "action_id": action_id,
+            "status": row.status,
+            "output": output or "",
+            "chunks": chunk_count,
+            "complete": row.status in TERMINAL_ACTION_STATUSES,
+        }
 
     def create_action(self, action_data: validator.ActionCreate) -> validator.ActionRead:
         """
@@ -112,66 +186,104 @@ class ActionService:
         )
 
         with SessionLocal() as db:
-            try:
-                # [FIX 1] Move Logic Inside Try Block
-                # If this fails (e.g. AttributeError), it will now be caught by the generic Exception handler below
-                # instead of returning a raw 500.
-
-                # [FIX 2] Correct Attribute Name
-                # Changed 'action_data.decision_payload' to 'action_data.decision' to match the Pydantic model
-                # field used in the Action constructor below.
-                calculated_confidence = self._normalize_confidence(action_data.decision)
-
-                new_action_id = UtilsInterface.IdentifierService.generate_action_id()
-                new_action = Action(
-                    id=new_action_id,
-                    run_id=action_data.run_id,
-                    triggered_at=datetime.now(),
-                    expires_at=action_data.expires_at,
-                    function_args=action_data.function_args,
-                    status=action_data.status or "pending",
-                    tool_call_id=action_data.tool_call_id,
-                    tool_name=action_data.tool_name,
-                    turn_index=action_data.turn_index or 0,
-                    # --- [NEW] TELEMETRY FIELDS ---
-                    decision_payload=action_data.decision,  # The full JSON (Why)
-                    confidence_score=calculated_confidence,  # The Index (How sure)
-                    # ------------------------------
-                )
+            return self._create_action(db, action_data)
 
-                db.add(new_action)
-                db.commit()
-                db.refresh(new_action)
+    async def create_action_async(
+        self, action_data: validator.ActionCreate
+    ) -> validator.ActionRead:
+        """create_action on the async engine — used by the orchestration hot path."""
+        logging_utility.info(
+            "Creating action for tool: %s, run_id: %s",
+            action_data.tool_name,
+            action_data.run_id,
+        )
+        action = await run_db(self._create_action, action_data, publish=False)
 
-                return validator.ActionRead(
-                    id=new_action.id,
-                    run_id=new_action.run_id,
-                    tool_call_id=new_action.tool_call_id,
+        from src.api.entities_api.dependencies import get_redis_sync
+
+        await RunEventBus(redis=get_redis_sync()).publish(
+            ACTION_CREATED_EVENT,
+            action.run_id,
+            action_id=action.id,
+            tool_name=action.tool_name,
+            tool_call_id=action.tool_call_id,
+            status=action.status,
+        )
+        return action
+
+    def _create_action(
+        self, db, action_data: validator.ActionCreate, *, publish: bool = True
+    ) -> validator.ActionRead:
+        try:
+            # [FIX 1] Move Logic Inside Try Block
+            # If this fails (e.g. AttributeError), it will now be caught by the generic Exception handler below
+            # instead of returning a raw 500.
+
+            # [FIX 2] Correct Attribute Name
+            # Changed 'action_data.decision_payload' to 'action_data.decision' to match the Pydantic model
+            # field used in the Action constructor below.
+            calculated_confidence = self._normalize_confidence(action_data.decision)
+
+            new_action_id = UtilsInterface.IdentifierService.generate_action_id()
+            new_action = Action(
+                id=new_action_id,
+                run_id=action_data.run_id,
+                triggered_at=datetime.now(),
+                expires_at=action_data.expires_at,
+                function_args=action_data.function_args,
+                status=action_data.status or "pending",
+                tool_call_id=action_data.tool_call_id,
+                tool_name=action_data.tool_name,
+                turn_index=action_data.turn_index or 0,
+                # --- [NEW] TELEMETRY FIELDS ---
+                decision_payload=action_data.decision,  # The full JSON (Why)
+                confidence_score=calculated_confidence,  # The Index (How sure)
+                # ------------------------------
+            )
+
+            db.add(new_action)
+            db.commit()
+            db.refresh(new_action)
+
+            if publish:
+                get_sync_run_event_bus().publish_sync(
+                    ACTION_CREATED_EVENT,
+                    new_action.run_id,
+                    action_id=new_action.id,
                     tool_name=new_action.tool_name,
+                    tool_call_id=new_action.tool_call_id,
                     status=new_action.status,
-                    result=new_action.result,
-                    triggered_at=datetime_to_iso(new_action.triggered_at),
-                    turn_index=new_action.turn_index,
-                )
-            except IntegrityError as e:
-                db.rollback()
-                logging_utility.error("IntegrityError during action creation: %s", str(e))
-                raise HTTPException(status_code=400, detail="Invalid action data")
-            except Exception as e:
-                db.rollback()
-                # Use traceback to make future debugging easier
-                import traceback
-
-                logging_utility.error(
-                    "Unexpected error in CreateAction: %s\n%s",
-                    str(e),
-                    traceback.format_exc(),
-                )
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Server Error during action creation: {str(e)}",
                 )
 
+            return validator.ActionRead(
+                id=new_action.id,
+                run_id=new_action.run_id,
+                tool_call_id=new_action.tool_call_id,
+                tool_name=new_action.tool_name,
+                status=new_action.status,
+                result=new_action.result,
+                triggered_at=datetime_to_iso(new_action.triggered_at),
+                turn_index=new_action.turn_index,
+            )
+        except IntegrityError as e:
+            db.rollback()
+            logging_utility.error("IntegrityError during action creation: %s", str(e))
+            raise HTTPException(status_code=400, detail="Invalid action data")
+        except Exception as e:
+            db.rollback()
+            # Use traceback to make future debugging easier
+            import traceback
+
+            logging_utility.error(
+                "Unexpected error in CreateAction: %s\n%s",
+                str(e),
+                traceback.format_exc(),
+            )
+            raise HTTPException(
+                status_code=500,
+                detail=f"Server Error during action creation: {str(e)}",
+            )
+
     def get_action(self, action_id: str) -> validator.ActionRead:
         """Retrieve an action by its ID with the new tool_name field."""
         with SessionLocal() as db:
@@ -212,6 +324,13 @@ class ActionService:
             db.commit()
             db.refresh(action)
 
+            get_sync_run_event_bus().publish_sync(
+                ACTION_STATUS_EVENT,
+                action.run_id,
+                action_id=action.id,
+                status=getattr(action.status, "value", action.status),
+            )
+
             return validator.ActionRead(
                 id=action.id,
                 run_id=action.run_id,
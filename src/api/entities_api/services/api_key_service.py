@@ -6,6 +6,7 @@ from fastapi import HTTPException, status
 from projectdavid_common import UtilsInterface, ValidationInterface
 from sqlalchemy.orm import Session
 
+from src.api.entities_api.cache.api_key_cache import get_api_key_cache
 from src.api.entities_api.models.models import ApiKey, User
 
 logging_utility = UtilsInterface.LoggingUtility()
@@ -169,6 +170,7 @@ class ApiKeyService:
             api_key.is_active = False
             api_key.last_used_at = None
             self.db.commit()
+            get_api_key_cache().invalidate_sync(key_prefix)
             logging_utility.info(
                 f"API Key with prefix {key_prefix} for user {user_id} revoked successfully."
             )
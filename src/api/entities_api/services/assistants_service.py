@@ -7,7 +7,8 @@ from fastapi import HTTPException
 from projectdavid import Entity
 from projectdavid_common import UtilsInterface, ValidationInterface
 
-from src.api.entities_api.db.database import SessionLocal
+from src.api.entities_api.db.database import (ReadSessionLocal, SessionLocal,
+                                              read_or_primary)
 from src.api.entities_api.models.models import Assistant, User, VectorStore
 from src.api.entities_api.services.logging_service import LoggingUtility
 from src.api.entities_api.utils.cache_utils import get_sync_invalidator
@@ -126,7 +127,7 @@ class AssistantService:
         owner of the assistant.  Raises 403 if user_id does not own the
         record, 404 if the assistant does not exist or is soft-deleted.
         """
-        with SessionLocal() as db:
+        def _read(db):
             db_asst = (
                 db.query(Assistant)
                 .filter(Assistant.id == assistant_id, Assistant.deleted_at.is_(None))
@@ -140,6 +141,8 @@ class AssistantService:
 
             return self.map_to_read_model(db_asst)
 
+        return read_or_primary(_read)
+
     def retrieve_assistant_internal(
         self,
         assistant_id: str,
@@ -154,7 +157,7 @@ class AssistantService:
 
         Raises 404 if the assistant does not exist or is soft-deleted.
         """
-        with SessionLocal() as db:
+        def _read(db):
             db_asst = (
                 db.query(Assistant)
                 .filter(Assistant.id == assistant_id, Assistant.deleted_at.is_(None))
@@ -165,6 +168,8 @@ class AssistantService:
 
             return self.map_to_read_model(db_asst)
 
+        return read_or_primary(_read)
+
     def update_assistant(
         self,
         assistant_id: str,
@@ -224,7 +229,7 @@ class AssistantService:
         ``user.assistants`` relationship so that records created before the
         ``owner_id`` migration are still visible.
         """
-        with SessionLocal() as db:
+        with ReadSessionLocal() as db:
             # ── Primary path: owner_id column (all new records) ──────────────
             owned_by_column = (
                 db.query(Assistant)
@@ -0,0 +1,173 @@
+# src/api/entities_api/services/file_blobs.py
+"""
+Content-addressed file storage with reference counts.
+
+Uploads are stored once per SHA-256 at blob_path_for(sha256); every File
+whose content matches points its FileStorage.storage_path at that object,
+and file_blobs.ref_count counts those rows. A duplicate upload is then a
+metadata insert plus a counter bump — no bytes are written to the share.
+
+Locking protocol (InnoDB row locks on file_blobs):
+
+  claim_blob       Upserts the content's row, which locks it. Stored
+                   content gets a reference at once. New content keeps the
+                   row locked, at ref_count 0, while the caller uploads and
+                   then calls register_blob — all in one transaction, so
+                   no sweep or collect can touch the path mid-upload.
+  release_storage  Decrements only. Physical bytes are never removed in a
+                   transaction that may still roll back.
+  collect_storage  After the releasing transaction commits: re-locks the
+                   row, re-checks ref_count <= 0, deletes the object, then
+                   the row.
+  sweep_unreferenced
+                   collect_storage for every zero-ref row — retries deletes
+                   that failed or were never attempted (purge daemons).
+
+A claim racing a collect waits for it to commit, finds no row and
+re-uploads; a collect racing an upload waits for the uploader to commit
+and then sees ref_count > 0 — neither can leave a row pointing at missing
+bytes.
+
+Files stored before deduplication have no file_blobs row and live outside
+CAS_PREFIX; collect_storage deletes their object directly.
+
+Plain SQL only, so the standalone purge daemons can share it. Callers own
+the transaction and must commit. MySQL in production; the statements
+degrade to their SQLite equivalents so the protocol can be unit-tested.
+"""
+
+from datetime import datetime
+from typing import Callable, Optional
+
+from sqlalchemy import text
+
+CAS_PREFIX = "cas"
+
+
+def blob_path_for(sha256: str) -> str:
+    """Share-relative path of the object holding content `sha256`."""
+    return f"{CAS_PREFIX}/{sha256[:2]}/{sha256[2:4]}/{sha256}"
+
+
+def _is_mysql(db) -> bool:
+    return db.get_bind().dialect.name == "mysql"
+
+
+def _for_update(db) -> str:
+    return " FOR UPDATE" if _is_mysql(db) else ""
+
+
+def claim_blob(db, sha256: str, size: int) -> Optional[str]:
+    """
+    Take a reference on content `sha256`. Returns its storage path when
+    the content is already stored.
+
+    Returns None when it is not: the caller must write the bytes to
+    blob_path_for(sha256), call register_blob and commit, in this
+    transaction — the row stays locked until then.
+    """
+    params = {
+        "sha256": sha256,
+        "storage_path": blob_path_for(sha256),
+        "bytes": size,
+        "now": datetime.utcnow(),
+    }
+    insert = (
+        "INSERT INTO file_blobs "
+        "(sha256, storage_system, storage_path, bytes, ref_count, created_at) "
+        "VALUES (:sha256, 'samba', :storage_path, :bytes, 0, :now) "
+    )
+    if _is_mysql(db):
+        insert += "ON DUPLICATE KEY UPDATE sha256 = sha256"
+    else:
+        insert += "ON CONFLICT (sha256) DO NOTHING"
+    db.execute(text(insert), params)
+
+    blob = db.execute(
+        text(
+            "SELECT storage_path, ref_count FROM file_blobs WHERE sha256 = :sha256"
+            + _for_update(db)
+        ),
+        {"sha256": sha256},
+    ).first()
+    if blob.ref_count <= 0:
+        return None
+    db.execute(
+        text("UPDATE file_blobs SET ref_count = ref_count + 1 WHERE sha256 = :sha256"),
+        {"sha256": sha256},
+    )
+    return blob.storage_path
+
+
+def register_blob(db, sha256: str) -> None:
+    """Record the first reference to content just written for claim_blob."""
+    db.execute(
+        text("UPDATE file_blobs SET ref_count = 1 WHERE sha256 = :sha256"),
+        {"sha256": sha256},
+    )
+
+
+def release_storage(db, storage_path: str) -> bool:
+    """
+    Drop one File's reference to `storage_path`. Returns True when nothing
+    references it any more: once the caller has committed, it removes the
+    object with collect_storage (or leaves it to sweep_unreferenced).
+    """
+    blob = db.execute(
+        text(
+            "SELECT sha256, ref_count FROM file_blobs WHERE storage_path = :storage_path"
+            + _for_update(db)
+        ),
+        {"storage_path": storage_path},
+    ).first()
+
+    if blob is None:
+        # Pre-dedup file: the object belongs to this File alone.
+        return True
+
+    db.execute(
+        text(
+            "UPDATE file_blobs SET ref_count = CASE WHEN ref_count > 1 "
+            "THEN ref_count - 1 ELSE 0 END WHERE sha256 = :sha256"
+        ),
+        {"sha256": blob.sha256},
+    )
+    return blob.ref_count <= 1
+
+
+def collect_storage(db, storage_path: str, delete_physical: Callable[[str], bool]) -> bool:
+    """
+    Delete an object released by a committed transaction, unless it has
+    been claimed again since. Returns False when the physical delete
+    failed — the zero-ref row is kept for sweep_unreferenced.
+    """
+    if not storage_path.startswith(f"{CAS_PREFIX}/"):
+        return delete_physical(storage_path)
+
+    blob = db.execute(
+        text(
+            "SELECT sha256, ref_count FROM file_blobs WHERE storage_path = :storage_path"
+            + _for_update(db)
+        ),
+        {"storage_path": storage_path},
+    ).first()
+    if blob is None or blob.ref_count > 0:
+        return True  # already collected, or referenced again
+    if not delete_physical(storage_path):
+        return False
+    db.execute(text("DELETE FROM file_blobs WHERE sha256 = :sha256"), {"sha256": blob.sha256})
+    return True
+
+
+def sweep_unreferenced(db, delete_physical: Callable[[str], bool]) -> int:
+    """Collect every zero-ref blob. Returns how many objects were removed."""
+    paths = (
+        db.execute(text("SELECT storage_path FROM file_blobs WHERE ref_count <= 0")).scalars().all()
+    )
+    removed = 0
+    for storage_path in paths:
+        # collect_storage re-checks ref_count under the row lock: an upload
+        # may have re-claimed the content since the scan.
+        if collect_storage(db, storage_path, delete_physical):
+            removed += 1
+    return removed
@@ -4,7 +4,7 @@ import hmac
 import io
 import os
 from datetime import datetime, timedelta
-from typing import Optional, Tuple
+from typing import Iterator, NamedTuple, Optional, Tuple
 from urllib.parse import urlencode
 
 from fastapi import HTTPException
@@ -14,24 +14,44 @@ from projectdavid_common.constants.mime_types import (SUPPORTED_MIME_TYPES,
 from projectdavid_common.utilities.logging_service import LoggingUtility
 from sqlalchemy.orm import Session
 
+from src.api.entities_api.cache.file_cache import get_local_file_cache
 from src.api.entities_api.models.models import File, FileStorage, User
-from src.api.entities_api.utils.samba_client import SambaClient
+from src.api.entities_api.services.file_blobs import (blob_path_for,
+                                                      claim_blob,
+                                                      collect_storage,
+                                                      register_blob,
+                                                      release_storage)
+from src.api.entities_api.services.file_storage_index import \
+    get_file_storage_index
+from src.api.entities_api.utils.samba_client import (RANGE_CHUNK_BYTES,
+                                                     get_samba_client)
+from src.api.entities_api.utils.upload_stream import (HashingReader,
+                                                      UploadTooLarge,
+                                                      content_matches)
 
 logging_utility = LoggingUtility()
 validator = ValidationInterface()
 
+FILE_UPLOAD_MAX_BYTES = int(os.getenv("FILE_UPLOAD_MAX_BYTES", str(100 * 1024 * 1024)))
+FILE_UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+
+class DownloadInfo(NamedTuple):
+    storage_path: str
+    filename: str
+    mime_type: str
+    size: int
+    etag: str
+    cache_key: str
+
 
 class FileService:
 
     def __init__(self, db: Session):
         self.identifier_service = UtilsInterface.IdentifierService()
         self.db = db
-        self.samba_client = SambaClient(
-            os.getenv("SMBCLIENT_SERVER"),
-            os.getenv("SMBCLIENT_SHARE"),
-            os.getenv("SMBCLIENT_USERNAME"),
-            os.getenv("SMBCLIENT_PASSWORD"),
-        )
+        # Shared client; SMB connections are pooled process-wide.
+        self.samba_client = get_samba_client()
 
     # ──────────────────────────────────────────────────────────────────
     # Internal ownership helper
@@ -80,48 +100,143 @@ class FileService:
     # ──────────────────────────────────────────────────────────────────
 
     def upload_file(self, file, request) -> File:
+        """
+        Store an upload, deduplicated by content.
+
+        Size, SHA-256 and the content signature are computed in one chunked
+        pass over the spooled upload (constant memory, no extra temp file),
+        refusing oversized uploads early. Content already stored is
+        referenced (see services/file_blobs.py); new content is streamed
+        to its content address.
+        """
         mime_type = self.validate_file_type(file.filename, getattr(file, "content_type", None))
+        declared_size = getattr(file, "size", None)
+        if declared_size is not None and declared_size > FILE_UPLOAD_MAX_BYTES:
+            file.file.close()
+            raise HTTPException(
+                status_code=413,
+                detail=f"File exceeds the {FILE_UPLOAD_MAX_BYTES} byte upload limit",
+            )
+
+        file_id = self.identifier_service.generate_file_id()
+        referenced = None  # storage path this upload holds a reference on
         try:
-            temp_file_path = f"/tmp/{file.filename}"
-            with open(temp_file_path, "wb") as f:
+            # Pass 1 — hash the spooled upload locally; nothing is sent yet.
+            file.file.seek(0)
+            reader = HashingReader(file.file, FILE_UPLOAD_MAX_BYTES)
+            if not content_matches(mime_type, reader.sniffed_mime):
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"File content does not match its type ({mime_type})",
+                )
+            while reader.read(FILE_UPLOAD_CHUNK_BYTES):
+                pass
+
+            # Known content costs a reference, not a transfer.
+            storage_path = claim_blob(self.db, reader.sha256, reader.size)
+            if storage_path is None:
+                # Pass 2 — stream the new content to its content address.
+                # The blob row stays locked until the commit below.
+                storage_path = blob_path_for(reader.sha256)
                 file.file.seek(0)
-                f.write(file.file.read())
+                self.samba_client.upload_stream(file.file, storage_path)
+                register_blob(self.db, reader.sha256)
+            else:
+                logging_utility.info(f"Upload {file_id} deduplicated onto {storage_path}")
+            self.db.commit()
+            referenced = storage_path
+
             file_metadata = File(
-                id=self.identifier_service.generate_file_id(),
+                id=file_id,
                 object="file",
-                bytes=os.path.getsize(temp_file_path),
+                bytes=reader.size,
                 created_at=datetime.now(),
                 expires_at=datetime.utcnow() + timedelta(hours=1),
                 filename=file.filename,
                 purpose=request.purpose,
                 user_id=request.user_id,  # always auth_key.user_id, set in router
                 mime_type=mime_type,
+                sha256=reader.sha256,
             )
             self.db.add(file_metadata)
-            self.db.flush()
-            unique_filename = f"{file_metadata.id}_{file.filename}"
-            self.samba_client.upload_file(temp_file_path, unique_filename)
-            file_storage = FileStorage(
-                file_id=file_metadata.id,
-                storage_system="samba",
-                storage_path=unique_filename,
-                is_primary=True,
-                created_at=datetime.now(),
+            self.db.add(
+                FileStorage(
+                    file_id=file_id,
+                    storage_system="samba",
+                    storage_path=storage_path,
+                    is_primary=True,
+                    created_at=datetime.now(),
+                )
             )
-            self.db.add(file_storage)
             self.db.commit()
             self.db.refresh(file_metadata)
-            os.remove(temp_file_path)
+            get_file_storage_index().remember(file_id, storage_path, file.filename)
+            self._warm_cache(file.file, reader.sha256, reader.size)
             return file_metadata
         except HTTPException:
             raise
+        except UploadTooLarge as e:
+            raise HTTPException(status_code=413, detail=str(e))
         except Exception as e:
             self.db.rollback()
+            if referenced is not None:
+                self._release_reference(referenced)
             logging_utility.error(f"Error uploading file: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Failed to upload file: {str(e)}")
         finally:
             file.file.close()
 
+    @staticmethod
+    def _warm_cache(source, sha256: str, size: int) -> None:
+        """
+        Seed the local cache from the spooled upload. New files — image
+        attachments, code-interpreter outputs — are usually read straight
+        back (next-turn hydration, the signed-URL download).
+        """
+        try:
+            source.seek(0)
+            with get_local_file_cache().writer(sha256, size) as entry:
+                if entry is None:
+                    return
+                while chunk := source.read(FILE_UPLOAD_CHUNK_BYTES):
+                    entry.write(chunk)
+        except Exception as e:
+            logging_utility.warning(f"Could not cache upload {sha256}: {str(e)}")
+
+    def _delete_physical(self, storage_path: str) -> bool:
+        try:
+            self.samba_client.delete_file(storage_path)
+            return True
+        except Exception as e:
+            logging_utility.error(f"Failed to delete file from Samba: {str(e)}")
+            return False
+
+    def _release_reference(self, storage_path: str) -> None:
+        """Undo the reference taken by a failed upload."""
+        try:
+            unreferenced = release_storage(self.db, storage_path)
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logging_utility.warning(f"Could not release {storage_path}: {str(e)}")
+            return
+        if unreferenced:
+            self._collect([storage_path])
+
+    def _collect(self, storage_paths) -> None:
+        """
+        Remove released objects — only after the release has committed, so
+        a rollback can never leave a reference to deleted bytes. Failures
+        are left to the purge daemons' sweep.
+        """
+        for storage_path in storage_paths:
+            try:
+                collect_storage(self.db, storage_path, self._delete_physical)
+                self.db.commit()
+            except Exception as e:
+                self.db.rollback()
+                logging_utility.warning(f"Could not remove {storage_path}: {str(e)}")
+
     # ──────────────────────────────────────────────────────────────────
     # Delete  — ownership enforced
     # ──────────────────────────────────────────────────────────────────
@@ -143,14 +258,19 @@ class FileService:
             storage_locations = (
                 self.db.query(FileStorage).filter(FileStorage.file_id == file_id).all()
             )
-            for storage_location in storage_locations:
-                if storage_location.storage_system == "samba":
-                    try:
-                        self.samba_client.delete_file(storage_location.storage_path)
-                    except Exception as e:
-                        logging_utility.error(f"Failed to delete file from Samba: {str(e)}")
+            # Shared content is only removed with its last reference.
+            unreferenced = [
+                storage_location.storage_path
+                for storage_location in storage_locations
+                if storage_location.storage_system == "samba"
+                and release_storage(self.db, storage_location.storage_path)
+            ]
+            cache_key = get_local_file_cache().key_for(file_id, file_record.sha256)
             self.db.delete(file_record)
             self.db.commit()
+            get_file_storage_index().forget(file_id)
+            get_local_file_cache().discard(cache_key)
+            self._collect(unreferenced)
             return True
         except HTTPException:
             raise
@@ -232,6 +352,16 @@ class FileService:
     # Content retrieval  — ownership enforced on all paths
     # ──────────────────────────────────────────────────────────────────
 
+    def _read_content(self, file_record: File, storage_path: str) -> bytes:
+        """Whole file content, from the local cache when it is there."""
+        cache = get_local_file_cache()
+        key = cache.key_for(file_record.id, file_record.sha256)
+        data = cache.get(key)
+        if data is None:
+            data = self.samba_client.download_file_to_bytes(storage_path)
+            cache.put(key, data)
+        return data
+
     def get_file_as_object(self, file_id: str, *, user_id: str) -> io.BytesIO:
         """
         Retrieve file content as a file-like object.
@@ -244,11 +374,11 @@ class FileService:
         # ── Ownership check ──────────────────────────────────────────
         self._assert_owner(file_record, user_id)
 
-        file_storage = self.db.query(FileStorage).filter(FileStorage.file_id == file_id).first()
+        file_storage = get_file_storage_index().lookup(file_id, self.db)
         if not file_storage:
             raise HTTPException(status_code=404, detail="File storage record not found")
         try:
-            file_bytes = self.samba_client.download_file_to_bytes(file_storage.storage_path)
+            file_bytes = self._read_content(file_record, file_storage.storage_path)
             return io.BytesIO(file_bytes)
         except Exception as e:
             logging_utility.error(f"Error retrieving file object for ID {file_id}: {str(e)}")
@@ -266,11 +396,11 @@ class FileService:
         # ── Ownership check ──────────────────────────────────────────
         self._assert_owner(file_record, user_id)
 
-        file_storage = self.db.query(FileStorage).filter(FileStorage.file_id == file_id).first()
+        file_storage = get_file_storage_index().lookup(file_id, self.db)
         if not file_storage:
             raise HTTPException(status_code=404, detail="File storage record not found")
         try:
-            file_bytes = self.samba_client.download_file_to_bytes(file_storage.storage_path)
+            file_bytes = self._read_content(file_record, file_storage.storage_path)
             return base64.b64encode(file_bytes).decode("utf-8")
         except Exception as e:
             logging_utility.error(f"Error retrieving BASE64 for file ID {file_id}: {str(e)}")
@@ -292,14 +422,14 @@ class FileService:
                 )
                 return None
 
-            file_storage = self.db.query(FileStorage).filter(FileStorage.file_id == file_id).first()
+            file_storage = get_file_storage_index().lookup(file_id, self.db)
             if not file_storage:
                 logging_utility.warning(
                     "get_file_as_base64_internal: no storage record for file_id=%s.", file_id
                 )
                 return None
 
-            file_bytes = self.samba_client.download_file_to_bytes(file_storage.storage_path)
+            file_bytes = self._read_content(file_record, file_storage.storage_path)
             return base64.b64encode(file_bytes).decode("utf-8")
 
         except Exception as e:
@@ -325,6 +455,58 @@ class FileService:
         mime_type = file_record.mime_type or "application/octet-stream"
         return (file_obj, filename, mime_type)
 
+    def get_download_info(self, file_id: str, *, user_id: str) -> DownloadInfo:
+        """
+        Everything needed to serve (part of) a file without reading it.
+        Raises 403 if user_id does not own the file.
+
+        The ETag is strong: content for a file id never changes, and is
+        the SHA-256 when known.
+        """
+        file_record = self.db.query(File).filter(File.id == file_id).first()
+        if not file_record:
+            raise HTTPException(status_code=404, detail="File not found")
+
+        # ── Ownership check ──────────────────────────────────────────
+        self._assert_owner(file_record, user_id)
+
+        file_storage = get_file_storage_index().lookup(file_id, self.db)
+        if not file_storage:
+            raise HTTPException(status_code=404, detail="File storage record not found")
+
+        return DownloadInfo(
+            storage_path=file_storage.storage_path,
+            filename=file_record.filename or f"{file_id}",
+            mime_type=file_record.mime_type or "application/octet-stream",
+            size=file_record.bytes,
+            etag=f'"{file_record.sha256 or file_id}"',
+            cache_key=get_local_file_cache().key_for(file_id, file_record.sha256),
+        )
+
+    def iter_file_range(self, info: DownloadInfo, start: int, end: int) -> Iterator[bytes]:
+        """
+        Stream bytes start..end (inclusive) in chunks — from the local cache
+        when the file is there, else from storage. A full read that misses
+        is copied into the cache as it streams.
+        """
+        cache = get_local_file_cache()
+        cached = cache.iter_range(info.cache_key, start, end, RANGE_CHUNK_BYTES)
+        if cached is not None:
+            return cached
+        chunks = self.samba_client.iter_range(info.storage_path, start, end)
+        if start == 0 and end == info.size - 1:
+            return self._tee_to_cache(chunks, info.cache_key, info.size)
+        return chunks
+
+    @staticmethod
+    def _tee_to_cache(chunks: Iterator[bytes], key: str, size: int) -> Iterator[bytes]:
+        # An aborted download leaves nothing behind — see LocalFileCache.writer.
+        with get_local_file_cache().writer(key, size) as entry:
+            for chunk in chunks:
+                if entry is not None:
+                    entry.write(chunk)
+                yield chunk
+
     def get_file_as_signed_url(
         self, file_id: str, *, user_id: str, expires_in: int = 3600, label: str = None
     ) -> str:
@@ -0,0 +1,102 @@
+# src/api/entities_api/services/file_storage_index.py
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+# Directory levels above each stored file: 2 → "3f/a9/{file_id}_{name}".
+# 0 keeps the legacy flat layout for new uploads.
+FILE_STORAGE_SHARD_DEPTH = int(os.getenv("FILE_STORAGE_SHARD_DEPTH", "2"))
+FILE_STORAGE_CACHE_SIZE = int(os.getenv("FILE_STORAGE_CACHE_SIZE", "10000"))
+
+
+def storage_path_for(file_id: str, filename: str) -> str:
+    """
+    Share-relative path for a new upload. Sharded on a hash of the file id
+    so no directory grows past 256 entries per level.
+    """
+    digest = hashlib.sha256(file_id.encode("utf-8")).hexdigest()
+    shards = [digest[2 * i : 2 * i + 2] for i in range(FILE_STORAGE_SHARD_DEPTH)]
+    return "/".join([*shards, f"{file_id}_{filename}"])
+
+
+class StorageEntry(NamedTuple):
+    storage_path: str
+    filename: Optional[str]
+
+
+class FileStorageIndex:
+    """
+    file_id → FileStorage.storage_path (plus the original filename).
+
+    Every stored file has a FileStorage row recording its exact path, so
+    retrieval is one indexed lookup — never a listing of the share.
+    Entries never change once written, so positive results are kept in a
+    bounded in-process LRU; deletes call forget().
+    """
+
+    def __init__(self, max_entries: int = FILE_STORAGE_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, StorageEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, file_id: str, db=None) -> Optional[StorageEntry]:
+        """
+        The primary Samba location of `file_id`, or None when it has no
+        storage row. Uses `db` when given, else a short-lived session.
+        """
+        with self._lock:
+            entry = self._entries.get(file_id)
+            if entry is not None:
+                self._entries.move_to_end(file_id)
+                return entry
+
+        if db is not None:
+            entry = self._query(db, file_id)
+        else:
+            from src.api.entities_api.db.database import SessionLocal
+
+            with SessionLocal() as session:
+                entry = self._query(session, file_id)
+
+        if entry is not None:
+            self.remember(file_id, entry.storage_path, entry.filename)
+        return entry
+
+    def remember(self, file_id: str, storage_path: str, filename: Optional[str]) -> None:
+        with self._lock:
+            self._entries[file_id] = StorageEntry(storage_path, filename)
+            self._entries.move_to_end(file_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def forget(self, file_id: str) -> None:
+        with self._lock:
+            self._entries.pop(file_id, None)
+
+    @staticmethod
+    def _query(db, file_id: str) -> Optional[StorageEntry]:
+        from src.api.entities_api.models.models import File, FileStorage
+
+        row = (
+            db.query(FileStorage.storage_path, File.filename)
+            .join(File, File.id == FileStorage.file_id)
+            .filter(FileStorage.file_id == file_id, FileStorage.storage_system == "samba")
+            .order_by(FileStorage.is_primary.desc())
+            .first()
+        )
+        return StorageEntry(row.storage_path, row.filename) if row else None
+
+
+# ------------------------------------------------------------------
+# Standalone factory
+# ------------------------------------------------------------------
+_index: Optional[FileStorageIndex] = None
+
+
+def get_file_storage_index() -> FileStorageIndex:
+    global _index
+    if _index is None:
+        _index = FileStorageIndex()
+    return _index
@@ -0,0 +1,200 @@
+# src/api/entities_api/services/message_blob_store.py
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+from projectdavid_common.utilities.logging_service import LoggingUtility
+
+from src.api.entities_api.services.file_storage_index import storage_path_for
+
+LOG = LoggingUtility()
+
+MESSAGE_BLOB_OFFLOAD_ENABLED = os.getenv("MESSAGE_BLOB_OFFLOAD_ENABLED", "true").lower() == "true"
+# Text fields larger than this (UTF-8 bytes) are moved to file storage.
+MESSAGE_BLOB_THRESHOLD_BYTES = int(os.getenv("MESSAGE_BLOB_THRESHOLD_BYTES", "65536"))
+# Characters of the original kept inline as the stub / preview.
+MESSAGE_BLOB_STUB_CHARS = int(os.getenv("MESSAGE_BLOB_STUB_CHARS", "2000"))
+# In-process cache of fetched blobs, bounded by total size.
+MESSAGE_BLOB_CACHE_BYTES = int(os.getenv("MESSAGE_BLOB_CACHE_BYTES", str(64 * 1024 * 1024)))
+
+OFFLOADABLE_FIELDS = ("content", "reasoning")
+
+
+class MessageBlobStore:
+    """
+    Moves oversized Message.content / Message.reasoning out of the row.
+
+    The row keeps a stub — the first MESSAGE_BLOB_STUB_CHARS characters and
+    a marker — and Message.blob_refs records, per field:
+
+        {"content": {"path": "3f/a9/msgblob_<message_id>_content", "sha256": ..., "size": ...}}
+
+    The full text lives on the file storage share. Public reads serve the
+    stub; the context builder resolves the ref lazily via fetch(), which
+    verifies the hash and keeps a size-bounded in-process cache.
+
+    All storage calls block — async callers must use a worker thread.
+    """
+
+    def __init__(self, storage=None):
+        self._storage = storage
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_bytes = 0
+        self._cache_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Write path
+    # ------------------------------------------------------------------
+
+    def offload_fields(self, message_id: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return `fields` with oversized text replaced by stubs and a
+        `blob_refs` entry added. Unchanged when nothing exceeds the threshold.
+        Storage failures keep the text inline.
+        """
+        if not MESSAGE_BLOB_OFFLOAD_ENABLED:
+            return fields
+
+        refs: Dict[str, Dict[str, Any]] = {}
+        out = dict(fields)
+        for name in OFFLOADABLE_FIELDS:
+            text = fields.get(name)
+            if not isinstance(text, str):
+                continue
+            data = text.encode("utf-8")
+            if len(data) <= MESSAGE_BLOB_THRESHOLD_BYTES:
+                continue
+
+            ref = {
+                "path": storage_path_for(f"msgblob_{message_id}", name),
+                "sha256": hashlib.sha256(data).hexdigest(),
+                "size": len(data),
+            }
+            try:
+                self._call("upload_bytes", data, ref["path"])
+            except Exception as exc:
+                LOG.warning("[MessageBlobStore] Offload of %s.%s failed: %s", message_id, name, exc)
+                continue
+
+            refs[name] = ref
+            out[name] = self.stub(text, ref)
+            self._remember(ref["path"], text)
+
+        if refs:
+            out["blob_refs"] = refs
+        return out
+
+    @staticmethod
+    def stub(text: str, ref: Dict[str, Any]) -> str:
+        return (
+            f"{text[:MESSAGE_BLOB_STUB_CHARS]}\n"
+            f"…[truncated: {ref['size']} bytes stored externally, sha256={ref['sha256'][:12]}]"
+        )
+
+    # ------------------------------------------------------------------
+    # Read path
+    # ------------------------------------------------------------------
+
+    def fetch(self, ref: Dict[str, Any]) -> Optional[str]:
+        """Full text for a blob ref, or None when it cannot be read/verified."""
+        path = ref.get("path")
+        if not path:
+            return None
+        with self._cache_lock:
+            cached = self._cache.get(path)
+            if cached is not None:
+                self._cache.move_to_end(path)
+                return cached
+
+        try:
+            data = self._call("download_file_to_bytes", path)
+        except Exception as exc:
+            LOG.warning("[MessageBlobStore] Fetch of %s failed: %s", path, exc)
+            return None
+
+        if hashlib.sha256(data).hexdigest() != ref.get("sha256"):
+            LOG.error("[MessageBlobStore] Hash mismatch for %s; serving stub", path)
+            return None
+
+        text = data.decode("utf-8")
+        self._remember(path, text)
+        return text
+
+    def resolve(self, stored: Optional[str], refs: Optional[Dict[str, Any]], name: str):
+        """The stored value of `name`, with its blob fetched if offloaded."""
+        ref = (refs or {}).get(name)
+        if not ref:
+            return stored
+        full = self.fetch(ref)
+        return full if full is not None else stored
+
+    # ------------------------------------------------------------------
+    # Cleanup
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def paths_of(blob_refs_values: Iterable[Any]) -> List[str]:
+        """Storage paths from Message.blob_refs values (dicts, or raw JSON text)."""
+        paths: List[str] = []
+        for refs in blob_refs_values:
+            if isinstance(refs, str):
+                refs = json.loads(refs)
+            for ref in (refs or {}).values():
+                if isinstance(ref, dict) and ref.get("path"):
+                    paths.append(ref["path"])
+        return paths
+
+    def delete_paths(self, paths: Iterable[str]) -> None:
+        """Best-effort removal after the owning rows are gone."""
+        for path in paths:
+            with self._cache_lock:
+                text = self._cache.pop(path, None)
+                if text is not None:
+                    self._cache_bytes -= len(text)
+            try:
+                self._call("delete_file", path)
+            except Exception as exc:
+                LOG.warning("[MessageBlobStore] Delete of %s failed: %s", path, exc)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _call(self, method: str, *args):
+        if self._storage is None:
+            from src.api.entities_api.utils.samba_client import \
+                get_samba_client
+
+            self._storage = get_samba_client()
+        return getattr(self._storage, method)(*args)
+
+    def _remember(self, path: str, text: str) -> None:
+        size = len(text)
+        if size > MESSAGE_BLOB_CACHE_BYTES:
+            return
+        with self._cache_lock:
+            previous = self._cache.pop(path, None)
+            if previous is not None:
+                self._cache_bytes -= len(previous)
+            self._cache[path] = text
+            self._cache_bytes += size
+            while self._cache_bytes > MESSAGE_BLOB_CACHE_BYTES:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_bytes -= len(evicted)
+
+
+# ------------------------------------------------------------------
+# Standalone factory
+# ------------------------------------------------------------------
+_store: Optional[MessageBlobStore] = None
+
+
+def get_message_blob_store() -> MessageBlobStore:
+    """Process-wide store on the shared (pooled) Samba client."""
+    global _store
+    if _store is None:
+        _store = MessageBlobStore()
+    return _store
@@ -1,23 +1,48 @@
 # src/api/entities_api/services/message_service.py
+import asyncio
 import json
+import os
+import threading
 import time
+from types import SimpleNamespace
 from typing import Any, Dict, List, Optional
 
 from fastapi import HTTPException
 from projectdavid_common import UtilsInterface, ValidationInterface
 
-from src.api.entities_api.db.database import SessionLocal
+from src.api.entities_api.db.database import (ReadSessionLocal, SessionLocal,
+                                              read_or_primary, run_db)
+from src.api.entities_api.db.pagination import filter_after, keyset_page
 from src.api.entities_api.models.models import Message, Thread
 from src.api.entities_api.services.logging_service import LoggingUtility
+from src.api.entities_api.services.message_blob_store import \
+    get_message_blob_store
 
 validator = ValidationInterface()
 logging_utility = LoggingUtility()
 
+# Columns read by _format_message_row. reasoning / meta_data are left out;
+# offloaded content is resolved from blob_refs.
+HISTORY_COLUMNS = (
+    Message.role,
+    Message.content,
+    Message.tool_call_id,
+    Message.attachments,
+    Message.blob_refs,
+)
+# Internal key carrying an unresolved content blob ref between formatting
+# (inside the DB session) and the blob fetch (on a worker thread).
+_BLOB_REF_KEY = "_content_blob_ref"
+HISTORY_YIELD_PER = int(os.getenv("MESSAGE_HISTORY_YIELD_PER", "500"))
+
 
 class MessageService:
 
     def __init__(self):
+        # Shared by every request on the process-wide instance and mutated
+        # from worker threads; only touch it under _chunks_lock.
         self.message_chunks: Dict[str, List[str]] = {}
+        self._chunks_lock = threading.Lock()
         logging_utility.info(f"Initialized MessageService. Source: {__file__}")
 
     # ──────────────────────────────────────────────────────────────────────────
@@ -33,8 +58,29 @@ class MessageService:
                 db_msg.meta_data = {}
         elif db_msg.meta_data is None:
             db_msg.meta_data = {}
+        if db_msg.blob_refs:
+            # Content is served stubbed; advertise where the full text went.
+            db_msg.meta_data = {**db_msg.meta_data, "offloaded": db_msg.blob_refs}
         return db_msg
 
+    @staticmethod
+    def _offload(db_message: Message, offloaded: Optional[Dict[str, Any]] = None) -> None:
+        """Move oversized content / reasoning to blob storage before insert."""
+        if offloaded is None:
+            offloaded = get_message_blob_store().offload_fields(
+                db_message.id,
+                {"content": db_message.content, "reasoning": db_message.reasoning},
+            )
+        for name, value in offloaded.items():
+            setattr(db_message, name, value)
+
+    @staticmethod
+    def _discard_offloaded(blob_refs: Optional[Dict[str, Any]]) -> None:
+        """Delete blobs written by _offload for a row whose insert rolled back."""
+        if blob_refs:
+            blob_store = get_message_blob_store()
+            blob_store.delete_paths(blob_store.paths_of([blob_refs]))
+
     def _assert_thread_owner(self, db: Any, thread_id: str, user_id: str) -> "Thread":
         db_thread = db.query(Thread).filter(Thread.id == thread_id).first()
         if not db_thread:
@@ -137,69 +183,127 @@ class MessageService:
             → LLM PATH — called at LLM consumption time only
             → db must be provided
         """
-        formatted_messages: List[Dict[str, Any]] = []
+        return [
+            self._format_message_row(
+                db_message,
+                hydrate_images=hydrate_images,
+                include_attachments=include_attachments,
+                db=db,
+            )
+            for db_message in messages
+        ]
 
-        for db_message in messages:
-            role = db_message.role
+    def _format_message_row(
+        self,
+        db_message: Any,
+        hydrate_images: bool = False,
+        include_attachments: bool = False,
+        db: Any = None,
+        resolve_blobs: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Format one Message entity or projected history row (see above).
 
-            if role == "tool":
-                formatted_messages.append(
-                    {
-                        "role": "tool",
-                        "tool_call_id": db_message.tool_call_id,
+        Offloaded content is fetched from blob storage. With
+        resolve_blobs=False (no image hydration) an offloaded row is not
+        formatted at all: its fields are parked under _BLOB_REF_KEY and
+        _resolve_deferred_blobs() formats it once the full text is fetched
+        — the shape of an assistant row depends on that text.
+        """
+        if not resolve_blobs:
+            ref = (getattr(db_message, "blob_refs", None) or {}).get("content")
+            if ref and db_message.content is not None:
+                return {
+                    _BLOB_REF_KEY: {
+                        "ref": ref,
+                        "role": db_message.role,
                         "content": db_message.content,
+                        "tool_call_id": db_message.tool_call_id,
+                        "attachments": db_message.attachments,
+                        "include_attachments": include_attachments,
                     }
-                )
-                continue
+                }
+        content = self._row_content(db_message, resolve_blobs)
+        return self._format_row_content(
+            db_message, content, hydrate_images, include_attachments, db
+        )
 
-            if role == "assistant":
-                try:
-                    parsed = json.loads(db_message.content)
-                    is_tool_list = (
-                        isinstance(parsed, list)
-                        and len(parsed) > 0
-                        and all(isinstance(i, dict) and "function" in i for i in parsed)
-                    )
-                    if is_tool_list:
-                        formatted_messages.append(
-                            {
-                                "role": "assistant",
-                                "content": None,
-                                "tool_calls": parsed,
-                            }
-                        )
-                    else:
-                        formatted_messages.append(
-                            {"role": "assistant", "content": db_message.content}
-                        )
-                except (json.JSONDecodeError, TypeError):
-                    formatted_messages.append({"role": "assistant", "content": db_message.content})
-                continue
+    @staticmethod
+    def _row_content(db_message: Any, resolve_blobs: bool) -> Optional[str]:
+        refs = getattr(db_message, "blob_refs", None)
+        if not resolve_blobs or not refs:
+            return db_message.content
+        return get_message_blob_store().resolve(db_message.content, refs, "content")
 
-            # ── User / system / platform messages ─────────────────────────
-            attachments = db_message.attachments or []
+    def _format_row_content(
+        self,
+        db_message: Any,
+        content: Optional[str],
+        hydrate_images: bool,
+        include_attachments: bool,
+        db: Any,
+    ) -> Dict[str, Any]:
+        role = db_message.role
 
-            if hydrate_images and attachments and db is not None:
-                # LLM path: resolve file_ids → base64 content array
-                content = self._hydrate_attachments(db, db_message.content, attachments)
-                formatted_messages.append({"role": role, "content": content})
+        if role == "tool":
+            return {
+                "role": "tool",
+                "tool_call_id": db_message.tool_call_id,
+                "content": content,
+            }
 
-            elif include_attachments and attachments:
-                # Cache path: keep plain text + preserve attachment metadata
-                # so the mixin can hydrate just-in-time before LLM dispatch
-                formatted_messages.append(
-                    {
-                        "role": role,
-                        "content": db_message.content,
-                        "attachments": attachments,  # ← lean file_id refs only
-                    }
+        if role == "assistant":
+            try:
+                parsed = json.loads(content)
+                is_tool_list = (
+                    isinstance(parsed, list)
+                    and len(parsed) > 0
+                    and all(isinstance(i, dict) and "function" in i for i in parsed)
                 )
-
-            else:
-                # Plain text — no attachments or not needed
-                formatted_messages.append({"role": role, "content": db_message.content})
-
-        return formatted_messages
+                if is_tool_list:
+                    return {
+                        "role": "assistant",
+                        "content": None,
+                        "tool_calls": parsed,
+                    }
+                return {"role": "assistant", "content": content}
+            except (json.JSONDecodeError, TypeError):
+                return {"role": "assistant", "content": content}
+
+        # ── User / system / platform messages ─────────────────────────
+        attachments = db_message.attachments or []
+
+        if hydrate_images and attachments and db is not None:
+            # LLM path: resolve file_ids → base64 content array
+            return {"role": role, "content": self._hydrate_attachments(db, content, attachments)}
+
+        if include_attachments and attachments:
+            # Cache path: keep plain text + preserve attachment metadata
+            # so the mixin can hydrate just-in-time before LLM dispatch
+            return {
+                "role": role,
+                "content": content,
+                "attachments": attachments,  # ← lean file_id refs only
+            }
+
+        # Plain text — no attachments or not needed
+        return {"role": role, "content": content}
+
+    def _resolve_deferred_blobs(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Fetch and format rows parked by _format_message_row(resolve_blobs=False)."""
+        store = get_message_blob_store()
+        resolved = []
+        for msg in messages:
+            parked = msg.get(_BLOB_REF_KEY)
+            if parked is None:
+                resolved.append(msg)
+                continue
+            row = SimpleNamespace(**parked)
+            content = store.resolve(row.content, {"content": row.ref}, "content")
+            resolved.append(
+                self._format_row_content(row, content, False, row.include_attachments, None)
+            )
+        return resolved
 
     # ──────────────────────────────────────────────────────────────────────────
     #  Internal / trusted-caller variants  (NO ownership check)
@@ -238,19 +342,24 @@ class MessageService:
                 tool_call_id=getattr(message, "tool_call_id", None),
             )
             try:
+                self._offload(db_message)
                 db.add(db_message)
                 db.commit()
-                db.refresh(db_message)
             except Exception as e:
                 db.rollback()
+                self._discard_offloaded(db_message.blob_refs)
                 logging_utility.error(f"[INTERNAL] Error saving message: {e}")
                 raise HTTPException(status_code=500, detail="Failed to create message")
+            db.refresh(db_message)
 
             return validator.MessageRead.model_validate(self._prepare_for_read(db_message))
 
     def get_raw_messages_internal(
         self,
         thread_id: str,
+        *,
+        after_message_id: Optional[str] = None,
+        since: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         Return lean formatted messages — plain text content with attachment
@@ -266,24 +375,79 @@ class MessageService:
 
         Redis stores these lean dicts. The mixin hydrates images just before
         LLM dispatch — base64 bytes are never written to Redis.
-        """
-        with SessionLocal() as db:
-            db_thread = db.query(Thread).filter(Thread.id == thread_id).first()
-            if not db_thread:
-                raise HTTPException(status_code=404, detail="Thread not found")
 
-            messages = (
-                db.query(Message)
-                .filter(Message.thread_id == thread_id)
-                .order_by(Message.created_at.asc())
-                .all()
+        Pass after_message_id (exclusive) or since (created_at watermark,
+        inclusive) to load only the tail of the thread.
+        """
+        with ReadSessionLocal() as db:
+            return self._get_raw_messages(
+                db, thread_id, after_message_id=after_message_id, since=since
             )
 
-            return self._format_messages_from_db(
-                messages,
-                hydrate_images=False,
-                include_attachments=True,  # ← preserve file_id refs for mixin
+    async def get_raw_messages_internal_async(
+        self,
+        thread_id: str,
+        *,
+        after_message_id: Optional[str] = None,
+        since: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """get_raw_messages_internal on the async engine (orchestration hot path)."""
+        messages = await run_db(
+            self._get_raw_messages,
+            thread_id,
+            after_message_id=after_message_id,
+            since=since,
+            resolve_blobs=False,
+        )
+        if any(_BLOB_REF_KEY in m for m in messages):
+            # Blob storage I/O blocks — never inside the async DB session.
+            messages = await asyncio.to_thread(self._resolve_deferred_blobs, messages)
+        return messages
+
+    def _history_query(
+        self,
+        db: Any,
+        thread_id: str,
+        after_message_id: Optional[str] = None,
+        since: Optional[int] = None,
+    ):
+        """
+        Thread history projected to the columns the formatter reads —
+        reasoning and meta_data (often the bulk of a row) are never fetched.
+        """
+        query = db.query(*HISTORY_COLUMNS).filter(Message.thread_id == thread_id)
+        if since is not None:
+            query = query.filter(Message.created_at >= since)
+        if after_message_id:
+            query = filter_after(query, Message, after_message_id)
+        return query.order_by(Message.created_at.asc(), Message.id.asc())
+
+    def _get_raw_messages(
+        self,
+        db: Any,
+        thread_id: str,
+        after_message_id: Optional[str] = None,
+        since: Optional[int] = None,
+        resolve_blobs: bool = True,
+    ) -> List[Dict[str, Any]]:
+        db_thread = db.query(Thread.id).filter(Thread.id == thread_id).first()
+        if not db_thread:
+            raise HTTPException(status_code=404, detail="Thread not found")
+
+        # Rows are streamed in batches and formatted as they arrive, so the
+        # full thread is never materialised as ORM entities. Nothing else
+        # may query on this session until the iteration finishes.
+        rows = self._history_query(db, thread_id, after_message_id, since).yield_per(
+            HISTORY_YIELD_PER
+        )
+        return [
+            self._format_message_row(
+                row,
+                include_attachments=True,  # ← preserve file_id refs
+                resolve_blobs=resolve_blobs,
             )
+            for row in rows
+        ]
 
     def get_formatted_messages_internal(
         self,
@@ -295,17 +459,13 @@ class MessageService:
         FOR LLM CONSUMPTION ONLY — NativeExecutionService / orchestrator.
         DO NOT use this to populate Redis.
         """
-        with SessionLocal() as db:
+        def _read(db):
             db_thread = db.query(Thread).filter(Thread.id == thread_id).first()
             if not db_thread:
                 raise HTTPException(status_code=404, detail="Thread not found")
 
-            messages = (
-                db.query(Message)
-                .filter(Message.thread_id == thread_id)
-                .order_by(Message.created_at.asc())
-                .all()
-            )
+            # Projected but not streamed: hydration queries the same session.
+            messages = self._history_query(db, thread_id).all()
 
             return self._format_messages_from_db(
                 messages,
@@ -314,37 +474,73 @@ class MessageService:
                 db=db,
             )
 
+        return read_or_primary(_read)
+
     def submit_tool_output_internal(
         self,
         message: validator.MessageCreate,
     ) -> validator.MessageRead:
         """FOR INTERNAL/TRUSTED CALLERS ONLY."""
         with SessionLocal() as db:
-            db_thread = db.query(Thread).filter(Thread.id == message.thread_id).first()
-            if not db_thread:
-                raise HTTPException(status_code=404, detail="Thread not found")
+            return self._submit_tool_output(db, message)
 
-            db_message = Message(
-                id=UtilsInterface.IdentifierService.generate_message_id(),
-                assistant_id=message.assistant_id,
-                content=message.content,
-                created_at=int(time.time()),
-                meta_data=message.meta_data or {},
-                object="message",
-                role="tool",
-                thread_id=message.thread_id,
-                tool_id=message.tool_id,
-                tool_call_id=message.tool_call_id,
+    async def submit_tool_output_internal_async(
+        self,
+        message: validator.MessageCreate,
+    ) -> validator.MessageRead:
+        """submit_tool_output_internal on the async engine (orchestration hot path)."""
+        message_id = UtilsInterface.IdentifierService.generate_message_id()
+        # Blob storage I/O blocks — offload on a worker thread, not inside run_db.
+        offloaded = await asyncio.to_thread(
+            get_message_blob_store().offload_fields, message_id, {"content": message.content}
+        )
+        try:
+            return await run_db(
+                self._submit_tool_output, message, message_id=message_id, offloaded=offloaded
             )
-            try:
-                db.add(db_message)
-                db.commit()
-                db.refresh(db_message)
-            except Exception as e:
-                db.rollback()
-                raise HTTPException(status_code=500, detail="Failed to create message")
+        except HTTPException:
+            # Raised before the insert committed (unknown thread, failed
+            # commit): nothing references the offloaded blobs.
+            await asyncio.to_thread(self._discard_offloaded, offloaded.get("blob_refs"))
+            raise
 
-            return validator.MessageRead.model_validate(self._prepare_for_read(db_message))
+    def _submit_tool_output(
+        self,
+        db: Any,
+        message: validator.MessageCreate,
+        message_id: Optional[str] = None,
+        offloaded: Optional[Dict[str, Any]] = None,
+    ) -> validator.MessageRead:
+        db_thread = db.query(Thread).filter(Thread.id == message.thread_id).first()
+        if not db_thread:
+            raise HTTPException(status_code=404, detail="Thread not found")
+
+        db_message = Message(
+            id=message_id or UtilsInterface.IdentifierService.generate_message_id(),
+            assistant_id=message.assistant_id,
+            content=message.content,
+            created_at=int(time.time()),
+            meta_data=message.meta_data or {},
+            object="message",
+            role="tool",
+            thread_id=message.thread_id,
+            tool_id=message.tool_id,
+            tool_call_id=message.tool_call_id,
+        )
+        try:
+            self._offload(db_message, offloaded)
+            db.add(db_message)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            if offloaded is None:
+                # Pre-offloaded blobs belong to the async caller, which
+                # discards them off the event loop.
+                self._discard_offloaded(db_message.blob_refs)
+            raise HTTPException(status_code=500, detail="Failed to create message")
+        db.refresh(db_message)
+
+        return validator.MessageRead.model_validate(self._prepare_for_read(db_message))
 
     # ──────────────────────────────────────────────────────────────────────────
     #  Public API  (ownership enforced)
@@ -381,37 +577,40 @@ class MessageService:
                 tool_call_id=getattr(message, "tool_call_id", None),
             )
             try:
+                self._offload(db_message)
                 db.add(db_message)
                 db.commit()
-                db.refresh(db_message)
             except Exception as e:
                 db.rollback()
+                self._discard_offloaded(db_message.blob_refs)
                 logging_utility.error(f"Error saving message: {e}")
                 raise HTTPException(status_code=500, detail="Failed to create message")
+            db.refresh(db_message)
 
             return validator.MessageRead.model_validate(self._prepare_for_read(db_message))
 
     def retrieve_message(self, message_id: str, user_id: str) -> validator.MessageRead:
-        with SessionLocal() as db:
+        def _read(db):
             db_message = self._assert_message_owner(db, message_id, user_id)
             return validator.MessageRead.model_validate(self._prepare_for_read(db_message))
 
+        return read_or_primary(_read)
+
     def list_messages(
         self,
         thread_id: str,
         user_id: str,
         limit: int = 20,
         order: str = "asc",
+        after: Optional[str] = None,
+        before: Optional[str] = None,
     ) -> validator.MessagesList:
-        with SessionLocal() as db:
+        def _read(db):
             self._assert_thread_owner(db, thread_id, user_id)
             query = db.query(Message).filter(Message.thread_id == thread_id)
-            query = (
-                query.order_by(Message.created_at.asc())
-                if order == "asc"
-                else query.order_by(Message.created_at.desc())
+            db_messages, has_more = keyset_page(
+                query, Message, limit=limit, order=order, after=after, before=before
             )
-            db_messages = query.limit(limit).all()
             messages = [
                 validator.MessageRead.model_validate(self._prepare_for_read(m)) for m in db_messages
             ]
@@ -419,9 +618,11 @@ class MessageService:
                 data=messages,
                 first_id=messages[0].id if messages else None,
                 last_id=messages[-1].id if messages else None,
-                has_more=len(db_messages) >= limit,
+                has_more=has_more,
             )
 
+        return read_or_primary(_read)
+
     def save_assistant_message_chunk(
         self,
         thread_id: str,
@@ -431,14 +632,13 @@ class MessageService:
         sender_id: str,
         is_last_chunk: bool = False,
     ) -> Optional[validator.MessageRead]:
-        if thread_id not in self.message_chunks:
-            self.message_chunks[thread_id] = []
-        self.message_chunks[thread_id].append(content)
-
-        if not is_last_chunk:
-            return None
-
-        complete_message = "".join(self.message_chunks.pop(thread_id, []))
+        with self._chunks_lock:
+            if not is_last_chunk:
+                self.message_chunks.setdefault(thread_id, []).append(content)
+                return None
+            # Take the buffered prefix and close it with this chunk in one
+            # step, so concurrent finalizations never collect each other's text.
+            complete_message = "".join(self.message_chunks.pop(thread_id, [])) + content
 
         with SessionLocal() as db:
             db_message = Message(
@@ -455,12 +655,14 @@ class MessageService:
                 sender_id=sender_id,
             )
             try:
+                self._offload(db_message)
                 db.add(db_message)
                 db.commit()
-                db.refresh(db_message)
             except Exception as e:
                 db.rollback()
+                self._discard_offloaded(db_message.blob_refs)
                 raise HTTPException(status_code=500, detail="Failed to save message")
+            db.refresh(db_message)
 
             return validator.MessageRead.model_validate(self._prepare_for_read(db_message))
 
@@ -470,14 +672,9 @@ class MessageService:
         user_id: str,
     ) -> List[Dict[str, Any]]:
         """Public API — ownership enforced. Hydrates images for LLM consumption."""
-        with SessionLocal() as db:
+        def _read(db):
             self._assert_thread_owner(db, thread_id, user_id)
-            messages = (
-                db.query(Message)
-                .filter(Message.thread_id == thread_id)
-                .order_by(Message.created_at.asc())
-                .all()
-            )
+            messages = self._history_query(db, thread_id).all()
             return self._format_messages_from_db(
                 messages,
                 hydrate_images=True,
@@ -485,6 +682,8 @@ class MessageService:
                 db=db,
             )
 
+        return read_or_primary(_read)
+
     def submit_tool_output(
         self,
         message: validator.MessageCreate,
@@ -505,12 +704,14 @@ class MessageService:
                 tool_call_id=message.tool_call_id,
             )
             try:
+                self._offload(db_message)
                 db.add(db_message)
                 db.commit()
-                db.refresh(db_message)
             except Exception as e:
                 db.rollback()
+                self._discard_offloaded(db_message.blob_refs)
                 raise HTTPException(status_code=500, detail="Failed to create message")
+            db.refresh(db_message)
 
             return validator.MessageRead.model_validate(self._prepare_for_read(db_message))
 
@@ -518,10 +719,22 @@ class MessageService:
         with SessionLocal() as db:
             self._assert_message_owner(db, message_id, user_id)
             db_msg = db.query(Message).filter(Message.id == message_id).first()
+            blob_refs = db_msg.blob_refs
             db.delete(db_msg)
             db.commit()
+            if blob_refs:
+                blob_store = get_message_blob_store()
+                blob_store.delete_paths(blob_store.paths_of([blob_refs]))
             return validator.MessageDeleted(id=message_id)
 
+    def get_message_content(self, message_id: str, user_id: str) -> str:
+        """Full message content, fetching it from blob storage if offloaded."""
+        def _read(db):
+            db_message = self._assert_message_owner(db, message_id, user_id)
+            return self._row_content(db_message, resolve_blobs=True) or ""
+
+        return read_or_primary(_read)
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 #  Module-level helper
@@ -5,9 +5,14 @@ from typing import Any, Dict, List, Optional
 from projectdavid_common import ValidationInterface
 from projectdavid_common.validation import StatusEnum
 
+from src.api.entities_api.cache.action_output_log import get_action_output_log
+from src.api.entities_api.cache.run_access_cache import RunAccessCache
+from src.api.entities_api.cache.run_state_buffer import (RunStateBuffer,
+                                                         get_run_state_buffer)
 from src.api.entities_api.cache.scratchpad_cache import ScratchpadCache
+from src.api.entities_api.cache.stream_shunt import StreamShuntWriter
 from src.api.entities_api.cache.web_cache import WebSessionCache
-from src.api.entities_api.db.database import SessionLocal
+from src.api.entities_api.db.database import SessionLocal, read_or_primary
 from src.api.entities_api.dependencies import get_redis_sync
 from src.api.entities_api.services.actions_service import ActionService
 from src.api.entities_api.services.assistants_service import AssistantService
@@ -39,6 +44,8 @@ class NativeExecutionService:
     All web-reader calls are routed through UniversalWebReader, which offloads
     network I/O to the remote browserless/chromium container so this service
     stays secure and lightweight.
+
+    Do not construct this directly — use get_native_execution_service().
     """
 
     def __init__(self):
@@ -53,6 +60,94 @@ class NativeExecutionService:
 
         self.scratchpad_svc = ScratchpadService(cache=ScratchpadCache(redis=redis))
         self.web_reader = UniversalWebReader(cache_service=WebSessionCache(redis=redis))
+        self.run_state: RunStateBuffer = get_run_state_buffer()
+        self.run_access = RunAccessCache(redis=redis)
+
+    async def verify_run_access(self, run_id: str, thread_id: str, assistant_id: str) -> str:
+        """
+        The /v1/completions ownership guard in one round-trip.
+
+        Checks that the run exists, that its thread and assistant match the
+        request, and that the run's owner owns or is shared on the (not
+        deleted) assistant — a single primary-key lookup with an indexed
+        EXISTS on user_assistants. Positive results are cached for the run's
+        lifetime (see RunAccessCache).
+
+        Returns the run's user_id.
+        Raises HTTPException 404 (run / assistant not found) or 403.
+        """
+        from fastapi import HTTPException
+
+        cached = await self.run_access.get(run_id)
+        if cached:
+            if cached["thread_id"] != thread_id:
+                raise HTTPException(status_code=403, detail="Thread ID does not match the run.")
+            if cached["assistant_id"] != assistant_id:
+                raise HTTPException(
+                    status_code=403, detail="Assistant ID does not match the run."
+                )
+            return cached["user_id"]
+
+        from sqlalchemy import and_, exists, or_, select
+
+        from src.api.entities_api.models.models import (Assistant, Run,
+                                                        user_assistants)
+
+        shared = exists().where(
+            and_(
+                user_assistants.c.assistant_id == Assistant.id,
+                user_assistants.c.user_id == Run.user_id,
+            )
+        )
+        stmt = (
+            select(
+                Run.user_id,
+                Run.thread_id,
+                Run.assistant_id,
+                Run.expires_at,
+                Assistant.id.label("found_assistant_id"),
+                Assistant.owner_id,
+                or_(Assistant.owner_id == Run.user_id, shared).label("has_access"),
+            )
+            .select_from(Run)
+            .outerjoin(
+                Assistant,
+                and_(Assistant.id == assistant_id, Assistant.deleted_at.is_(None)),
+            )
+            .where(Run.id == run_id)
+        )
+
+        def _query():
+            with SessionLocal() as db:
+                return db.execute(stmt).first()
+
+        row = await asyncio.to_thread(_query)
+
+        if row is None:
+            raise HTTPException(status_code=404, detail="Run not found.")
+        if row.thread_id != thread_id:
+            raise HTTPException(status_code=403, detail="Thread ID does not match the run.")
+        if row.assistant_id != assistant_id:
+            raise HTTPException(status_code=403, detail="Assistant ID does not match the run.")
+        if row.found_assistant_id is None:
+            raise HTTPException(status_code=404, detail="Assistant not found.")
+        if not row.has_access:
+            LOG.warning(
+                "[ACCESS GUARD] User %s attempted inference against assistant %s owned by %s",
+                row.user_id,
+                assistant_id,
+                row.owner_id,
+            )
+            raise HTTPException(status_code=403, detail="You do not have access to this assistant.")
+
+        await self.run_access.set(
+            run_id,
+            user_id=row.user_id,
+            thread_id=row.thread_id,
+            assistant_id=row.assistant_id,
+            expires_at=row.expires_at,
+        )
+        return row.user_id
 
     async def assert_assistant_access(
         self,
@@ -70,35 +165,34 @@ class NativeExecutionService:
 
         from src.api.entities_api.models.models import Assistant
 
-        def _check():
-            with SessionLocal() as db:
-                assistant = (
-                    db.query(Assistant)
-                    .filter(
-                        Assistant.id == assistant_id,
-                        Assistant.deleted_at.is_(None),
-                    )
-                    .first()
+        def _check(db):
+            assistant = (
+                db.query(Assistant)
+                .filter(
+                    Assistant.id == assistant_id,
+                    Assistant.deleted_at.is_(None),
                 )
+                .first()
+            )
 
-                if not assistant:
-                    raise HTTPException(status_code=404, detail="Assistant not found.")
+            if not assistant:
+                raise HTTPException(status_code=404, detail="Assistant not found.")
 
-                is_owner = assistant.owner_id == user_id
-                is_shared = any(u.id == user_id for u in assistant.users)
+            is_owner = assistant.owner_id == user_id
+            is_shared = any(u.id == user_id for u in assistant.users)
 
-                if not is_owner and not is_shared:
-                    LOG.warning(
-                        "[ACCESS GUARD] User %s attempted inference against assistant %s owned by %s",
-                        user_id,
-                        assistant_id,
-                        assistant.owner_id,
-                    )
-                    raise HTTPException(
-                        status_code=403, detail="You do not have access to this assistant."
-                    )
+            if not is_owner and not is_shared:
+                LOG.warning(
+                    "[ACCESS GUARD] User %s attempted inference against assistant %s owned by %s",
+                    user_id,
+                    assistant_id,
+                    assistant.owner_id,
+                )
+                raise HTTPException(
+                    status_code=403, detail="You do not have access to this assistant."
+                )
 
-        await asyncio.to_thread(_check)
+        await asyncio.to_thread(read_or_primary, _check)
 
     # ------------------------------------------------------------------
     # Assistant
@@ -266,7 +360,7 @@ class NativeExecutionService:
             function_args=normalised_args,
             decision=decision,
         )
-        return await asyncio.to_thread(self.action_svc.create_action, req)
+        return await self.action_svc.create_action_async(req)
 
     async def update_action_status(self, action_id: str, status: str) -> Any:
         def _update():
@@ -279,6 +373,16 @@ class NativeExecutionService:
 
         return await asyncio.to_thread(_update)
 
+    def open_action_output(self, action_id: str) -> StreamShuntWriter:
+        """Append-only live output for a streaming tool; close() before completing."""
+        return get_action_output_log().writer(action_id)
+
+    async def complete_action_output(
+        self, action_id: str, full_output: Optional[str], status: Optional[str] = None
+    ) -> None:
+        """Compact the action's output log into Action.result (one write)."""
+        await self.action_svc.complete_action_output_async(action_id, full_output, status=status)
+
     async def create_run(
         self,
         assistant_id: str,
@@ -309,7 +413,7 @@ class NativeExecutionService:
         return await asyncio.to_thread(_create)
 
     async def retrieve_run(self, run_id: str) -> Any:
-        return await asyncio.to_thread(self.run_svc.retrieve_run, run_id)
+        return await self.run_svc.retrieve_run_async(run_id)
 
     async def create_thread(self, user_id: str) -> Any:
         import types
@@ -339,7 +443,13 @@ class NativeExecutionService:
     # Message history — three distinct paths, use the right one
     # ------------------------------------------------------------------
 
-    async def get_raw_messages(self, thread_id: str) -> list:
+    async def get_raw_messages(
+        self,
+        thread_id: str,
+        *,
+        after_message_id: Optional[str] = None,
+        since: Optional[int] = None,
+    ) -> list:
         """
         Fetch LEAN message history — plain text content with attachment
         file_id refs preserved as a sibling "attachments" key.
@@ -350,7 +460,9 @@ class NativeExecutionService:
 
         Never pass this output directly to the LLM — call hydrate_messages() first.
         """
-        return await asyncio.to_thread(self.message_svc.get_raw_messages_internal, thread_id)
+        return await self.message_svc.get_raw_messages_internal_async(
+            thread_id, after_message_id=after_message_id, since=since
+        )
 
     async def get_formatted_messages(self, thread_id: str) -> list:
         """
@@ -462,7 +574,7 @@ class NativeExecutionService:
             tool_call_id=tool_call_id,
             meta_data={"action_id": action_id, "is_error": is_error},
         )
-        return await asyncio.to_thread(self.message_svc.submit_tool_output_internal, msg_req)
+        return await self.message_svc.submit_tool_output_internal_async(msg_req)
 
     async def submit_failed_tool_execution(
         self,
@@ -498,11 +610,40 @@ class NativeExecutionService:
             is_error=True,
         )
 
-    async def update_run_status(self, run_id: str, new_status: str) -> Any:
-        return await asyncio.to_thread(self.run_svc.update_run_status, run_id, new_status)
+    # ------------------------------------------------------------------
+    # Run lifecycle — write-behind via RunStateBuffer
+    # ------------------------------------------------------------------
+
+    async def update_run_status(self, run_id: str, new_status: str) -> None:
+        """
+        Status transitions always reach MySQL before this returns, in the same
+        transaction as any lifecycle fields buffered for the run.
+        Falls back to a direct write if Redis is unavailable.
+        """
+        try:
+            await self.run_state.stage(run_id, status=new_status)
+        except Exception as e:
+            LOG.warning("NativeExec ▸ run-state buffer unavailable for %s (%s).", run_id, e)
+            await asyncio.to_thread(self.run_svc.update_run_status, run_id, new_status)
+
+    async def update_run_fields(self, run_id: str, **fields) -> None:
+        """
+        Per-turn fields (current_turn, started_at, usage) are buffered in Redis
+        and coalesced into the next flush; anything else — terminal stamps,
+        last_error, meta_data — writes through immediately.
+        """
+        try:
+            await self.run_state.stage(run_id, **fields)
+        except Exception as e:
+            LOG.warning("NativeExec ▸ run-state buffer unavailable for %s (%s).", run_id, e)
+            await self.run_svc.apply_run_state_async(run_id, **fields)
 
-    async def update_run_fields(self, run_id: str, **fields) -> Any:
-        return await asyncio.to_thread(self.run_svc.update_run_fields, run_id, **fields)
+    async def flush_run_state(self, run_id: str) -> None:
+        """Persist any buffered lifecycle fields for a run (turn boundary / teardown)."""
+        try:
+            await self.run_state.flush(run_id)
+        except Exception as e:
+            LOG.warning("NativeExec ▸ flush_run_state failed for %s: %s", run_id, e)
 
     async def save_assistant_message_chunk(
         self,
@@ -542,3 +683,22 @@ class NativeExecutionService:
     async def serp_search(self, query: str) -> str:
         LOG.info(f"NativeExec ▸ serp_search: '{query}'")
         return await self.web_reader.perform_serp_search(query)
+
+
+# ------------------------------------------------------------------
+# Standalone factory
+# ------------------------------------------------------------------
+def get_native_execution_service() -> NativeExecutionService:
+    """
+    The shared NativeExecutionService for the current event loop.
+
+    Its CRUD services keep no per-request state (MessageService's chunk
+    buffer is lock-guarded) and the redis.asyncio clients behind the
+    scratchpad / web-reader caches are loop-bound, so one instance per loop
+    (a process singleton outside a loop) is safe to share across requests,
+    workers and caches.
+    """
+    from src.api.entities_api.services.service_container import \
+        get_service_container
+
+    return get_service_container().per_loop(NativeExecutionService, NativeExecutionService)
@@ -10,7 +10,12 @@ from projectdavid_common.utilities.logging_service import LoggingUtility
 from projectdavid_common.validation import StatusEnum
 from sqlalchemy.orm import Session
 
-from src.api.entities_api.db.database import SessionLocal
+from src.api.entities_api.cache.run_event_bus import (RUN_STATUS_EVENT,
+                                                      RunEventBus,
+                                                      get_sync_run_event_bus)
+from src.api.entities_api.db.database import (ReadSessionLocal, SessionLocal,
+                                              read_or_primary, run_db)
+from src.api.entities_api.db.pagination import keyset_page
 from src.api.entities_api.models.models import Assistant, Run
 
 validator = ValidationInterface()
@@ -72,6 +77,12 @@ class RunService:
                 return {}
         return {}
 
+    @staticmethod
+    def _publish_status(run: Run) -> None:
+        """Fan the committed status out to /runs/{run_id}/events subscribers."""
+        status_value = run.status.value if hasattr(run.status, "value") else run.status
+        get_sync_run_event_bus().publish_sync(RUN_STATUS_EVENT, run.id, status=status_value)
+
     def _get_run_or_404(self, run_id: str, db: Session) -> Run:
         run = db.query(Run).filter(Run.id == run_id).first()
         if not run:
@@ -233,15 +244,23 @@ class RunService:
           - Omit it from internal orchestration callers (NativeExecutionService,
             OrchestratorCore) that need to poll any run regardless of ownership.
         """
-        with SessionLocal() as db:
-            run = self._get_run_or_404(run_id, db)
+        return read_or_primary(lambda db: self._retrieve_run(db, run_id, user_id=user_id))
 
-            # ── Ownership check (user-facing calls only) ─────────────────────
-            if user_id is not None:
-                self._assert_owner(run, user_id)
+    async def retrieve_run_async(self, run_id: str) -> validator.RunReadDetailed:
+        """Internal retrieve_run on the async engine (no ownership check)."""
+        return await run_db(self._retrieve_run, run_id)
 
-            base_data = self._to_read_model(run).dict()
-            return validator.RunReadDetailed(**base_data, actions=[])
+    def _retrieve_run(
+        self, db: Session, run_id: str, *, user_id: Optional[str] = None
+    ) -> validator.RunReadDetailed:
+        run = self._get_run_or_404(run_id, db)
+
+        # ── Ownership check (user-facing calls only) ─────────────────────
+        if user_id is not None:
+            self._assert_owner(run, user_id)
+
+        base_data = self._to_read_model(run).dict()
+        return validator.RunReadDetailed(**base_data, actions=[])
 
     def update_run_status(self, run_id: str, new_status: str) -> validator.Run:
         """
@@ -256,6 +275,7 @@ class RunService:
                 raise HTTPException(status_code=400, detail=f"Invalid status: {new_status}")
             db.commit()
             db.refresh(run)
+            self._publish_status(run)
             return self._to_read_model(run)
 
     def update_run_fields(
@@ -311,6 +331,85 @@ class RunService:
             self.logger.info("Run %s fields updated: %s", run_id, list(safe.keys()))
             return self._to_read_model(run)
 
+    def apply_run_state(
+        self,
+        run_id: str,
+        *,
+        status: Optional[str] = None,
+        **kwargs,
+    ) -> validator.Run:
+        """
+        Internal single-transaction write of a coalesced run-state batch.
+
+        Used by the RunStateBuffer write-behind flush: a status transition and
+        any buffered lifecycle fields (current_turn, started_at, ...) land in
+        ONE commit instead of one commit each. Fields outside
+        MUTABLE_RUN_FIELDS are ignored, exactly as in update_run_fields.
+
+        No ownership check — orchestration-internal only, never routed.
+        """
+        with SessionLocal() as db:
+            return self._apply_run_state(db, run_id, status=status, **kwargs)
+
+    async def apply_run_state_async(
+        self,
+        run_id: str,
+        *,
+        status: Optional[str] = None,
+        **kwargs,
+    ) -> validator.Run:
+        """
+        apply_run_state on the async engine — used by the orchestration hot path.
+        The status event is published on the async Redis client afterwards, so
+        nothing blocks the loop inside the session.
+        """
+        run = await run_db(self._apply_run_state, run_id, status=status, publish=False, **kwargs)
+        if status is not None:
+            from src.api.entities_api.dependencies import get_redis_sync
+
+            await RunEventBus(redis=get_redis_sync()).publish(
+                RUN_STATUS_EVENT, run.id, status=getattr(run.status, "value", run.status)
+            )
+        return run
+
+    def _apply_run_state(
+        self,
+        db: Session,
+        run_id: str,
+        *,
+        status: Optional[str] = None,
+        publish: bool = True,
+        **kwargs,
+    ) -> validator.Run:
+        safe = {k: v for k, v in kwargs.items() if k in MUTABLE_RUN_FIELDS}
+
+        run = self._get_run_or_404(run_id, db)
+
+        for field, value in safe.items():
+            if field == "meta_data" and isinstance(value, dict):
+                current = self._ensure_dict(run.meta_data)
+                current.update(value)
+                run.meta_data = current
+            else:
+                setattr(run, field, value)
+
+        if status is not None:
+            try:
+                run.status = StatusEnum(status)
+            except ValueError:
+                raise HTTPException(status_code=400, detail=f"Invalid status: {status}")
+
+        db.commit()
+        db.refresh(run)
+
+        if status is not None and publish:
+            self._publish_status(run)
+
+        self.logger.info(
+            "Run %s state flushed: status=%s fields=%s", run_id, status, list(safe.keys())
+        )
+        return self._to_read_model(run)
+
     def list_runs(
         self,
         *,
@@ -318,18 +417,17 @@ class RunService:
         limit: int = 20,
         order: str = "asc",
         thread_id: Optional[str] = None,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
     ) -> Tuple[List[validator.Run], bool]:
-        with SessionLocal() as db:
+        with ReadSessionLocal() as db:
             q = db.query(Run).filter(Run.user_id == user_id)
             if thread_id:
                 q = q.filter(Run.thread_id == thread_id)
 
-            q = q.order_by(Run.created_at.asc() if order == "asc" else Run.created_at.desc())
-
-            rows = q.limit(limit + 1).all()
-            has_more = len(rows) > limit
-            rows = rows[:limit]
-
+            rows, has_more = keyset_page(
+                q, Run, limit=limit, order=order, after=after, before=before
+            )
             return [self._to_read_model(r) for r in rows], has_more
 
     def cancel_run(self, run_id: str, *, user_id: str) -> validator.Run:
@@ -347,6 +445,7 @@ class RunService:
 
             db.commit()
             db.refresh(run)
+            self._publish_status(run)
             return self._to_read_model(run)
 
     def update_run(
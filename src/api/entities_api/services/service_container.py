@@ -0,0 +1,168 @@
+# src/api/entities_api/services/service_container.py
+"""
+Process-level service container.
+
+Four lifetimes:
+
+  singleton  — one instance per process per key (stateless services,
+               tokenizer-backed helpers). Keys must come from a small,
+               fixed set — entries are never evicted.
+  bounded    — process-wide like singleton, but only the
+               SERVICE_CONTAINER_MAX_CLIENTS most recently used keys are
+               kept. For clients keyed by per-user credentials, where the
+               key space grows with the user base.
+  per_loop   — one instance per running asyncio event loop, for objects that
+               hold loop-bound resources (redis.asyncio pools, httpx clients).
+               Falls back to a singleton when called outside a loop.
+  per_run    — one instance per owner object (a worker built for one run).
+               Owners are held weakly, so the scope disappears with the
+               worker instead of pinning it in memory.
+
+Unlike functools.lru_cache on instance methods, nothing here holds a strong
+reference to the objects that request services.
+"""
+
+import asyncio
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+from projectdavid_common.utilities.logging_service import LoggingUtility
+
+LOG = LoggingUtility()
+
+T = TypeVar("T")
+
+SERVICE_CONTAINER_MAX_CLIENTS = int(os.getenv("SERVICE_CONTAINER_MAX_CLIENTS", "32"))
+
+SINGLETON = "singleton"
+BOUNDED = "bounded"
+PER_LOOP = "per_loop"
+PER_RUN = "per_run"
+
+
+class ServiceContainer:
+
+    def __init__(self, max_clients: int = SERVICE_CONTAINER_MAX_CLIENTS) -> None:
+        self._lock = threading.RLock()
+        self._singletons: Dict[Hashable, Any] = {}
+        self.max_clients = max_clients
+        self._bounded: "OrderedDict[Hashable, Any]" = OrderedDict()
+        # Scopes are keyed weakly on the loop / owner. A per-run service must
+        # not keep a strong reference back to its owner, or the scope lives on.
+        self._loops: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._runs: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    # ------------------------------------------------------------------
+    # Lifetimes
+    # ------------------------------------------------------------------
+
+    def singleton(self, key: Hashable, factory: Callable[[], T]) -> T:
+        return self._get_or_create(self._singletons, key, factory)
+
+    def bounded(self, key: Hashable, factory: Callable[[], T]) -> T:
+        with self._lock:
+            instance = self._bounded.get(key)
+            if instance is not None:
+                self._bounded.move_to_end(key)
+                return instance
+            instance = factory()
+            self._bounded[key] = instance
+            while len(self._bounded) > self.max_clients:
+                self._bounded.popitem(last=False)
+            LOG.debug("ServiceContainer ▸ created %s", key)
+        return instance
+
+    def per_loop(self, key: Hashable, factory: Callable[[], T]) -> T:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self.singleton(key, factory)
+        with self._lock:
+            scope = self._loops.setdefault(loop, {})
+        return self._get_or_create(scope, key, factory)
+
+    def per_run(self, owner: Any, key: Hashable, factory: Callable[[], T]) -> T:
+        with self._lock:
+            scope = self._runs.setdefault(owner, {})
+        return self._get_or_create(scope, key, factory)
+
+    def get(self, lifetime: str, key: Hashable, factory: Callable[[], T], owner: Any = None) -> T:
+        if lifetime == SINGLETON:
+            return self.singleton(key, factory)
+        if lifetime == BOUNDED:
+            return self.bounded(key, factory)
+        if lifetime == PER_LOOP:
+            return self.per_loop(key, factory)
+        if lifetime == PER_RUN:
+            if owner is None:
+                raise ValueError("per_run services need an owner")
+            return self.per_run(owner, key, factory)
+        raise ValueError(f"Unknown service lifetime: {lifetime}")
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def invalidate(self, key: Hashable, owner: Any = None) -> None:
+        with self._lock:
+            if owner is not None:
+                self._runs.get(owner, {}).pop(key, None)
+                return
+            self._singletons.pop(key, None)
+            self._bounded.pop(key, None)
+            for scope in self._loops.values():
+                scope.pop(key, None)
+
+    def reset(self) -> None:
+        """Drop every cached instance (tests / forked workers)."""
+        with self._lock:
+            self._singletons.clear()
+            self._bounded.clear()
+            self._loops.clear()
+            self._runs.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "singletons": len(self._singletons),
+                "bounded": len(self._bounded),
+                "loops": len(self._loops),
+                "runs": len(self._runs),
+            }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _get_or_create(
+        self, scope: Dict[Hashable, Any], key: Hashable, factory: Callable[[], T]
+    ) -> T:
+        instance = scope.get(key)
+        if instance is not None:
+            return instance
+        with self._lock:
+            instance = scope.get(key)
+            if instance is None:
+                instance = factory()
+                scope[key] = instance
+                LOG.debug("ServiceContainer ▸ created %s", key)
+        return instance
+
+
+# ------------------------------------------------------------------
+# Standalone factory
+# ------------------------------------------------------------------
+_container: Optional[ServiceContainer] = None
+_container_lock = threading.Lock()
+
+
+def get_service_container() -> ServiceContainer:
+    global _container
+    if _container is None:
+        with _container_lock:
+            if _container is None:
+                _container = ServiceContainer()
+    return _container
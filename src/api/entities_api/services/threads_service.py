@@ -8,8 +8,11 @@ from projectdavid_common.utilities.logging_service import LoggingUtility
 from sqlalchemy.orm import Session
 
 from entities_api.utils.cache_utils import get_sync_message_cache
-from src.api.entities_api.db.database import SessionLocal
+from src.api.entities_api.db.database import (ReadSessionLocal, SessionLocal,
+                                              read_or_primary)
 from src.api.entities_api.models.models import Message, Thread, User
+from src.api.entities_api.services.message_blob_store import \
+    get_message_blob_store
 
 logging_utility = LoggingUtility()
 validator = ValidationInterface()
@@ -89,10 +92,12 @@ class ThreadService:
             return self._create_thread_read_detailed(db_thread)
 
     def get_thread(self, thread_id: str) -> validator.ThreadReadDetailed:
-        with SessionLocal() as db:
+        def _read(db):
             db_thread = self._get_thread_or_404(thread_id, db)
             return self._create_thread_read_detailed(db_thread)
 
+        return read_or_primary(_read)
+
     def delete_thread(
         self,
         thread_id: str,
@@ -107,11 +112,20 @@ class ThreadService:
                 self._assert_owner(db_thread, user_id)
 
                 # 1. DB Cleanup
+                blob_rows = (
+                    db.query(Message.blob_refs)
+                    .filter(Message.thread_id == thread_id, Message.blob_refs.isnot(None))
+                    .all()
+                )
                 db.query(Message).filter(Message.thread_id == thread_id).delete()
                 db_thread.participants = []
                 db.delete(db_thread)
                 db.commit()
 
+                # Offloaded message content (blob storage) — after the rows are gone.
+                blob_store = get_message_blob_store()
+                blob_store.delete_paths(blob_store.paths_of(row.blob_refs for row in blob_rows))
+
                 # 2. Cache Invalidation
                 try:
                     msg_cache = get_sync_message_cache()
@@ -130,7 +144,7 @@ class ThreadService:
                 raise HTTPException(status_code=500, detail="Delete failed")
 
     def list_threads_by_user(self, user_id: str) -> List[str]:
-        with SessionLocal() as db:
+        with ReadSessionLocal() as db:
             threads = db.query(Thread).join(Thread.participants).filter(User.id == user_id).all()
             return [thread.id for thread in threads]
 
@@ -8,12 +8,17 @@ from projectdavid_common import UtilsInterface, ValidationInterface
 from sqlalchemy import orm
 from sqlalchemy.orm import Session
 
+from src.api.entities_api.cache.file_cache import get_local_file_cache
 from src.api.entities_api.db.database import SessionLocal
 from src.api.entities_api.models.models import (Assistant, AuditLog, File,
                                                 FileStorage, Message, Thread,
                                                 User, VectorStore)
+from src.api.entities_api.services.file_blobs import (collect_storage,
+                                                      release_storage)
 from src.api.entities_api.services.logging_service import LoggingUtility
-from src.api.entities_api.utils.samba_client import SambaClient
+from src.api.entities_api.services.message_blob_store import \
+    get_message_blob_store
+from src.api.entities_api.utils.samba_client import get_samba_client
 
 logging_utility = LoggingUtility()
 
@@ -59,8 +64,9 @@ class UserService:
                     detail="User not found",
                 )
 
-            # ── 1. Physical file deletion from Samba ─────────────────────────
-            self._erase_physical_files(db, user_id)
+            # ── 1. Release the user's stored files ───────────────────────────
+            # Bytes are deleted only after the commit below (step 7).
+            unreferenced = self._erase_physical_files(db, user_id)
 
             # ── 2. Qdrant collection deletion ────────────────────────────────
             self._erase_vector_store_collections(db, user_id)
@@ -81,25 +87,21 @@ class UserService:
             db.delete(db_user)
             db.commit()
 
+            # ── 7. Physical file deletion from Samba ─────────────────────────
+            self._collect_physical_files(db, unreferenced, user_id)
+
             logging_utility.info("GDPR erasure complete for user_id=%s", user_id)
 
     # ─────────────────────────────────────────────────────────────────────────
     # Erasure helpers (private)
     # ─────────────────────────────────────────────────────────────────────────
 
-    def _erase_physical_files(self, db: Session, user_id: str) -> None:
+    def _erase_physical_files(self, db: Session, user_id: str) -> List[str]:
         """
-        Delete every physical file from Samba for all files owned by user_id.
-        Errors are logged but do not abort the erasure — a missing physical
-        file should never block a legal deletion request.
+        Release every stored file owned by user_id. Returns the storage
+        paths no other user's file references; the caller deletes them with
+        _collect_physical_files once the erasure has committed.
         """
-        samba = SambaClient(
-            os.getenv("SMBCLIENT_SERVER"),
-            os.getenv("SMBCLIENT_SHARE"),
-            os.getenv("SMBCLIENT_USERNAME"),
-            os.getenv("SMBCLIENT_PASSWORD"),
-        )
-
         storage_rows = (
             db.query(FileStorage)
             .join(File, File.id == FileStorage.file_id)
@@ -107,22 +109,50 @@ class UserService:
             .all()
         )
 
-        for row in storage_rows:
-            if row.storage_system == "samba":
-                try:
-                    samba.delete_file(row.storage_path)
-                    logging_utility.info(
-                        "Erased physical file: %s (file_id=%s)",
-                        row.storage_path,
-                        row.file_id,
-                    )
-                except Exception as exc:
-                    logging_utility.error(
-                        "Failed to delete physical file %s during erasure of user %s: %s",
-                        row.storage_path,
-                        user_id,
-                        exc,
-                    )
+        # Content shared with another user's file is kept until its last
+        # reference goes; this user's reference goes now.
+        unreferenced = [
+            row.storage_path
+            for row in storage_rows
+            if row.storage_system == "samba" and release_storage(db, row.storage_path)
+        ]
+
+        # Copies cached on this API host go too.
+        cache = get_local_file_cache()
+        for file_id, sha256 in db.query(File.id, File.sha256).filter(File.user_id == user_id):
+            cache.discard(cache.key_for(file_id, sha256))
+
+        return unreferenced
+
+    def _collect_physical_files(self, db: Session, storage_paths: List[str], user_id: str) -> None:
+        """
+        Delete released files from Samba. Errors are logged but do not abort
+        the erasure — a missing physical file should never block a legal
+        deletion request, and the purge daemons' sweep retries failures.
+        """
+        samba = get_samba_client()
+
+        def _delete(storage_path: str) -> bool:
+            try:
+                samba.delete_file(storage_path)
+                return True
+            except Exception as exc:
+                logging_utility.error(
+                    "Failed to delete physical file %s during erasure of user %s: %s",
+                    storage_path,
+                    user_id,
+                    exc,
+                )
+                return False
+
+        for storage_path in storage_paths:
+            try:
+                if collect_storage(db, storage_path, _delete):
+                    logging_utility.info("Erased physical file: %s", storage_path)
+                db.commit()
+            except Exception as exc:
+                db.rollback()
+                logging_utility.error("Could not collect %s: %s", storage_path, exc)
 
     def _erase_vector_store_collections(self, db: Session, user_id: str) -> None:
         """
@@ -165,6 +195,15 @@ class UserService:
         if not thread_id_list:
             return
 
+        # Offloaded content / reasoning lives on the file share, not the row.
+        blob_rows = (
+            db.query(Message.blob_refs)
+            .filter(Message.thread_id.in_(thread_id_list), Message.blob_refs.isnot(None))
+            .all()
+        )
+        blob_store = get_message_blob_store()
+        blob_store.delete_paths(blob_store.paths_of(row.blob_refs for row in blob_rows))
+
         deleted = (
             db.query(Message)
             .filter(Message.thread_id.in_(thread_id_list))
@@ -30,9 +30,9 @@ class AssistantManager:
     def _native_exec(self):
         if getattr(self, "_native_exec_svc", None) is None:
             from src.api.entities_api.services.native_execution_service import \
-                NativeExecutionService
+                get_native_execution_service
 
-            self._native_exec_svc = NativeExecutionService()
+            self._native_exec_svc = get_native_execution_service()
         return self._native_exec_svc
 
     # ------------------------------------------------------------------
@@ -0,0 +1,45 @@
+# src/api/entities_api/utils/range_requests.py
+"""Conditional (If-None-Match) and Range request helpers for file downloads."""
+
+from typing import Optional, Tuple
+
+from fastapi import HTTPException, status
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match uses weak comparison: W/"x" matches "x"."""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag.removeprefix("W/") in candidates
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    (start, end) inclusive for a single `bytes=` range, or None to serve the
+    whole file (malformed or multi-range headers may be ignored per RFC 9110).
+    Raises 416 when the range lies entirely past the end of the file.
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, sep, last = spec.strip().partition("-")
+    first, last = first.strip(), last.strip()
+    if not sep or not (first or last) or not (first + last).isdigit():
+        return None
+    if first:
+        start = int(first)
+        end = int(last) if last else size - 1
+        if last and end < start:
+            return None
+    elif int(last) == 0:
+        start = end = size  # bytes=-0 is well-formed but unsatisfiable
+    else:
+        start, end = max(size - int(last), 0), size - 1
+    if start >= size:
+        raise HTTPException(
+            status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            "Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, min(end, size - 1)
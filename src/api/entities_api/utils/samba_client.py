@@ -2,19 +2,31 @@ import hashlib
 import hmac
 import io
 import os
-import socket
-import time
+import posixpath
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Optional, Set, Tuple
 from urllib.parse import urlencode
 
 from fastapi import HTTPException
-from smb.SMBConnection import SMBConnection
 
 from src.api.entities_api.models.models import File
+from src.api.entities_api.utils.smb_pool import get_smb_pool
+
+# Bytes fetched per SMB read when streaming a file or a byte range.
+RANGE_CHUNK_BYTES = int(os.getenv("SMB_RANGE_CHUNK_BYTES", str(1024 * 1024)))
+
+# (share, path) of remote directories known to exist.
+_known_dirs: Set[Tuple[str, str]] = set()
 
 
 class SambaClient:
+    """
+    File operations on one SMB share.
+
+    Construction is cheap: connections come from the process-wide pool in
+    utils/smb_pool.py and are borrowed per operation, so instances may be
+    created freely and shared across threads.
+    """
 
     def __init__(
         self,
@@ -35,67 +47,11 @@ class SambaClient:
         self.port = port
         self.max_retries = max_retries
         self.retry_delay = retry_delay
-        self.client_name = socket.gethostname()
-        self.server_name = server
-        self.conn = None
-        for retry in range(self.max_retries):
-            try:
-                print(
-                    f"Attempting to connect to SMB server (attempt {retry + 1}/{self.max_retries})..."
-                )
-                self._connect()
-                print(f"Successfully connected to SMB server on attempt {retry + 1}")
-                break
-            except Exception as e:
-                print(f"Connection attempt {retry + 1} failed: {str(e)}")
-                if retry < self.max_retries - 1:
-                    print(f"Retrying in {self.retry_delay} seconds...")
-                    time.sleep(self.retry_delay)
-                else:
-                    raise Exception(
-                        f"Failed to connect to SMB server after {self.max_retries} attempts. Last error: {str(e)}"
-                    )
-
-    def _connect(self):
-        connection_params: List[Dict[str, Any]] = [
-            {"use_ntlm_v2": True, "is_direct_tcp": True},
-            {"use_ntlm_v2": True, "is_direct_tcp": False},
-            {"use_ntlm_v2": False, "is_direct_tcp": True},
-            {"use_ntlm_v2": False, "is_direct_tcp": False},
-        ]
-        errors = []
-        for params in connection_params:
-            try:
-                print(f"Trying connection with parameters: {params}")
-                self.conn = SMBConnection(
-                    self.username,
-                    self.password,
-                    self.client_name,
-                    self.server_name,
-                    domain=self.domain,
-                    **params,
-                )
-                try:
-                    ip_address = socket.gethostbyname(self.server)
-                    print(f"Resolved {self.server} to IP: {ip_address}")
-                except socket.gaierror:
-                    print(f"Warning: Could not resolve hostname {self.server}")
-                if self.conn.connect(self.server, self.port):
-                    print(f"Connected successfully with params: {params}")
-                    return
-                else:
-                    error_msg = "Connection returned false"
-                    print(f"{error_msg} with params: {params}")
-                    errors.append(error_msg)
-            except Exception as e:
-                error_msg = str(e)
-                print(f"Connection attempt failed with params {params}: {error_msg}")
-                errors.append(error_msg)
-        raise Exception(f"Failed to connect to SMB server. Errors: {', '.join(errors)}")
+        self.pool = get_smb_pool(server, username, password, self.domain, port)
 
     def list_files(self, remote_dir: str = ""):
         try:
-            files = self.conn.listPath(self.share, remote_dir)
+            files = self.pool.run(lambda conn: conn.listPath(self.share, remote_dir))
             return [f.filename for f in files if f.filename not in [".", ".."]]
         except Exception as e:
             raise Exception(f"Failed to list files: {str(e)}")
@@ -106,50 +62,114 @@ class SambaClient:
         if not os.path.exists(local_path):
             raise FileNotFoundError(f"Local file not found: {local_path}")
         remote_path = remote_path or os.path.basename(local_path)
-        try:
+
+        def _store(conn):
             with open(local_path, "rb") as file_obj:
-                self.conn.storeFile(self.share, remote_path, file_obj)
+                conn.storeFile(self.share, remote_path, file_obj)
+
+        try:
+            self.makedirs(posixpath.dirname(remote_path))
+            self.pool.run(_store)
         except Exception as e:
             raise Exception(f"Failed to upload file: {str(e)}")
 
+    def upload_bytes(self, data: bytes, remote_path: str):
+        try:
+            self.makedirs(posixpath.dirname(remote_path))
+            self.pool.run(lambda conn: conn.storeFile(self.share, remote_path, io.BytesIO(data)))
+        except Exception as e:
+            raise Exception(f"Failed to upload bytes: {str(e)}")
+
+    def upload_stream(self, file_obj, remote_path: str) -> None:
+        """
+        Store a readable stream chunk by chunk, without buffering it. The
+        stream is consumed once, so a failed transfer is not retried;
+        errors raised by file_obj.read() propagate unchanged.
+        """
+        self.makedirs(posixpath.dirname(remote_path))
+        self.pool.run(lambda conn: conn.storeFile(self.share, remote_path, file_obj), retry=False)
+
     def download_file(self, remote_path: str, local_path: Optional[str] = None):
         local_path = local_path or os.path.basename(remote_path)
-        try:
+
+        def _retrieve(conn):
             with open(local_path, "wb") as file_obj:
-                self.conn.retrieveFile(self.share, remote_path, file_obj)
+                conn.retrieveFile(self.share, remote_path, file_obj)
+
+        try:
+            self.pool.run(_retrieve)
         except Exception as e:
             raise Exception(f"Failed to download file: {str(e)}")
 
     def download_file_to_bytes(self, remote_path: str) -> bytes:
-        file_obj = io.BytesIO()
+        def _retrieve(conn):
+            file_obj = io.BytesIO()
+            conn.retrieveFile(self.share, remote_path, file_obj)
+            return file_obj.getvalue()
+
         try:
-            self.conn.retrieveFile(self.share, remote_path, file_obj)
-            file_obj.seek(0)
-            return file_obj.read()
+            return self.pool.run(_retrieve)
         except Exception as e:
             raise Exception(f"Failed to download file to bytes: {str(e)}")
 
+    def iter_range(
+        self, remote_path: str, start: int, end: int, chunk_size: int = RANGE_CHUNK_BYTES
+    ):
+        """
+        Yield bytes start..end (inclusive) of a stored file, one pooled
+        ranged read per chunk — memory stays at chunk_size.
+        """
+        offset = start
+        while offset <= end:
+            length = min(chunk_size, end - offset + 1)
+
+            def _read(conn, offset=offset, length=length):
+                file_obj = io.BytesIO()
+                conn.retrieveFileFromOffset(self.share, remote_path, file_obj, offset, length)
+                return file_obj.getvalue()
+
+            data = self.pool.run(_read)
+            if not data:
+                return
+            yield data
+            offset += len(data)
+
     def delete_file(self, remote_path: str):
         try:
-            self.conn.deleteFiles(self.share, remote_path)
+            self.pool.run(lambda conn: conn.deleteFiles(self.share, remote_path))
         except Exception as e:
             raise Exception(f"Failed to delete file: {str(e)}")
 
     def create_directory(self, remote_dir: str):
         try:
-            self.conn.createDirectory(self.share, remote_dir)
+            self.pool.run(lambda conn: conn.createDirectory(self.share, remote_dir))
         except Exception as e:
             raise Exception(f"Failed to create directory: {str(e)}")
 
+    def makedirs(self, remote_dir: str):
+        """Create remote_dir and its parents; directories seen before are skipped."""
+        from smb.smb_structs import OperationFailure
+
+        path = ""
+        for part in [p for p in remote_dir.split("/") if p]:
+            path = f"{path}/{part}" if path else part
+            if (self.share, path) in _known_dirs:
+                continue
+            try:
+                self.pool.run(lambda conn, d=path: conn.createDirectory(self.share, d))
+            except OperationFailure:
+                pass  # already exists (or created by a concurrent upload)
+            _known_dirs.add((self.share, path))
+
     def delete_directory(self, remote_dir: str):
         try:
-            self.conn.deleteDirectory(self.share, remote_dir)
+            self.pool.run(lambda conn: conn.deleteDirectory(self.share, remote_dir))
         except Exception as e:
             raise Exception(f"Failed to delete directory: {str(e)}")
 
     def rename(self, old_remote_path: str, new_remote_path: str):
         try:
-            self.conn.rename(self.share, old_remote_path, new_remote_path)
+            self.pool.run(lambda conn: conn.rename(self.share, old_remote_path, new_remote_path))
         except Exception as e:
             raise Exception(f"Failed to rename file/directory: {str(e)}")
 
@@ -175,12 +195,14 @@ class SambaClient:
 
     def find_file_by_id_to_bytes(self, file_id: str, remote_dir: str = "") -> bytes:
         """
-        Locate a file on the Samba share using its file id (assumes naming convention {file_id}_{filename})
-        and return its contents as bytes for in-memory processing.
+        Return the contents of a stored file by its file id.
+
+        The path is resolved through FileStorage (cached) — a single
+        lookup, independent of how many files the share holds.
 
         Args:
             file_id (str): The unique file identifier.
-            remote_dir (str): Optional remote directory to search in.
+            remote_dir (str): Unused; kept for backwards compatibility.
 
         Returns:
             bytes: The file's content as bytes.
@@ -188,28 +210,16 @@ class SambaClient:
         Raises:
             Exception: If the file cannot be found or read.
         """
-        files = self.listdir(remote_dir)
-        target_file = None
-        for filename in files:
-            if filename.startswith(f"{file_id}_"):
-                target_file = filename
-                break
-        if not target_file:
-            raise Exception(f"File with ID {file_id} not found on share.")
-        try:
-            file_bytes = self.download_file_to_bytes(target_file)
-            return file_bytes
-        except Exception as e:
-            raise Exception(f"Failed to retrieve file by ID {file_id}: {str(e)}")
+        _original_filename, file_bytes = self.find_file_by_id_with_name(file_id)
+        return file_bytes
 
     def find_file_by_id_with_name(self, file_id: str, remote_dir: str = "") -> (str, bytes):
         """
-        Locate a file on the Samba share using its file id (assuming naming convention {file_id}_{original_filename})
-        and return its original filename along with its contents as bytes.
+        Return a stored file's original filename along with its contents.
 
         Args:
             file_id (str): The unique file identifier.
-            remote_dir (str): Optional remote directory to search in.
+            remote_dir (str): Unused; kept for backwards compatibility.
 
         Returns:
             tuple: (original_filename, bytes) where original_filename is the file's original name with extension.
@@ -217,30 +227,27 @@ class SambaClient:
         Raises:
             Exception: If the file cannot be found or read.
         """
-        files = self.listdir(remote_dir)
-        target_file = None
-        expected_prefix = f"{file_id}_"
-        for filename in files:
-            if filename.startswith(expected_prefix):
-                target_file = filename
-                break
-        if not target_file:
+        from src.api.entities_api.services.file_storage_index import \
+            get_file_storage_index
+
+        entry = get_file_storage_index().lookup(file_id)
+        if entry is None:
             raise Exception(f"File with ID {file_id} not found on share.")
         try:
-            file_bytes = self.download_file_to_bytes(target_file)
-            original_filename = target_file[len(expected_prefix) :]
+            file_bytes = self.download_file_to_bytes(entry.storage_path)
+            original_filename = entry.filename or posixpath.basename(entry.storage_path)
             return (original_filename, file_bytes)
         except Exception as e:
             raise Exception(f"Failed to retrieve file by ID {file_id}: {str(e)}")
 
     def download_file_as_io(self, file_id: str, remote_dir: str = "") -> (str, io.BytesIO):
         """
-        Locate a file on the Samba share using its file id (assuming naming convention {file_id}_{original_filename}),
-        download its contents, and return both the original filename and an in-memory file-like object (io.BytesIO).
+        Download a stored file by its file id and return both the original filename
+        and an in-memory file-like object (io.BytesIO).
 
         Args:
             file_id (str): The unique file identifier.
-            remote_dir (str): Optional remote directory to search in.
+            remote_dir (str): Unused; kept for backwards compatibility.
 
         Returns:
             tuple: (original_filename, file_io) where:
@@ -256,13 +263,12 @@ class SambaClient:
 
     def save_file_to_disk(self, file_id: str, save_dir: str, remote_dir: str = "") -> str:
         """
-        Locate a file on the Samba share using its file id (assuming naming convention {file_id}_{original_filename}),
-        download its contents into an in-memory BytesIO object, and then save it to disk using the original filename.
+        Download a stored file by its file id and save it to disk using the original filename.
 
         Args:
             file_id (str): The unique file identifier.
             save_dir (str): The local directory where the file will be saved.
-            remote_dir (str): Optional remote directory on the Samba share to search in.
+            remote_dir (str): Unused; kept for backwards compatibility.
 
         Returns:
             str: The full path to the saved file.
@@ -279,3 +285,22 @@ class SambaClient:
             file_io.seek(0)
             f.write(file_io.read())
         return save_path
+
+
+# ------------------------------------------------------------------
+# Standalone factory
+# ------------------------------------------------------------------
+_client: Optional[SambaClient] = None
+
+
+def get_samba_client() -> SambaClient:
+    """Process-wide client for the SMBCLIENT_* share."""
+    global _client
+    if _client is None:
+        _client = SambaClient(
+            os.getenv("SMBCLIENT_SERVER"),
+            os.getenv("SMBCLIENT_SHARE"),
+            os.getenv("SMBCLIENT_USERNAME"),
+            os.getenv("SMBCLIENT_PASSWORD"),
+        )
+    return _client
@@ -0,0 +1,309 @@
+# src/api/entities_api/utils/smb_pool.py
+"""
+Process-wide pool of authenticated SMB connections.
+
+SambaClient used to open (and negotiate) a fresh SMBConnection in its
+constructor, so every FileService(db) paid a full SMB session setup. The
+pool keeps up to SMB_POOL_MAX_SIZE connections per (server, share, user)
+and lends them out one caller at a time — a pysmb connection is not safe
+for concurrent use.
+
+  * Checkout blocks up to SMB_POOL_ACQUIRE_TIMEOUT seconds when every
+    connection is busy.
+  * A connection idle longer than SMB_POOL_HEALTHCHECK_SECONDS is pinged
+    (SMB ECHO) before it is lent; a dead one is replaced.
+  * Connections idle longer than SMB_POOL_IDLE_SECONDS are closed on the
+    next checkout/return.
+  * run() retries an operation once on a fresh connection when the
+    connection itself failed (not when the server rejected the request).
+  * After a failed connect the pool fails fast for SMB_POOL_RETRY_SECONDS
+    instead of repeating the retry loop on every call.
+"""
+
+import os
+import socket
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, TypeVar
+
+from projectdavid_common.utilities.logging_service import LoggingUtility
+
+LOG = LoggingUtility()
+
+SMB_POOL_MAX_SIZE = int(os.getenv("SMB_POOL_MAX_SIZE", "8"))
+SMB_POOL_ACQUIRE_TIMEOUT = float(os.getenv("SMB_POOL_ACQUIRE_TIMEOUT", "30"))
+SMB_POOL_IDLE_SECONDS = float(os.getenv("SMB_POOL_IDLE_SECONDS", "300"))
+SMB_POOL_HEALTHCHECK_SECONDS = float(os.getenv("SMB_POOL_HEALTHCHECK_SECONDS", "60"))
+SMB_POOL_RETRY_SECONDS = float(os.getenv("SMB_POOL_RETRY_SECONDS", "30"))
+
+# Tried in order until one connects; the winner is tried first afterwards.
+_CONNECTION_PARAMS: List[Dict[str, Any]] = [
+    {"use_ntlm_v2": True, "is_direct_tcp": True},
+    {"use_ntlm_v2": True, "is_direct_tcp": False},
+    {"use_ntlm_v2": False, "is_direct_tcp": True},
+    {"use_ntlm_v2": False, "is_direct_tcp": False},
+]
+
+T = TypeVar("T")
+
+
+class SMBPoolExhausted(TimeoutError):
+    pass
+
+
+class SMBConnectionPool:
+
+    def __init__(
+        self,
+        server: str,
+        username: str,
+        password: str,
+        domain: str = "WORKGROUP",
+        port: int = 445,
+        max_size: int = SMB_POOL_MAX_SIZE,
+        connect_retries: int = 5,
+        retry_delay: float = 2,
+    ):
+        self.server = server
+        self.username = username
+        self.password = password
+        self.domain = domain
+        self.port = port
+        self.max_size = max_size
+        self.connect_retries = connect_retries
+        self.retry_delay = retry_delay
+        self.client_name = socket.gethostname()
+
+        self._cond = threading.Condition()
+        # (connection, returned_at) — most recently returned on the right.
+        self._idle: Deque[Tuple[Any, float]] = deque()
+        self._size = 0
+        self._params: Optional[Dict[str, Any]] = None
+        self._unavailable_until = 0.0
+
+    # ------------------------------------------------------------------
+    # Public
+    # ------------------------------------------------------------------
+
+    def run(self, fn: Callable[[Any], T], *, retry: bool = True) -> T:
+        """
+        Call fn(connection) with a pooled connection. After a connection
+        failure fn is retried once on a new one, so it must be safe to
+        repeat — pass retry=False when it consumes a one-shot stream.
+        """
+        from smb.smb_structs import OperationFailure
+
+        for attempt in (1, 2) if retry else (2,):
+            conn = self._acquire()
+            try:
+                result = fn(conn)
+            except OperationFailure:
+                # The server answered; the connection is fine.
+                self._release(conn)
+                raise
+            except Exception as exc:
+                self._discard(conn)
+                if attempt == 2:
+                    raise
+                LOG.warning("[SMBPool] Connection to %s failed (%s); retrying", self.server, exc)
+                continue
+            self._release(conn)
+            return result
+
+    @contextmanager
+    def connection(self):
+        """Lend one connection for several calls; broken ones are dropped."""
+        from smb.smb_structs import OperationFailure
+
+        conn = self._acquire()
+        try:
+            yield conn
+        except OperationFailure:
+            self._release(conn)
+            raise
+        except BaseException:
+            self._discard(conn)
+            raise
+        else:
+            self._release(conn)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "server": self.server,
+                "size": self._size,
+                "idle": len(self._idle),
+                "max_size": self.max_size,
+            }
+
+    def close_all(self) -> None:
+        with self._cond:
+            idle = [conn for conn, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for conn in idle:
+            self._close(conn)
+
+    # ------------------------------------------------------------------
+    # Checkout / return
+    # ------------------------------------------------------------------
+
+    def _acquire(self):
+        deadline = time.monotonic() + SMB_POOL_ACQUIRE_TIMEOUT
+        while True:
+            expired = []
+            with self._cond:
+                while True:
+                    expired.extend(self._evict_idle())
+                    if self._idle:
+                        conn, returned_at = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        conn, returned_at = None, None
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise SMBPoolExhausted(
+                            f"No SMB connection to {self.server} free after "
+                            f"{SMB_POOL_ACQUIRE_TIMEOUT:.0f}s"
+                        )
+                    self._cond.wait(remaining)
+
+            for stale in expired:
+                self._close(stale)
+
+            if conn is None:
+                try:
+                    return self._open()
+                except BaseException:
+                    self._forget()
+                    raise
+
+            if time.monotonic() - returned_at < SMB_POOL_HEALTHCHECK_SECONDS or self._alive(conn):
+                return conn
+            LOG.info("[SMBPool] Dropping dead idle connection to %s", self.server)
+            self._discard(conn)
+
+    def _release(self, conn) -> None:
+        with self._cond:
+            self._idle.append((conn, time.monotonic()))
+            expired = self._evict_idle()
+            self._cond.notify()
+        for stale in expired:
+            self._close(stale)
+
+    def _discard(self, conn) -> None:
+        self._forget()
+        self._close(conn)
+
+    def _forget(self) -> None:
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+    def _evict_idle(self) -> List[Any]:
+        """Pop connections idle past SMB_POOL_IDLE_SECONDS. Caller holds the lock."""
+        cutoff = time.monotonic() - SMB_POOL_IDLE_SECONDS
+        expired = []
+        while self._idle and self._idle[0][1] < cutoff:
+            expired.append(self._idle.popleft()[0])
+            self._size -= 1
+        return expired
+
+    # ------------------------------------------------------------------
+    # Connections
+    # ------------------------------------------------------------------
+
+    def _open(self):
+        if time.monotonic() < self._unavailable_until:
+            raise ConnectionError(f"SMB server {self.server} unavailable; retrying later")
+
+        last_error: Optional[Exception] = None
+        for attempt in range(1, self.connect_retries + 1):
+            try:
+                return self._connect()
+            except Exception as exc:
+                last_error = exc
+                LOG.warning(
+                    "[SMBPool] Connect to %s failed (attempt %d/%d): %s",
+                    self.server,
+                    attempt,
+                    self.connect_retries,
+                    exc,
+                )
+                if attempt < self.connect_retries:
+                    time.sleep(self.retry_delay)
+
+        self._unavailable_until = time.monotonic() + SMB_POOL_RETRY_SECONDS
+        raise ConnectionError(
+            f"Failed to connect to SMB server after {self.connect_retries} attempts. "
+            f"Last error: {last_error}"
+        )
+
+    def _connect(self):
+        from smb.SMBConnection import SMBConnection
+
+        candidates = [self._params] if self._params else []
+        candidates += [p for p in _CONNECTION_PARAMS if p != self._params]
+        errors = []
+        for params in candidates:
+            try:
+                conn = SMBConnection(
+                    self.username,
+                    self.password,
+                    self.client_name,
+                    self.server,
+                    domain=self.domain,
+                    **params,
+                )
+                if conn.connect(self.server, self.port):
+                    if params != self._params:
+                        LOG.info("[SMBPool] Connected to %s with %s", self.server, params)
+                        self._params = params
+                    return conn
+                errors.append(f"{params}: connection returned false")
+            except Exception as exc:
+                errors.append(f"{params}: {exc}")
+        raise ConnectionError(f"Failed to connect to SMB server. Errors: {'; '.join(errors)}")
+
+    @staticmethod
+    def _alive(conn) -> bool:
+        try:
+            conn.echo(b"ping", timeout=5)
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close(conn) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+# ------------------------------------------------------------------
+# Process-wide registry
+# ------------------------------------------------------------------
+_pools: Dict[Tuple[Any, ...], SMBConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_smb_pool(
+    server: str,
+    username: str,
+    password: str,
+    domain: str = "WORKGROUP",
+    port: int = 445,
+) -> SMBConnectionPool:
+    """The shared pool for these credentials, created on first use."""
+    key = (server, username, password, domain, port)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = SMBConnectionPool(server, username, password, domain, port)
+        return pool
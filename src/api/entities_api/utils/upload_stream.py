@@ -0,0 +1,105 @@
+# src/api/entities_api/utils/upload_stream.py
+import hashlib
+from typing import Optional
+
+# Magic-number prefixes for types whose content can be verified.
+_SIGNATURES = (
+    (b"%PDF-", "application/pdf"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"PK\x03\x04", "application/zip"),
+)
+
+# Declared types that must carry a matching signature. Office Open XML
+# documents are zip containers.
+_ZIP_CONTAINERS = (
+    "application/zip",
+    "application/vnd.openxmlformats-officedocument.",
+)
+
+
+class UploadTooLarge(Exception):
+    def __init__(self, limit: int):
+        super().__init__(f"Upload exceeds the {limit} byte limit")
+        self.limit = limit
+
+
+def sniff_mime(head: bytes) -> Optional[str]:
+    """MIME type from the leading bytes, or None when unrecognised."""
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    for magic, mime in _SIGNATURES:
+        if head.startswith(magic):
+            return mime
+    return None
+
+
+def content_matches(declared: str, sniffed: Optional[str]) -> bool:
+    """
+    False when the declared type has a known signature the content lacks
+    (e.g. a .png whose bytes are a PDF). Types without a signature — text,
+    JSON, source code — always match.
+    """
+    if declared.startswith(_ZIP_CONTAINERS):
+        return sniffed == "application/zip"
+    if any(declared == mime for _, mime in _SIGNATURES) or declared == "image/webp":
+        return sniffed == declared
+    return True
+
+
+class HashingReader:
+    """
+    File-like wrapper that counts and hashes bytes as the storage backend
+    pulls them, and aborts with UploadTooLarge once `max_bytes` is
+    exceeded — memory stays at one chunk regardless of upload size.
+
+    The first SNIFF_BYTES are read up front, so sniffed_mime is available
+    before any byte is sent to storage. Works on non-seekable sources.
+    """
+
+    SNIFF_BYTES = 16
+
+    def __init__(self, source, max_bytes: int):
+        self._source = source
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._sha256 = hashlib.sha256()
+        self._head = self._read_head()
+        self._pending = self._head
+
+    def _read_head(self) -> bytes:
+        # A stream may return fewer bytes than asked for before EOF.
+        head = b""
+        while len(head) < self.SNIFF_BYTES:
+            chunk = self._source.read(self.SNIFF_BYTES - len(head))
+            if not chunk:
+                break
+            head += chunk
+        return head
+
+    def read(self, size: int = -1) -> bytes:
+        if self._pending:
+            if size is None or size < 0:
+                chunk = self._pending + self._source.read()
+                self._pending = b""
+            else:
+                chunk, self._pending = self._pending[:size], self._pending[size:]
+        else:
+            chunk = self._source.read(size)
+        if not chunk:
+            return b""
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            raise UploadTooLarge(self.max_bytes)
+        self._sha256.update(chunk)
+        return chunk
+
+    @property
+    def sha256(self) -> str:
+        return self._sha256.hexdigest()
+
+    @property
+    def sniffed_mime(self) -> Optional[str]:
+        return sniff_mime(self._head)
@@ -0,0 +1,109 @@
+# tests/unit/test_admission_control.py
+import asyncio
+
+import fakeredis
+import pytest
+
+from src.api.entities_api.cache import admission_control
+from src.api.entities_api.cache.admission_control import (SCOPE_ASSISTANT,
+                                                          SCOPE_USER,
+                                                          SCOPE_USER_RATE,
+                                                          AdmissionController,
+                                                          AdmissionRejected)
+
+RUN = {"user_id": "user_1", "assistant_id": "asst_1", "model": "together-ai/llama"}
+
+
+@pytest.fixture(autouse=True)
+def limits(monkeypatch):
+    monkeypatch.setattr(admission_control, "ADMISSION_CONTROL_ENABLED", True)
+    monkeypatch.setattr(admission_control, "ADMISSION_USER_MAX_CONCURRENT", 2)
+    monkeypatch.setattr(admission_control, "ADMISSION_ASSISTANT_MAX_CONCURRENT", 5)
+    monkeypatch.setattr(admission_control, "ADMISSION_PROVIDER_MAX_CONCURRENT", 0)
+    monkeypatch.setattr(admission_control, "ADMISSION_USER_RATE_PER_MINUTE", 0)
+
+
+def _controller():
+    return AdmissionController(fakeredis.FakeAsyncRedis(decode_responses=True))
+
+
+def test_disabled_admits_without_a_ticket(monkeypatch):
+    monkeypatch.setattr(admission_control, "ADMISSION_CONTROL_ENABLED", False)
+    assert asyncio.run(_controller().admit("run_1", **RUN)) is None
+
+
+def test_concurrency_limit_rejects_then_release_frees_the_slot():
+    async def scenario():
+        controller = _controller()
+        first = await controller.admit("run_1", **RUN, max_wait=0)
+        await controller.admit("run_2", **RUN, max_wait=0)
+        with pytest.raises(AdmissionRejected) as exc:
+            await controller.admit("run_3", **RUN, max_wait=0)
+
+        await controller.release(first)
+        third = await controller.admit("run_3", **RUN, max_wait=0)
+        slots = await controller.redis.zrange("admission:slots:user:user_1", 0, -1)
+        return first, exc.value, third, slots, controller.metrics()
+
+    first, rejected, third, slots, metrics = asyncio.run(scenario())
+    # A zero limit drops the provider scope entirely.
+    assert first.slot_keys == ["admission:slots:user:user_1", "admission:slots:assistant:asst_1"]
+    assert rejected.scope == SCOPE_USER
+    assert third is not None
+    assert sorted(slots) == ["run_2", "run_3"]
+    assert metrics["admitted"] == 3
+    assert metrics[f"rejected_{SCOPE_USER}"] == 1
+
+
+def test_readmitting_the_same_run_does_not_take_a_second_slot(monkeypatch):
+    monkeypatch.setattr(admission_control, "ADMISSION_USER_MAX_CONCURRENT", 1)
+
+    async def scenario():
+        controller = _controller()
+        await controller.admit("run_1", **RUN, max_wait=0)
+        return await controller.admit("run_1", **RUN, max_wait=0)
+
+    assert asyncio.run(scenario()) is not None
+
+
+def test_rejection_reports_the_failing_scope(monkeypatch):
+    monkeypatch.setattr(admission_control, "ADMISSION_ASSISTANT_MAX_CONCURRENT", 1)
+
+    async def scenario():
+        controller = _controller()
+        await controller.admit("run_1", **RUN, max_wait=0)
+        await controller.admit("run_2", **{**RUN, "user_id": "user_2"}, max_wait=0)
+
+    with pytest.raises(AdmissionRejected) as exc:
+        asyncio.run(scenario())
+    assert exc.value.scope == SCOPE_ASSISTANT
+
+
+def test_token_bucket_limits_bursts(monkeypatch):
+    monkeypatch.setattr(admission_control, "ADMISSION_USER_MAX_CONCURRENT", 0)
+    monkeypatch.setattr(admission_control, "ADMISSION_USER_RATE_PER_MINUTE", 60)
+    monkeypatch.setattr(admission_control, "ADMISSION_USER_BURST", 2)
+
+    async def scenario():
+        controller = _controller()
+        for i in range(2):
+            await controller.admit(f"run_{i}", **RUN, max_wait=0)
+        await controller.admit("run_x", **RUN, max_wait=0)
+
+    with pytest.raises(AdmissionRejected) as exc:
+        asyncio.run(scenario())
+    assert exc.value.scope == SCOPE_USER_RATE
+    assert 0 < exc.value.retry_after <= 1
+
+
+def test_redis_failure_fails_open():
+    class BrokenRedis:
+        def register_script(self, script):
+            async def call(keys, args):
+                raise ConnectionError("redis down")
+
+            return call
+
+    controller = AdmissionController(BrokenRedis())
+    assert asyncio.run(controller.admit("run_1", **RUN)) is None
+    assert controller.metrics()["fail_open"] == 1
@@ -0,0 +1,155 @@
+# tests/unit/test_api_key_cache.py
+import asyncio
+from types import SimpleNamespace
+
+import fakeredis
+import pytest
+from fastapi import HTTPException
+
+from src.api.entities_api import dependencies
+from src.api.entities_api.cache.api_key_cache import ApiKeyCache
+from src.api.entities_api.models.models import ApiKey, User
+from src.api.entities_api.services import api_key_service
+from src.api.entities_api.services.api_key_service import ApiKeyService
+
+PREFIX = "ea_abcde"
+KEY = PREFIX + "secret-rest-of-key"
+HASH = "$2b$12$storedbcrypthash"
+SECRET = b"shared-cache-secret"
+
+
+class FakeQuery:
+    def __init__(self, result):
+        self._result = result
+
+    def filter(self, *criteria):
+        return self
+
+    def first(self):
+        return self._result
+
+
+class FakeDb:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def query(self, model):
+        return FakeQuery(self.rows.get(model))
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+def _cache(server, secret=SECRET):
+    cache = ApiKeyCache(fakeredis.FakeAsyncRedis(server=server, decode_responses=True), secret)
+    cache._sync_redis = fakeredis.FakeRedis(server=server, decode_responses=True)
+    return cache
+
+
+def test_hit_requires_the_same_key_and_hash(server):
+    async def scenario():
+        cache = _cache(server)
+        await cache.mark_verified(PREFIX, KEY, HASH)
+        return (
+            await cache.is_verified(PREFIX, KEY, HASH),
+            await cache.is_verified(PREFIX, KEY, "$2b$12$rotatedhash"),
+            await cache.is_verified(PREFIX, KEY + "x", HASH),
+        )
+
+    assert asyncio.run(scenario()) == (True, False, False)
+
+
+def test_redis_tier_is_bound_to_the_hash_and_secret(server):
+    async def scenario():
+        await _cache(server).mark_verified(PREFIX, KEY, HASH)
+        # Other processes: empty local tier, same Redis.
+        return (
+            await _cache(server).is_verified(PREFIX, KEY, HASH),
+            await _cache(server).is_verified(PREFIX, KEY, "$2b$12$rotatedhash"),
+            await _cache(server, secret=b"other-secret").is_verified(PREFIX, KEY, HASH),
+        )
+
+    assert asyncio.run(scenario()) == (True, False, False)
+
+
+def test_plain_key_is_never_stored(server):
+    async def scenario():
+        cache = _cache(server)
+        await cache.mark_verified(PREFIX, KEY, HASH)
+        return await cache.redis.get(cache._key(PREFIX))
+
+    stored = asyncio.run(scenario())
+    assert stored and KEY not in stored and HASH not in stored
+
+
+def test_revoke_key_invalidates_both_tiers(server, monkeypatch):
+    cache = _cache(server)
+    monkeypatch.setattr(api_key_service, "get_api_key_cache", lambda: cache)
+    asyncio.run(cache.mark_verified(PREFIX, KEY, HASH))
+
+    key = SimpleNamespace(is_active=True, last_used_at=None)
+    db = FakeDb({User: SimpleNamespace(id="user_1"), ApiKey: key})
+    assert ApiKeyService(db).revoke_key("user_1", PREFIX) is True
+
+    assert key.is_active is False
+    assert PREFIX not in cache._local
+    assert asyncio.run(_cache(server).is_verified(PREFIX, KEY, HASH)) is False
+
+
+class FakeKey:
+    def __init__(self):
+        self.hashed_key = HASH
+        self.expires_at = None
+        self.bcrypt_calls = []
+
+    def verify_key(self, plain_key):
+        self.bcrypt_calls.append(plain_key)
+        return plain_key == KEY
+
+
+def _authenticate(cache, monkeypatch, key, presented):
+    monkeypatch.setattr(dependencies, "get_api_key_cache", lambda: cache)
+    return asyncio.run(dependencies.get_api_key(api_key_header=presented, db=FakeDb({ApiKey: key})))
+
+
+def test_wrong_key_with_a_live_entry_falls_through_to_bcrypt(server, monkeypatch):
+    cache = _cache(server)
+    key = FakeKey()
+    assert _authenticate(cache, monkeypatch, key, KEY) is key
+    assert key.bcrypt_calls == [KEY]
+
+    assert _authenticate(cache, monkeypatch, key, KEY) is key
+    assert key.bcrypt_calls == [KEY]  # served from the cache
+
+    wrong = PREFIX + "guessed"
+    with pytest.raises(HTTPException) as exc:
+        _authenticate(cache, monkeypatch, key, wrong)
+    assert exc.value.status_code == 401
+    assert key.bcrypt_calls == [KEY, wrong]
+
+
+def test_redis_failure_falls_through_to_bcrypt(monkeypatch):
+    class BrokenRedis:
+        async def get(self, key):
+            raise ConnectionError("redis down")
+
+        async def set(self, key, value, ex=None):
+            raise ConnectionError("redis down")
+
+    cache = ApiKeyCache(BrokenRedis(), SECRET)
+    assert asyncio.run(cache.is_verified(PREFIX, KEY, HASH)) is False
+
+    key = FakeKey()
+    assert _authenticate(cache, monkeypatch, key, KEY) is key
+    assert key.bcrypt_calls == [KEY]
+    # The local tier still spares the next request a bcrypt check.
+    assert _authenticate(cache, monkeypatch, key, KEY) is key
+    assert key.bcrypt_calls == [KEY]
@@ -0,0 +1,110 @@
+# tests/unit/test_delegation_batch.py
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.api.entities_api.orchestration.mixins.delegation_mixin import DelegationMixin
+
+# Per-call worker behaviour: seconds to run, or an exception to raise.
+PLAN = {"call_fast": 0.01, "call_slow": 5, "call_mid": 0.05, "call_bad": RuntimeError("boom")}
+
+
+class FakeNativeExec:
+    def __init__(self):
+        self.run_fields = []
+
+    async def retrieve_run(self, run_id):
+        return SimpleNamespace(user_id="user_1")
+
+    async def update_run_fields(self, run_id, **fields):
+        self.run_fields.append(fields)
+
+
+class Supervisor(DelegationMixin):
+    def __init__(self):
+        super().__init__()
+        self._native_exec = FakeNativeExec()
+        self.outputs = {}
+
+    async def submit_tool_output(self, *, tool_call_id, content, is_error, **kwargs):
+        assert tool_call_id not in self.outputs
+        self.outputs[tool_call_id] = (content, is_error)
+
+    async def handle_delegate_research_task(
+        self,
+        thread_id,
+        run_id,
+        assistant_id,
+        arguments_dict,
+        tool_call_id,
+        decision,
+        *,
+        task_id=None,
+        results=None,
+        scrub_api_key=True,
+    ):
+        yield self._research_status("started", "in_progress", run_id, task_id)
+        step = PLAN[tool_call_id]
+        if isinstance(step, Exception):
+            # Mirrors the real handler: errors become a status, not an output.
+            yield self._research_status(f"Error: {step}", "error", run_id, task_id)
+            return
+        await asyncio.sleep(step)
+        await self.submit_tool_output(tool_call_id=tool_call_id, content="report", is_error=False)
+        results[task_id] = "report"
+
+
+def _run(call_ids, **policy):
+    supervisor = Supervisor()
+    calls = [{"tool_call_id": call_id, "arguments": {"task": call_id}} for call_id in call_ids]
+
+    async def scenario():
+        return [
+            json.loads(chunk)
+            async for chunk in supervisor.handle_delegate_research_batch(
+                "thread_1", "run_1", "asst_1", calls, **policy
+            )
+        ]
+
+    return supervisor, asyncio.run(scenario())
+
+
+def test_all_waits_for_every_worker():
+    supervisor, chunks = _run(["call_fast", "call_mid"], join_policy="all")
+    assert supervisor.outputs == {
+        "call_fast": ("report", False),
+        "call_mid": ("report", False),
+    }
+    assert {c["task_id"] for c in chunks} == {"call_fast", "call_mid"}
+    assert supervisor._native_exec.run_fields == [{"meta_data": {"api_key": "***"}}]
+
+
+def test_first_k_cancels_the_rest_with_an_error_output():
+    supervisor, chunks = _run(
+        ["call_fast", "call_slow", "call_mid"], join_policy="first_k", join_k=2
+    )
+    assert supervisor.outputs["call_fast"] == ("report", False)
+    assert supervisor.outputs["call_mid"] == ("report", False)
+    content, is_error = supervisor.outputs["call_slow"]
+    assert is_error and "stopped before it finished" in content
+    assert chunks[-1]["task_id"] == "call_slow" and chunks[-1]["state"] == "error"
+
+
+def test_timeout_keeps_what_finished_in_time():
+    supervisor, _ = _run(["call_fast", "call_slow"], join_policy="timeout", join_timeout=0.2)
+    assert supervisor.outputs["call_fast"] == ("report", False)
+    assert supervisor.outputs["call_slow"][1] is True
+
+
+def test_failed_sibling_still_gets_a_tool_output():
+    supervisor, _ = _run(["call_fast", "call_bad"], join_policy="all")
+    assert set(supervisor.outputs) == {"call_fast", "call_bad"}
+    content, is_error = supervisor.outputs["call_bad"]
+    assert is_error and "failed before returning a result" in content
+
+
+def test_duplicate_tool_call_ids_are_rejected():
+    with pytest.raises(ValueError):
+        _run(["call_fast", "call_fast"])
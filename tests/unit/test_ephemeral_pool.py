@@ -0,0 +1,79 @@
+# tests/unit/test_ephemeral_pool.py
+import asyncio
+import itertools
+
+import fakeredis
+import pytest
+
+from src.api.entities_api.cache import ephemeral_pool
+from src.api.entities_api.cache.ephemeral_pool import (ROLE_RESEARCH_WORKER,
+                                                       EphemeralPool,
+                                                       PooledResource)
+
+USER = "user_1"
+
+
+class FakeManager:
+    def __init__(self):
+        self.created = []
+        self.deleted = []
+        self._ids = itertools.count(1)
+
+    async def create_ephemeral_worker_assistant(self, user_id):
+        resource = PooledResource(id=f"asst_{next(self._ids)}", role=ROLE_RESEARCH_WORKER)
+        self.created.append(resource.id)
+        return resource
+
+    async def delete_assistant(self, assistant_id, user_id, permanent):
+        self.deleted.append(assistant_id)
+
+
+class FakeAssistantCache:
+    async def retrieve(self, assistant_id):
+        return None
+
+
+def _pool(redis):
+    pool = EphemeralPool(redis)
+    pool._manager = FakeManager()
+    pool._assistant_cache = FakeAssistantCache()
+    return pool
+
+
+@pytest.fixture(autouse=True)
+def pool_size(monkeypatch):
+    monkeypatch.setattr(ephemeral_pool, "EPHEMERAL_POOL_SIZE", 2)
+
+
+def test_concurrent_releases_never_overfill_the_pool():
+    async def scenario():
+        redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+        pool = _pool(redis)
+        await asyncio.gather(
+            *(pool.release(ROLE_RESEARCH_WORKER, USER, f"asst_{i}") for i in range(6))
+        )
+        key = pool._pool_key(ROLE_RESEARCH_WORKER, USER)
+        return pool, await redis.lrange(key, 0, -1), await redis.zcard("ephemeral_pool:index")
+
+    pool, pooled, indexed = asyncio.run(scenario())
+    assert len(pooled) == 2
+    assert indexed == 2
+    assert sorted(pool.manager.deleted + pooled) == sorted(f"asst_{i}" for i in range(6))
+
+
+def test_lease_pops_pooled_row_and_refill_tops_up():
+    async def scenario():
+        redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+        pool = _pool(redis)
+        await pool.release(ROLE_RESEARCH_WORKER, USER, "asst_pooled")
+        leased = await pool.lease(ROLE_RESEARCH_WORKER, USER)
+        assert pool._tasks  # the refill is referenced while it runs
+        await asyncio.gather(*pool._tasks)
+        key = pool._pool_key(ROLE_RESEARCH_WORKER, USER)
+        return pool, leased, await redis.lrange(key, 0, -1)
+
+    pool, leased, pooled = asyncio.run(scenario())
+    assert leased.id == "asst_pooled"
+    assert pooled == pool.manager.created
+    assert len(pooled) == 2
+    assert not pool._tasks
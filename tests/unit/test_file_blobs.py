@@ -0,0 +1,142 @@
+# tests/unit/test_file_blobs.py
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from src.api.entities_api.services.file_blobs import (blob_path_for,
+                                                      claim_blob,
+                                                      collect_storage,
+                                                      register_blob,
+                                                      release_storage,
+                                                      sweep_unreferenced)
+
+SHA = "ab" * 32
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE file_blobs ("
+                "sha256 VARCHAR(64) PRIMARY KEY, storage_system VARCHAR(32), "
+                "storage_path VARCHAR(512) UNIQUE, bytes BIGINT, "
+                "ref_count INTEGER NOT NULL, created_at DATETIME)"
+            )
+        )
+    with Session(engine) as session:
+        yield session
+
+
+class _Share:
+    """Records physical deletes; fails them while `broken` is set."""
+
+    def __init__(self):
+        self.deleted = []
+        self.broken = False
+
+    def __call__(self, storage_path):
+        if self.broken:
+            return False
+        self.deleted.append(storage_path)
+        return True
+
+
+def _ref_count(db):
+    return db.execute(
+        text("SELECT ref_count FROM file_blobs WHERE sha256 = :s"), {"s": SHA}
+    ).scalar()
+
+
+def _store(db):
+    assert claim_blob(db, SHA, 10) is None
+    register_blob(db, SHA)
+    db.commit()
+
+
+def test_blob_path_is_sharded_by_hash():
+    assert blob_path_for(SHA) == f"cas/ab/ab/{SHA}"
+
+
+def test_first_claim_requires_upload_then_dedups(db):
+    _store(db)
+    assert _ref_count(db) == 1
+
+    assert claim_blob(db, SHA, 10) == blob_path_for(SHA)
+    db.commit()
+    assert _ref_count(db) == 2
+
+
+def test_rolled_back_upload_leaves_no_row(db):
+    assert claim_blob(db, SHA, 10) is None
+    db.rollback()
+    assert _ref_count(db) is None
+
+
+def test_release_keeps_shared_content(db):
+    _store(db)
+    claim_blob(db, SHA, 10)
+    db.commit()
+
+    assert release_storage(db, blob_path_for(SHA)) is False
+    db.commit()
+    assert _ref_count(db) == 1
+
+
+def test_last_release_deletes_nothing_until_collected(db):
+    share = _Share()
+    _store(db)
+
+    assert release_storage(db, blob_path_for(SHA)) is True
+    db.rollback()  # e.g. the File row delete failed
+    assert _ref_count(db) == 1
+    assert share.deleted == []
+
+    assert release_storage(db, blob_path_for(SHA)) is True
+    db.commit()
+    assert collect_storage(db, blob_path_for(SHA), share)
+    db.commit()
+    assert share.deleted == [blob_path_for(SHA)]
+    assert _ref_count(db) is None
+
+
+def test_collect_skips_reclaimed_content(db):
+    share = _Share()
+    _store(db)
+    release_storage(db, blob_path_for(SHA))
+    db.commit()
+
+    # Re-uploaded before the collect ran: the zero-ref row is claimed again.
+    assert claim_blob(db, SHA, 10) is None
+    register_blob(db, SHA)
+    db.commit()
+
+    assert collect_storage(db, blob_path_for(SHA), share)
+    assert share.deleted == []
+    assert _ref_count(db) == 1
+
+
+def test_legacy_paths_are_deleted_directly(db):
+    share = _Share()
+    assert release_storage(db, "3f/a9/file_1_report.pdf") is True
+    assert collect_storage(db, "3f/a9/file_1_report.pdf", share)
+    assert share.deleted == ["3f/a9/file_1_report.pdf"]
+
+
+def test_sweep_retries_failed_deletes(db):
+    share = _Share()
+    _store(db)
+    release_storage(db, blob_path_for(SHA))
+    db.commit()
+
+    share.broken = True
+    assert collect_storage(db, blob_path_for(SHA), share) is False
+    db.commit()
+    assert _ref_count(db) == 0
+
+    share.broken = False
+    assert sweep_unreferenced(db, share) == 1
+    db.commit()
+    assert share.deleted == [blob_path_for(SHA)]
+    assert _ref_count(db) is None
@@ -0,0 +1,75 @@
+# tests/unit/test_file_cache.py
+import os
+
+import pytest
+
+from src.api.entities_api.cache.file_cache import LocalFileCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LocalFileCache(root=str(tmp_path), max_bytes=100, max_entry_bytes=40)
+
+
+def _age(cache, key, seconds):
+    path = cache._path(key)
+    mtime = os.path.getmtime(path) - seconds
+    os.utime(path, (mtime, mtime))
+
+
+def test_put_get_and_discard(cache):
+    assert cache.get("k") is None
+    cache.put("k", b"hello")
+    assert cache.get("k") == b"hello"
+    cache.discard("k")
+    assert cache.get("k") is None
+
+
+def test_iter_range(cache):
+    cache.put("k", b"0123456789")
+    assert list(cache.iter_range("k", 2, 8, chunk_size=3)) == [b"234", b"567", b"8"]
+    assert cache.iter_range("k", 0, 10, chunk_size=3) is None  # past the entry
+    assert cache.iter_range("missing", 0, 1, chunk_size=3) is None
+
+
+def test_oversized_and_empty_content_is_not_cached(cache):
+    cache.put("big", b"x" * 41)
+    cache.put("empty", b"")
+    assert cache.get("big") is None
+    assert cache.get("empty") is None
+
+
+def test_short_or_failed_writes_are_not_published(cache):
+    with cache.writer("short", 10) as entry:
+        entry.write(b"12345")
+    assert cache.get("short") is None
+
+    with pytest.raises(RuntimeError):
+        with cache.writer("failed", 5) as entry:
+            entry.write(b"12345")
+            raise RuntimeError("source died")
+    assert cache.get("failed") is None
+    assert not any(name.endswith(".part") for _, _, names in os.walk(cache.root) for name in names)
+
+
+def test_eviction_trims_least_recently_used_to_low_water(cache):
+    for key in ("a", "b", "c"):
+        cache.put(key, b"x" * 30)
+    _age(cache, "a", 30)
+    _age(cache, "b", 20)
+    _age(cache, "c", 10)
+    cache.get("a")  # a hit makes "a" the most recent
+
+    cache.put("d", b"x" * 30)  # 120 bytes > 100: trim to 80
+    assert cache.get("b") is None
+    assert cache.get("c") is None
+    assert cache.get("a") is not None
+    assert cache.get("d") is not None
+    assert cache._bytes == 60
+
+
+def test_zero_max_bytes_disables_the_cache(tmp_path):
+    cache = LocalFileCache(root=str(tmp_path / "off"), max_bytes=0)
+    cache.put("k", b"hello")
+    assert cache.get("k") is None
+    assert not os.path.exists(cache.root)
@@ -0,0 +1,83 @@
+# tests/unit/test_message_blob_formatting.py
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.api.entities_api.services import message_service
+from src.api.entities_api.services.message_blob_store import MessageBlobStore
+from src.api.entities_api.services.message_service import MessageService
+
+
+class FakeStorage:
+    def __init__(self):
+        self.files = {}
+
+    def upload_bytes(self, data, path):
+        self.files[path] = data
+
+    def download_file_to_bytes(self, path):
+        return self.files[path]
+
+
+def _tool_calls():
+    # Arguments large enough to push the row past the offload threshold.
+    return [
+        {
+            "id": f"call_{i}",
+            "type": "function",
+            "function": {"name": "search", "arguments": json.dumps({"q": "x" * 40000})},
+        }
+        for i in range(2)
+    ]
+
+
+def _row(store, message_id, role, content, tool_call_id=None, attachments=None):
+    fields = store.offload_fields(message_id, {"content": content, "reasoning": None})
+    return SimpleNamespace(
+        role=role,
+        content=fields["content"],
+        tool_call_id=tool_call_id,
+        attachments=attachments,
+        blob_refs=fields.get("blob_refs"),
+    )
+
+
+@pytest.fixture
+def rows(monkeypatch):
+    storage = FakeStorage()
+    writer = MessageBlobStore(storage)
+    rows = [
+        _row(writer, "msg_1", "user", "y" * 70000, attachments=[{"type": "image", "file_id": "f"}]),
+        _row(writer, "msg_2", "assistant", json.dumps(_tool_calls())),
+        _row(writer, "msg_3", "tool", "z" * 70000, tool_call_id="call_0"),
+        _row(writer, "msg_4", "assistant", "short reply"),
+    ]
+    assert all(row.blob_refs for row in rows[:3])
+    # Readers start with a cold cache, so every blob is fetched from storage.
+    monkeypatch.setattr(
+        message_service, "get_message_blob_store", lambda: MessageBlobStore(storage)
+    )
+    return rows
+
+
+def test_deferred_resolution_matches_inline_resolution(rows):
+    svc = MessageService()
+    inline = [svc._format_message_row(r, include_attachments=True) for r in rows]
+    parked = [
+        svc._format_message_row(r, include_attachments=True, resolve_blobs=False) for r in rows
+    ]
+    deferred = svc._resolve_deferred_blobs(parked)
+
+    assert deferred == inline
+    assert deferred[1] == {"role": "assistant", "content": None, "tool_calls": _tool_calls()}
+    assert deferred[0]["attachments"] == [{"type": "image", "file_id": "f"}]
+    assert deferred[2]["tool_call_id"] == "call_0"
+
+
+def test_parked_rows_are_not_formatted_from_the_stub(rows):
+    parked = MessageService()._format_message_row(
+        rows[1], include_attachments=True, resolve_blobs=False
+    )
+    assert "tool_calls" not in parked
+    assert parked[message_service._BLOB_REF_KEY]["role"] == "assistant"
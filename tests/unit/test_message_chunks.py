@@ -0,0 +1,76 @@
+# tests/unit/test_message_chunks.py
+import threading
+import time
+
+from src.api.entities_api.services import message_service
+from src.api.entities_api.services.message_service import MessageService
+
+
+class SlowPopDict(dict):
+    """Widens the window between a finalization's append and its pop."""
+
+    def pop(self, *args):
+        time.sleep(0.05)
+        return super().pop(*args)
+
+
+class FakeSession:
+    saved = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def add(self, message):
+        self.saved.append(message)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def refresh(self, message):
+        pass
+
+
+def _saved_contents(monkeypatch, calls):
+    FakeSession.saved = []
+    monkeypatch.setattr(message_service, "SessionLocal", FakeSession)
+    monkeypatch.setattr(MessageService, "_offload", staticmethod(lambda db_message: None))
+    monkeypatch.setattr(MessageService, "_prepare_for_read", lambda self, m: m)
+    monkeypatch.setattr(
+        message_service.validator.MessageRead, "model_validate", staticmethod(lambda m: m)
+    )
+    svc = MessageService()
+    for content, last in calls:
+        svc.save_assistant_message_chunk("thread_1", content, "assistant", "asst_1", "asst_1", last)
+    return svc, [m.content for m in FakeSession.saved]
+
+
+def test_chunks_are_joined_on_the_last_chunk(monkeypatch):
+    svc, saved = _saved_contents(monkeypatch, [("Hel", False), ("lo", False), ("!", True)])
+    assert saved == ["Hello!"]
+    assert svc.message_chunks == {}
+
+
+def test_concurrent_finalizations_keep_their_own_text(monkeypatch):
+    svc, _ = _saved_contents(monkeypatch, [])
+    svc.message_chunks = SlowPopDict()
+    barrier = threading.Barrier(8)
+
+    def finalize(i):
+        barrier.wait()
+        svc.save_assistant_message_chunk(
+            "thread_1", f"reply {i}", "assistant", "asst_1", "asst_1", True
+        )
+
+    threads = [threading.Thread(target=finalize, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(m.content for m in FakeSession.saved) == sorted(f"reply {i}" for i in range(8))
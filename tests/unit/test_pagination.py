@@ -0,0 +1,67 @@
+# tests/unit/test_pagination.py
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import BigInteger, Column, String, create_engine
+from sqlalchemy.orm import Session, declarative_base
+
+from src.api.entities_api.db.pagination import keyset_page
+
+Base = declarative_base()
+
+
+class Item(Base):
+    __tablename__ = "items"
+
+    id = Column(String(16), primary_key=True)
+    owner = Column(String(16))
+    created_at = Column(BigInteger)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        # Two rows share a timestamp so the id tie-break is exercised.
+        created = {"a": 1, "b": 2, "c": 2, "d": 3, "e": 4}
+        session.add_all(Item(id=i, owner="u1", created_at=ts) for i, ts in created.items())
+        session.add(Item(id="z", owner="u2", created_at=0))
+        session.commit()
+        yield session
+
+
+def _page(session, **kwargs):
+    query = session.query(Item).filter(Item.owner == "u1")
+    rows, has_more = keyset_page(query, Item, **kwargs)
+    return [row.id for row in rows], has_more
+
+
+def test_first_page_ascending(session):
+    assert _page(session, limit=2) == (["a", "b"], True)
+
+
+def test_after_walks_forward_through_ties(session):
+    assert _page(session, limit=2, after="b") == (["c", "d"], True)
+    assert _page(session, limit=2, after="d") == (["e"], False)
+
+
+def test_descending(session):
+    assert _page(session, limit=2, order="desc") == (["e", "d"], True)
+    assert _page(session, limit=2, order="desc", after="d") == (["c", "b"], True)
+
+
+def test_before_returns_the_preceding_page_in_requested_order(session):
+    assert _page(session, limit=2, before="d") == (["b", "c"], True)
+    assert _page(session, limit=2, before="b") == (["a"], False)
+    assert _page(session, limit=2, order="desc", before="b") == (["d", "c"], True)
+
+
+def test_after_and_before_bound_a_window(session):
+    assert _page(session, limit=10, after="a", before="e") == (["b", "c", "d"], False)
+
+
+@pytest.mark.parametrize("cursor", ["missing", "z"])  # z belongs to another owner
+def test_unknown_cursor_is_rejected(session, cursor):
+    with pytest.raises(HTTPException) as exc:
+        _page(session, limit=2, after=cursor)
+    assert exc.value.status_code == 400
@@ -0,0 +1,59 @@
+# tests/unit/test_range_requests.py
+import pytest
+from fastapi import HTTPException
+
+from src.api.entities_api.utils.range_requests import etag_matches, parse_range
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("bytes=0-99", (0, 99)),
+        ("bytes=100-", (100, 999)),
+        ("bytes=500-5000", (500, 999)),  # end clamped to the last byte
+        ("bytes=-100", (900, 999)),  # suffix range
+        ("bytes=-5000", (0, 999)),  # suffix longer than the file
+        ("BYTES = 0-0", (0, 0)),
+    ],
+)
+def test_parse_range_satisfiable(header, expected):
+    assert parse_range(header, 1000) == expected
+
+
+@pytest.mark.parametrize(
+    "header",
+    [
+        "bytes=0-1,5-9",  # multi-range: serve the whole file
+        "items=0-9",
+        "bytes=9-0",
+        "bytes=-",
+        "bytes=abc",
+        "bytes=--5",
+        "bytes=1--5",
+    ],
+)
+def test_parse_range_ignored(header):
+    assert parse_range(header, 1000) is None
+
+
+@pytest.mark.parametrize("header", ["bytes=1000-", "bytes=2000-3000", "bytes=-0"])
+def test_parse_range_unsatisfiable(header):
+    with pytest.raises(HTTPException) as exc:
+        parse_range(header, 1000)
+    assert exc.value.status_code == 416
+    assert exc.value.headers["Content-Range"] == "bytes */1000"
+
+
+@pytest.mark.parametrize("header", ["bytes=0-", "bytes=-1"])
+def test_parse_range_empty_file(header):
+    with pytest.raises(HTTPException) as exc:
+        parse_range(header, 0)
+    assert exc.value.headers["Content-Range"] == "bytes */0"
+
+
+def test_etag_matches():
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('W/"abc"', '"abc"')
+    assert etag_matches('"x", "abc"', '"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches('"abd"', '"abc"')
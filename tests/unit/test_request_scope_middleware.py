@@ -0,0 +1,58 @@
+# tests/unit/test_request_scope_middleware.py
+import asyncio
+
+from sqlalchemy import create_engine, text
+
+from src.api.entities_api.db import replicas
+from src.api.entities_api.middleware import RequestScopeMiddleware
+from src.api.entities_api.observability import sql_instrumentation
+from src.api.entities_api.observability.sql_instrumentation import (
+    EngineSQLConfig, instrument_engine, query_scope)
+
+
+def _call(scope_type="http", headers=()):
+    seen = {}
+
+    async def app(scope, receive, send):
+        # The body is sent inside the app call: scopes must still be open.
+        await send({"type": "http.response.body", "body": b""})
+        seen["stats"] = sql_instrumentation._current_stats.get()
+        seen["pinned"] = replicas._pinned.get()
+
+    async def receive():
+        return {"type": "http.request"}
+
+    async def send(message):
+        pass
+
+    scope = {"type": scope_type, "headers": list(headers)}
+    asyncio.run(RequestScopeMiddleware(app)(scope, receive, send))
+    return seen
+
+
+def test_http_requests_get_a_query_scope_on_replica_reads():
+    seen = _call()
+    assert seen["stats"].scope == "http"
+    assert seen["pinned"] is False
+
+
+def test_strong_read_consistency_pins_the_primary():
+    seen = _call(headers=[(b"x-read-consistency", b"Strong")])
+    assert seen["pinned"] is True
+
+
+def test_non_http_scopes_pass_through():
+    seen = _call(scope_type="websocket", headers=[(b"x-read-consistency", b"strong")])
+    assert seen["stats"] is None
+    assert seen["pinned"] is False
+
+
+def test_instrument_engine_is_idempotent():
+    engine = create_engine("sqlite://")
+    config = EngineSQLConfig.from_env("TEST_DB_")
+    instrument_engine(engine, "test", config)
+    instrument_engine(engine, "test", config)
+
+    with query_scope("test") as stats, engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    assert stats.count == 1
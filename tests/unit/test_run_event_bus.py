@@ -0,0 +1,75 @@
+# tests/unit/test_run_event_bus.py
+import asyncio
+
+import fakeredis
+import pytest
+
+from src.api.entities_api.cache.run_event_bus import (RUN_STATUS_EVENT,
+                                                      RunEventBus)
+
+
+async def _next_event(events):
+    """The next envelope, skipping idle ticks."""
+    for _ in range(20):
+        event = await events.__anext__()
+        if event is not None:
+            return event
+    raise AssertionError("no event received")
+
+
+def test_subscriber_receives_async_and_sync_publishes():
+    server = fakeredis.FakeServer()
+
+    async def scenario():
+        bus = RunEventBus(fakeredis.FakeAsyncRedis(server=server))
+        sync_bus = RunEventBus(fakeredis.FakeRedis(server=server))
+        events = bus.subscribe("run_1", idle_timeout=0.05)
+
+        assert await events.__anext__() is None  # subscription is live
+        await bus.publish(RUN_STATUS_EVENT, "run_1", status="in_progress", action_id=None)
+        sync_bus.publish_sync(RUN_STATUS_EVENT, "run_1", status="completed")
+        await bus.publish(RUN_STATUS_EVENT, "run_2", status="failed")  # other run
+
+        received = [await _next_event(events), await _next_event(events)]
+        idle = await events.__anext__()
+        await events.aclose()
+        return received, idle
+
+    received, idle = asyncio.run(scenario())
+    assert [(e["event"], e["run_id"], e["status"]) for e in received] == [
+        (RUN_STATUS_EVENT, "run_1", "in_progress"),
+        (RUN_STATUS_EVENT, "run_1", "completed"),
+    ]
+    assert "action_id" not in received[0]  # None fields are dropped
+    assert idle is None
+
+
+def test_malformed_events_are_skipped():
+    async def scenario():
+        redis = fakeredis.FakeAsyncRedis()
+        bus = RunEventBus(redis)
+        events = bus.subscribe("run_1", idle_timeout=0.05)
+        await events.__anext__()
+        await redis.publish(bus._channel("run_1"), "not json")
+        await bus.publish(RUN_STATUS_EVENT, "run_1", status="completed")
+        event = await _next_event(events)
+        await events.aclose()
+        return event
+
+    assert asyncio.run(scenario())["status"] == "completed"
+
+
+def test_publish_never_raises():
+    class BrokenRedis:
+        def publish(self, channel, data):
+            raise ConnectionError("redis down")
+
+    RunEventBus(BrokenRedis()).publish_sync(RUN_STATUS_EVENT, "run_1", status="completed")
+
+
+def test_subscribe_requires_an_async_client():
+    async def scenario():
+        await RunEventBus(fakeredis.FakeRedis()).subscribe("run_1").__anext__()
+
+    with pytest.raises(TypeError):
+        asyncio.run(scenario())
@@ -0,0 +1,113 @@
+# tests/unit/test_run_queue.py
+import asyncio
+
+import fakeredis
+import pytest
+
+from src.api.entities_api.cache import run_queue
+from src.api.entities_api.cache.run_queue import (RUN_OUTPUT_DONE,
+                                                  RUN_QUEUE_GROUP,
+                                                  RUN_QUEUE_STREAM, RunJob,
+                                                  RunQueue)
+
+
+def _job(run_id="run_1"):
+    return RunJob(run_id=run_id, thread_id="thread_1", assistant_id="asst_1", model="m")
+
+
+def test_read_and_ack_removes_the_job():
+    async def scenario():
+        queue = RunQueue(fakeredis.FakeAsyncRedis())
+        await queue.enqueue(_job())
+        jobs = await queue.read("worker_1", count=10, block_ms=10)
+        entry_id, job = jobs[0]
+        pending_before = (await queue.redis.xpending(RUN_QUEUE_STREAM, RUN_QUEUE_GROUP))["pending"]
+        await queue.ack(entry_id)
+        pending = await queue.redis.xpending(RUN_QUEUE_STREAM, RUN_QUEUE_GROUP)
+        return (
+            jobs,
+            job,
+            pending_before,
+            pending["pending"],
+            await queue.redis.xlen(RUN_QUEUE_STREAM),
+        )
+
+    jobs, job, pending_before, pending, length = asyncio.run(scenario())
+    assert len(jobs) == 1
+    assert job.run_id == "run_1"
+    assert job.enqueued_at > 0
+    assert pending_before == 1
+    assert pending == 0
+    assert length == 0  # the entry carries an API key and must not linger
+
+
+def test_unacked_jobs_are_claimed_by_another_worker(monkeypatch):
+    monkeypatch.setattr(run_queue, "RUN_QUEUE_CLAIM_IDLE_MS", 0)
+
+    async def scenario():
+        queue = RunQueue(fakeredis.FakeAsyncRedis())
+        await queue.enqueue(_job())
+        await queue.read("worker_1", count=10, block_ms=10)  # worker_1 dies here
+        claimed = await queue.claim_orphans("worker_2", count=10)
+        consumers = await queue.redis.xinfo_consumers(RUN_QUEUE_STREAM, RUN_QUEUE_GROUP)
+        return claimed, {c["name"]: c["pending"] for c in consumers}
+
+    claimed, pending = asyncio.run(scenario())
+    assert [job.run_id for _, job in claimed] == ["run_1"]
+    assert pending[b"worker_2"] == 1
+
+
+def test_fresh_jobs_are_not_claimed():
+    async def scenario():
+        queue = RunQueue(fakeredis.FakeAsyncRedis())
+        await queue.enqueue(_job())
+        await queue.read("worker_1", count=10, block_ms=10)
+        return await queue.claim_orphans("worker_2", count=10)
+
+    assert asyncio.run(scenario()) == []
+
+
+def test_malformed_jobs_are_acked_and_dropped():
+    async def scenario():
+        queue = RunQueue(fakeredis.FakeAsyncRedis())
+        await queue.ensure_group()
+        await queue.redis.xadd(RUN_QUEUE_STREAM, {"job": "not json"})
+        jobs = await queue.read("worker_1", count=10, block_ms=10)
+        return jobs, await queue.redis.xlen(RUN_QUEUE_STREAM)
+
+    assert asyncio.run(scenario()) == ([], 0)
+
+
+def test_attach_replays_output_until_done():
+    async def scenario():
+        queue = RunQueue(fakeredis.FakeAsyncRedis())
+        key = queue.output_key("run_1")
+        first = await queue.redis.xadd(key, {"data": "a"})
+        await queue.redis.xadd(key, {"data": "b"})
+        await queue.redis.xadd(key, {"data": RUN_OUTPUT_DONE})
+        await queue.redis.xadd(key, {"data": "after done"})
+        return [data async for _, data in queue.attach("run_1", last_id=first.decode())]
+
+    assert asyncio.run(scenario()) == ["b", RUN_OUTPUT_DONE]
+
+
+def test_job_round_trips_through_stream_fields():
+    job = _job()
+    job.api_key = "sk-test"
+    assert RunJob.from_fields({b"job": job.to_fields()["job"].encode()}) == job
+
+
+@pytest.mark.parametrize("fields", [{}, {"job": "{}"}])
+def test_incomplete_job_fields_raise(fields):
+    with pytest.raises(Exception):
+        RunJob.from_fields(fields)
+
+
+def test_has_output():
+    async def scenario():
+        queue = RunQueue(fakeredis.FakeAsyncRedis())
+        before = await queue.has_output("run_1")
+        await queue.redis.xadd(queue.output_key("run_1"), {"data": "a"})
+        return before, await queue.has_output("run_1")
+
+    assert asyncio.run(scenario()) == (False, True)
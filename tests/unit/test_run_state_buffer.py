@@ -0,0 +1,50 @@
+# tests/unit/test_run_state_buffer.py
+import asyncio
+
+import fakeredis
+
+from src.api.entities_api.cache.run_state_buffer import RunStateBuffer
+
+
+class FakeRunService:
+    def __init__(self):
+        self.applied = []
+
+    async def apply_run_state_async(self, run_id, status=None, **fields):
+        self.applied.append((run_id, status, fields))
+
+
+def _buffer():
+    buffer = RunStateBuffer(fakeredis.FakeAsyncRedis())
+    buffer._run_svc = FakeRunService()
+    return buffer
+
+
+def test_buffered_fields_wait_for_flush():
+    async def scenario():
+        buffer = _buffer()
+        flushed = await buffer.stage("run_1", current_turn=2)
+        applied_before = list(buffer.run_svc.applied)
+        await buffer.flush("run_1")
+        buffer._flusher.cancel()
+        keys = await buffer.redis.keys("*")
+        return flushed, applied_before, buffer.run_svc.applied, keys
+
+    flushed, applied_before, applied, keys = asyncio.run(scenario())
+    assert flushed is False
+    assert applied_before == []
+    assert applied == [("run_1", None, {"current_turn": 2})]
+    assert keys == []
+
+
+def test_status_flushes_through_with_buffered_fields():
+    async def scenario():
+        buffer = _buffer()
+        await buffer.stage("run_1", current_turn=3)
+        buffer._flusher.cancel()
+        flushed = await buffer.stage("run_1", status="completed")
+        return flushed, buffer.run_svc.applied
+
+    flushed, applied = asyncio.run(scenario())
+    assert flushed is True
+    assert applied == [("run_1", "completed", {"current_turn": 3})]
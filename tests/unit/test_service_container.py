@@ -0,0 +1,45 @@
+# tests/unit/test_service_container.py
+from src.api.entities_api.services.service_container import ServiceContainer
+
+
+class _Owner:
+    pass
+
+
+def test_singleton_builds_once():
+    container = ServiceContainer()
+    calls = []
+    first = container.singleton("k", lambda: calls.append(1) or object())
+    second = container.singleton("k", lambda: calls.append(1) or object())
+    assert first is second
+    assert len(calls) == 1
+
+
+def test_bounded_evicts_least_recently_used():
+    container = ServiceContainer(max_clients=2)
+    a = container.bounded("a", object)
+    container.bounded("b", object)
+    assert container.bounded("a", object) is a  # refreshes "a"
+    container.bounded("c", object)  # evicts "b"
+
+    assert container.stats()["bounded"] == 2
+    assert container.bounded("a", object) is a
+    rebuilt = []
+    container.bounded("b", lambda: rebuilt.append(1) or object())
+    assert rebuilt == [1]
+
+
+def test_per_run_scope_dies_with_owner():
+    container = ServiceContainer()
+    owner = _Owner()
+    service = container.per_run(owner, "svc", object)
+    assert container.per_run(owner, "svc", object) is service
+    del owner
+    assert container.stats()["runs"] == 0
+
+
+def test_invalidate_drops_bounded_entry():
+    container = ServiceContainer()
+    first = container.bounded("k", object)
+    container.invalidate("k")
+    assert container.bounded("k", object) is not first
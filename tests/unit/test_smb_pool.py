@@ -0,0 +1,136 @@
+# tests/unit/test_smb_pool.py
+import itertools
+
+import pytest
+from smb.smb_structs import OperationFailure
+
+from src.api.entities_api.utils import smb_pool
+from src.api.entities_api.utils.smb_pool import (SMBConnectionPool,
+                                                 SMBPoolExhausted)
+
+
+class FakeConnection:
+    def __init__(self, number):
+        self.number = number
+        self.closed = False
+        self.alive = True
+
+    def echo(self, data, timeout=None):
+        if not self.alive:
+            raise ConnectionError("no echo")
+        return data
+
+    def close(self):
+        self.closed = True
+
+
+def _pool(max_size=2):
+    pool = SMBConnectionPool("smb", "user", "secret", max_size=max_size, retry_delay=0)
+    numbers = itertools.count(1)
+    pool.opened = []
+
+    def connect():
+        conn = FakeConnection(next(numbers))
+        pool.opened.append(conn)
+        return conn
+
+    pool._connect = connect
+    return pool
+
+
+def test_connections_are_reused():
+    pool = _pool()
+    assert pool.run(lambda conn: conn.number) == 1
+    assert pool.run(lambda conn: conn.number) == 1
+    assert pool.stats()["size"] == 1
+
+
+def test_connection_failure_retries_once_on_a_fresh_connection():
+    pool = _pool()
+    seen = []
+
+    def op(conn):
+        seen.append(conn.number)
+        if conn.number == 1:
+            raise ConnectionResetError("broken pipe")
+        return "ok"
+
+    assert pool.run(op) == "ok"
+    assert seen == [1, 2]
+    assert pool.opened[0].closed
+    assert pool.stats() == {"server": "smb", "size": 1, "idle": 1, "max_size": 2}
+
+
+def test_retry_false_does_not_repeat_the_operation():
+    pool = _pool()
+    calls = []
+
+    def op(conn):
+        calls.append(conn.number)
+        raise ConnectionResetError("broken pipe")
+
+    with pytest.raises(ConnectionResetError):
+        pool.run(op, retry=False)
+    assert calls == [1]
+    assert pool.stats()["size"] == 0
+
+
+def test_operation_failure_keeps_the_connection():
+    pool = _pool()
+
+    def op(conn):
+        raise OperationFailure("no such file", [])
+
+    with pytest.raises(OperationFailure):
+        pool.run(op)
+    assert len(pool.opened) == 1
+    assert not pool.opened[0].closed
+    assert pool.stats()["idle"] == 1
+
+
+def test_dead_idle_connection_is_replaced(monkeypatch):
+    monkeypatch.setattr(smb_pool, "SMB_POOL_HEALTHCHECK_SECONDS", 0)
+    pool = _pool()
+    pool.run(lambda conn: None)
+    pool.opened[0].alive = False
+
+    assert pool.run(lambda conn: conn.number) == 2
+    assert pool.opened[0].closed
+    assert pool.stats()["size"] == 1
+
+
+def test_idle_connections_past_the_limit_are_evicted(monkeypatch):
+    pool = _pool()
+    pool.run(lambda conn: None)
+    monkeypatch.setattr(smb_pool, "SMB_POOL_IDLE_SECONDS", -1)
+
+    assert pool.run(lambda conn: conn.number) == 2
+    assert pool.opened[0].closed
+
+
+def test_checkout_times_out_when_every_connection_is_busy(monkeypatch):
+    monkeypatch.setattr(smb_pool, "SMB_POOL_ACQUIRE_TIMEOUT", 0.05)
+    pool = _pool(max_size=1)
+    with pool.connection():
+        with pytest.raises(SMBPoolExhausted):
+            pool.run(lambda conn: None)
+    assert pool.stats()["idle"] == 1
+
+
+def test_failed_connect_fails_fast_until_the_retry_window_passes():
+    pool = SMBConnectionPool("smb", "user", "secret", connect_retries=2, retry_delay=0)
+    attempts = []
+
+    def connect():
+        attempts.append(1)
+        raise OSError("unreachable")
+
+    pool._connect = connect
+    with pytest.raises(ConnectionError):
+        pool.run(lambda conn: None, retry=False)
+    assert len(attempts) == 2
+
+    with pytest.raises(ConnectionError, match="retrying later"):
+        pool.run(lambda conn: None, retry=False)
+    assert len(attempts) == 2
+    assert pool.stats()["size"] == 0
@@ -0,0 +1,22 @@
+# tests/unit/test_sql_fingerprint.py
+from src.api.entities_api.observability.sql_instrumentation import fingerprint
+
+
+def test_literals_and_params_collapse():
+    assert fingerprint("SELECT * FROM runs WHERE id = 'run_1' AND created_at > 1700000000") == (
+        "SELECT * FROM runs WHERE id = ? AND created_at > ?"
+    )
+    assert fingerprint("SELECT * FROM runs WHERE id = %(id_1)s LIMIT %s") == (
+        "SELECT * FROM runs WHERE id = ? LIMIT ?"
+    )
+
+
+def test_in_lists_of_any_length_share_a_fingerprint():
+    short = fingerprint("SELECT * FROM messages WHERE id IN (%s)")
+    long = fingerprint("SELECT * FROM messages WHERE id IN (%s, %s,\n %s)")
+    assert short == long == "SELECT * FROM messages WHERE id IN (?+)"
+
+
+def test_whitespace_is_normalised_and_length_capped():
+    assert fingerprint("  SELECT\n\t1  ") == "SELECT ?"
+    assert len(fingerprint("SELECT " + "a, " * 500 + "b FROM t")) == 300
@@ -0,0 +1,71 @@
+# tests/unit/test_stream_shunt.py
+import asyncio
+import json
+
+import fakeredis
+
+from src.api.entities_api.cache import stream_shunt
+from src.api.entities_api.cache.stream_shunt import (StreamShuntWriter,
+                                                     redis_safe_chunk)
+
+
+def test_redis_safe_chunk():
+    assert redis_safe_chunk({"a": {"b": 1}, "c": None, "d": True, "e": 2}) == {
+        "a": json.dumps({"b": 1}),
+        "c": "",
+        "d": "True",
+        "e": 2,
+    }
+    assert redis_safe_chunk('{"type": "content"}') == {"type": "content"}
+    assert redis_safe_chunk("plain text") == {"content": "plain text"}
+    assert redis_safe_chunk(42) == {"content": "42"}
+
+
+def test_pushed_chunks_reach_the_stream_in_order_with_a_ttl(monkeypatch):
+    monkeypatch.setattr(stream_shunt, "SHUNT_MAX_BATCH", 3)
+
+    async def scenario():
+        redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+        writer = StreamShuntWriter(redis, "stream:run_1", ttl_seconds=60)
+        for i in range(10):
+            writer.push({"type": "content", "content": str(i)})
+        await writer.close()
+        entries = await redis.xrange("stream:run_1")
+        return entries, await redis.ttl("stream:run_1"), writer._task.done()
+
+    entries, ttl, stopped = asyncio.run(scenario())
+    assert [fields["content"] for _, fields in entries] == [str(i) for i in range(10)]
+    assert 0 < ttl <= 60
+    assert stopped
+
+
+def test_background_task_flushes_without_close(monkeypatch):
+    monkeypatch.setattr(stream_shunt, "SHUNT_FLUSH_INTERVAL", 0)
+
+    async def scenario():
+        redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+        writer = StreamShuntWriter(redis, "stream:run_1")
+        writer.push("hello")
+        for _ in range(50):
+            if await redis.xlen("stream:run_1"):
+                break
+            await asyncio.sleep(0.01)
+        entries = await redis.xrange("stream:run_1")
+        await writer.close()
+        return entries
+
+    assert [fields for _, fields in asyncio.run(scenario())] == [{"content": "hello"}]
+
+
+def test_write_failures_are_swallowed():
+    class BrokenRedis:
+        def pipeline(self, transaction=False):
+            raise ConnectionError("redis down")
+
+    async def scenario():
+        writer = StreamShuntWriter(BrokenRedis(), "stream:run_1")
+        writer.push("hello")
+        await writer.close()
+        return writer._buffer
+
+    assert asyncio.run(scenario()) == []
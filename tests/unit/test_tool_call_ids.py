@@ -0,0 +1,29 @@
+# tests/unit/test_tool_call_ids.py
+import json
+
+from src.api.entities_api.orchestration.mixins.json_utils_mixin import JsonUtilsMixin
+from src.api.entities_api.orchestration.mixins.tool_routing_mixin import ToolRoutingMixin
+
+
+class Router(ToolRoutingMixin, JsonUtilsMixin):
+    pass
+
+
+def _fc(call_id=None):
+    payload = {"name": "delegate_research_task", "arguments": {"task": "t"}}
+    if call_id:
+        payload["id"] = call_id
+    return f"<fc>{json.dumps(payload)}</fc>"
+
+
+def test_parsed_batch_has_unique_ids_before_it_is_stored():
+    router = Router()
+    body = _fc("call_a") + _fc("call_a") + _fc() + _fc("call_b")
+    batch = router.parse_and_set_function_calls(body, body)
+
+    ids = [fc["id"] for fc in batch]
+    assert len(set(ids)) == 4
+    assert ids[0] == "call_a" and ids[3] == "call_b"
+    # The stored batch is what both the assistant tool_calls message and
+    # the dispatcher read.
+    assert [fc["id"] for fc in router.get_function_call_state()] == ids
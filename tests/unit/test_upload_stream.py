@@ -0,0 +1,93 @@
+# tests/unit/test_upload_stream.py
+import hashlib
+import io
+
+import pytest
+
+from src.api.entities_api.utils.upload_stream import (HashingReader,
+                                                      UploadTooLarge,
+                                                      content_matches,
+                                                      sniff_mime)
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100
+
+
+class NonSeekable:
+    """Hands out at most `step` bytes per read, like a socket."""
+
+    def __init__(self, data: bytes, step: int = 7):
+        self._stream = io.BytesIO(data)
+        self._step = step
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0 or size > self._step:
+            size = self._step
+        return self._stream.read(size)
+
+    def seek(self, *args):
+        raise io.UnsupportedOperation("seek")
+
+
+def _drain(reader, chunk_size=10) -> bytes:
+    out = []
+    while True:
+        chunk = reader.read(chunk_size)
+        if not chunk:
+            return b"".join(out)
+        out.append(chunk)
+
+
+def test_reader_counts_hashes_and_sniffs_a_non_seekable_source():
+    reader = HashingReader(NonSeekable(PNG), max_bytes=1024)
+    assert reader.sniffed_mime == "image/png"
+    assert reader.size == 0  # sniffing does not count as consumption
+
+    assert _drain(reader) == PNG
+    assert reader.size == len(PNG)
+    assert reader.sha256 == hashlib.sha256(PNG).hexdigest()
+
+
+def test_read_all_includes_the_sniffed_head():
+    reader = HashingReader(io.BytesIO(b"%PDF-1.7 body"), max_bytes=1024)
+    assert reader.read() == b"%PDF-1.7 body"
+    assert reader.read() == b""
+
+
+def test_reader_aborts_past_the_limit():
+    reader = HashingReader(io.BytesIO(b"x" * 100), max_bytes=50)
+    with pytest.raises(UploadTooLarge) as exc:
+        _drain(reader)
+    assert exc.value.limit == 50
+
+
+def test_empty_source():
+    reader = HashingReader(io.BytesIO(b""), max_bytes=10)
+    assert reader.sniffed_mime is None
+    assert reader.read() == b""
+    assert reader.size == 0
+
+
+def test_sniff_mime():
+    assert sniff_mime(b"RIFF\x00\x00\x00\x00WEBPVP8 ") == "image/webp"
+    assert sniff_mime(b"\xff\xd8\xff\xe0") == "image/jpeg"
+    assert sniff_mime(b"hello") is None
+
+
+@pytest.mark.parametrize(
+    "declared, sniffed, expected",
+    [
+        ("image/png", "image/png", True),
+        ("image/png", "application/pdf", False),
+        ("image/webp", None, False),
+        (
+            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            "application/zip",
+            True,
+        ),
+        ("application/zip", None, False),
+        ("text/plain", "application/pdf", True),  # no signature to check
+        ("application/json", None, True),
+    ],
+)
+def test_content_matches(declared, sniffed, expected):
+    assert content_matches(declared, sniffed) is expected